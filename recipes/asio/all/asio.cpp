@@ -0,0 +1 @@
+#include <asio/impl/src.hpp>
@@ -1,5 +1,5 @@
 import os
-from conans import ConanFile, tools
+from conans import ConanFile, CMake, tools
 
 
 class Asio(ConanFile):
@@ -8,29 +8,91 @@ class Asio(ConanFile):
     homepage = "http://think-async.com/Asio"
     description = "Asio is a cross-platform C++ library for network and low-level I/O"
     topics = ("conan", "asio", "network", "io", "low-level")
-    settings = "os"
+    settings = "os", "compiler", "build_type", "arch"
+    options = {"separate_compilation": [True, False],
+               "shared": [True, False],
+               "fPIC": [True, False],
+               "reactor": ["default", "select"]}
+    default_options = {"separate_compilation": False,
+                       "shared": False,
+                       "fPIC": True,
+                       "reactor": "default"}
     license = "BSL-1.0"
+    exports_sources = ["CMakeLists.txt", "asio.cpp"]
+    generators = "cmake"
 
     no_copy_source = True
     _source_subfolder = "source_subfolder"
 
+    def config_options(self):
+        if self.settings.os == "Windows":
+            del self.options.fPIC
+
+    def configure(self):
+        if not self.options.separate_compilation:
+            del self.options.shared
+            del self.options.fPIC
+        elif self.options.shared:
+            del self.options.fPIC
+
     def source(self):
         tools.get(**self.conan_data["sources"][self.version])
         archive_name = "asio-" + self.version.replace(".", "-")
         extracted_name = "asio-" + archive_name
         os.rename(extracted_name, self._source_subfolder)
 
+    @property
+    def _include_dir(self):
+        return os.path.join(self._source_subfolder, self.name, "include")
+
+    @property
+    def _defines(self):
+        defines = ["ASIO_STANDALONE"]
+        if self.options.separate_compilation:
+            defines.append("ASIO_SEPARATE_COMPILATION")
+            if self.options.shared:
+                defines.append("ASIO_DYN_LINK")
+        if self.options.reactor == "select":
+            # the native demultiplexer is replaced by select() where asio would pick it by default
+            defines.append({"Linux": "ASIO_DISABLE_EPOLL",
+                            "Android": "ASIO_DISABLE_EPOLL",
+                            "Macos": "ASIO_DISABLE_KQUEUE",
+                            "iOS": "ASIO_DISABLE_KQUEUE",
+                            "FreeBSD": "ASIO_DISABLE_KQUEUE",
+                            "SunOS": "ASIO_DISABLE_DEV_POLL",
+                            "Windows": "ASIO_DISABLE_IOCP"}.get(str(self.settings.os)))
+        return [define for define in defines if define]
+
+    def _configure_cmake(self):
+        cmake = CMake(self)
+        cmake.definitions["ASIO_INCLUDE_DIR"] = os.path.join(self.source_folder, self._include_dir).replace("\\", "/")
+        cmake.definitions["ASIO_DEFINITIONS"] = ";".join(self._defines)
+        cmake.configure()
+        return cmake
+
+    def build(self):
+        if self.options.separate_compilation:
+            cmake = self._configure_cmake()
+            cmake.build()
+
     def package(self):
         root_dir = os.path.join(self._source_subfolder, self.name)
-        include_dir = os.path.join(root_dir, "include")
         self.copy(pattern="LICENSE_1_0.txt", dst="licenses", src=root_dir)
-        self.copy(pattern="*.hpp", dst="include", src=include_dir)
-        self.copy(pattern="*.ipp", dst="include", src=include_dir)
+        self.copy(pattern="*.hpp", dst="include", src=self._include_dir)
+        self.copy(pattern="*.ipp", dst="include", src=self._include_dir)
+        if self.options.separate_compilation:
+            cmake = self._configure_cmake()
+            cmake.install()
 
     def package_info(self):
-        self.cpp_info.defines.append('ASIO_STANDALONE')
+        self.cpp_info.defines = self._defines
+        if self.options.separate_compilation:
+            self.cpp_info.libs = ["asio"]
+            if self.settings.os == "Windows":
+                self.cpp_info.system_libs = ["ws2_32", "mswsock"]
         if str(self.settings.os) in ["Linux", "Android"]:
             self.cpp_info.libs.append('pthread')
 
     def package_id(self):
-        self.info.header_only()
+        if not self.options.separate_compilation:
+            self.info.header_only()
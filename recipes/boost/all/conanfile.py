@@ -31,6 +31,7 @@ class BoostConan(ConanFile):
     homepage = "https://www.boost.org"
     license = "BSL-1.0"
     topics = ("conan", "boost", "libraries", "cpp")
+    python_requires = "cci-timing/1.0"
     # The current python option requires the package to be built locally, to find default Python
     # implementation
     options = {
@@ -123,6 +124,9 @@ class BoostConan(ConanFile):
         exe = self.options.python_executable if self.options.python_executable else sys.executable
         return str(exe).replace('\\', '/')
 
+    def init(self):
+        self.python_requires["cci-timing"].module.instrument(self)
+
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
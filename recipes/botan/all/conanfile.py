@@ -3,6 +3,11 @@ from conans import ConanFile, tools
 from conans.errors import ConanException, ConanInvalidConfiguration
 from conans.model.version import Version
 
+try:
+    from cStringIO import StringIO
+except ImportError:
+    from io import StringIO
+
 
 class BotanConan(ConanFile):
     name = 'botan'
@@ -24,7 +29,23 @@ class BotanConan(ConanFile):
         'with_zlib': [True, False],
         'with_boost': [True, False],
         'enable_modules': "ANY",
-        'system_cert_bundle': "ANY"
+        'module_preset': [None, "performance"],
+        'system_cert_bundle': "ANY",
+        'cli': [True, False],
+        'with_sse2': [True, False],
+        'with_ssse3': [True, False],
+        'with_sse4_1': [True, False],
+        'with_sse4_2': [True, False],
+        'with_avx2': [True, False],
+        'with_bmi2': [True, False],
+        'with_rdrand': [True, False],
+        'with_rdseed': [True, False],
+        'with_aes_ni': [True, False],
+        'with_sha_ni': [True, False],
+        'with_altivec': [True, False],
+        'with_powercrypto': [True, False],
+        'with_neon': [True, False],
+        'with_armv8crypto': [True, False]
     }
     default_options = {'amalgamation': True,
                        'with_bzip2': False,
@@ -36,7 +57,23 @@ class BotanConan(ConanFile):
                        'with_zlib': False,
                        'with_boost': False,
                        'enable_modules': None,
-                       'system_cert_bundle': None}
+                       'module_preset': None,
+                       'system_cert_bundle': None,
+                       'cli': False,
+                       'with_sse2': True,
+                       'with_ssse3': True,
+                       'with_sse4_1': True,
+                       'with_sse4_2': True,
+                       'with_avx2': True,
+                       'with_bmi2': True,
+                       'with_rdrand': True,
+                       'with_rdseed': True,
+                       'with_aes_ni': True,
+                       'with_sha_ni': True,
+                       'with_altivec': True,
+                       'with_powercrypto': True,
+                       'with_neon': True,
+                       'with_armv8crypto': True}
 
     def configure(self):
         self._validate_compiler_settings()
@@ -74,6 +111,12 @@ class BotanConan(ConanFile):
         if Version(self.version) >= "2.14.0":
             del self.options.single_amalgamation
 
+        # ISA extensions are compiled in with the ones of the target arch only, and
+        # selected at runtime from the CPU features
+        for option, (archs, _) in self._isa_extensions.items():
+            if str(self.settings.arch) not in archs:
+                delattr(self.options, option)
+
     def source(self):
         tools.get(**self.conan_data["sources"][self.version])
         extracted_dir = "botan-" + self.version
@@ -85,6 +128,8 @@ class BotanConan(ConanFile):
                 for patch in self.conan_data["patches"][self.version]:
                     tools.patch(**patch)
         with tools.chdir('sources'):
+            if self.options.module_preset:
+                self._available_modules = self._list_modules()
             self.run(self._configure_cmd)
             self.run(self._make_cmd)
 
@@ -111,6 +156,11 @@ class BotanConan(ConanFile):
 
         self.cpp_info.includedirs = ['include/botan-2']
 
+        if self.options.cli:
+            bin_path = os.path.join(self.package_folder, "bin")
+            self.output.info("Appending PATH environment variable: {}".format(bin_path))
+            self.env_info.PATH.append(bin_path)
+
     def _validate_compiler_settings(self):
         compiler = self.settings.compiler
         version = Version(self.settings.compiler.version.value)
@@ -142,6 +192,48 @@ class BotanConan(ConanFile):
                 raise ConanInvalidConfiguration(
                     "amalgamation is not supported for {} {}".format(compiler, compiler_version))
 
+    @property
+    def _isa_extensions(self):
+        x86 = ["x86", "x86_64"]
+        ppc = ["ppc32be", "ppc32", "ppc64le", "ppc64"]
+        arm = ["armv7", "armv7hf", "armv7s", "armv7k", "armv8", "armv8_32", "armv8.3"]
+        return {"with_sse2": (x86, "sse2"),
+                "with_ssse3": (x86, "ssse3"),
+                "with_sse4_1": (x86, "sse4.1"),
+                "with_sse4_2": (x86, "sse4.2"),
+                "with_avx2": (x86, "avx2"),
+                "with_bmi2": (x86, "bmi2"),
+                "with_rdrand": (x86, "rdrand"),
+                "with_rdseed": (x86, "rdseed"),
+                "with_aes_ni": (x86, "aes-ni"),
+                "with_sha_ni": (x86, "sha-ni"),
+                "with_altivec": (ppc, "altivec"),
+                "with_powercrypto": (ppc, "powercrypto"),
+                "with_neon": (arm, "neon"),
+                "with_armv8crypto": (["armv8", "armv8.3"], "armv8crypto")}
+
+    @property
+    def _preset_modules(self):
+        # AES-GCM, ChaCha20Poly1305, SHA-2 and ECDSA/ECDH with all their hardware
+        # accelerated implementations. Module names changed between versions, only
+        # the ones available in this version are enabled
+        modules = {"performance": ["aes", "aes_ni", "aes_ssse3", "aes_vperm", "aes_armv8", "aes_power8",
+                                   "gcm", "clmul", "clmul_cpu", "clmul_ssse3", "pmull",
+                                   "chacha20poly1305", "chacha", "chacha_simd32", "chacha_avx2", "poly1305",
+                                   "sha2_32", "sha2_64", "sha2_32_x86", "sha2_32_armv8", "sha2_32_bmi2",
+                                   "sha2_64_bmi2", "ecdsa", "ecdh", "curve25519", "hmac", "hkdf",
+                                   "auto_rng", "system_rng", "hmac_drbg", "rdrand_rng", "processor_rng"]}
+        return [module for module in modules[str(self.options.module_preset)] if module in self._available_modules]
+
+    @property
+    def _python_call(self):
+        return 'python' if self.settings.os == 'Windows' else ''
+
+    def _list_modules(self):
+        output = StringIO()
+        self.run('{} ./configure.py --list-modules'.format(self._python_call), output=output)
+        return output.getvalue().split()
+
     @property
     def _is_mingw_windows(self):
         return self.settings.os == "Windows" and self.settings.compiler == "gcc"
@@ -205,9 +297,18 @@ class BotanConan(ConanFile):
             del os.environ["CXXFLAGS"]
             botan_extra_cxx_flags.append(environment_cxxflags)
 
+        enable_modules = []
         if self.options.enable_modules:
+            enable_modules.append(str(self.options.enable_modules))
+        if self.options.module_preset:
+            enable_modules.extend(self._preset_modules)
+        if enable_modules:
             build_flags.append('--minimized-build')
-            build_flags.append('--enable-modules={}'.format(self.options.enable_modules))
+            build_flags.append('--enable-modules={}'.format(",".join(enable_modules)))
+
+        for option, (_, extension) in self._isa_extensions.items():
+            if option in self.options and not self.options.get_safe(option):
+                build_flags.append('--disable-{}'.format(extension))
 
         if self.options.amalgamation:
             build_flags.append('--amalgamation')
@@ -245,6 +346,8 @@ class BotanConan(ConanFile):
             build_flags.append('--debug-mode')
 
         build_targets = ["shared"] if self.options.shared else ["static"]
+        if self.options.cli:
+            build_targets.append("cli")
 
         if self._is_mingw_windows:
             build_flags.append('--without-stack-protector')
@@ -254,8 +357,6 @@ class BotanConan(ConanFile):
 
         build_flags.append('--without-pkg-config')
 
-        call_python = 'python' if self.settings.os == 'Windows' else ''
-
         prefix = tools.unix_path(self.package_folder) if self._is_mingw_windows else self.package_folder
 
         botan_abi = ' '.join(botan_abi_flags) if botan_abi_flags else ' '
@@ -272,7 +373,7 @@ class BotanConan(ConanFile):
                          ' --prefix={prefix}'
                          ' --os={os}'
                          ' {build_flags}').format(
-                             python_call=call_python,
+                             python_call=self._python_call,
                              targets=",".join(build_targets),
                              abi=botan_abi,
                              cxxflags=botan_cxx_extras,
@@ -1,5 +1,5 @@
 import os
-from conans import ConanFile, CMake
+from conans import ConanFile, CMake, tools
 
 
 class TestPackageConan(ConanFile):
@@ -14,3 +14,8 @@ class TestPackageConan(ConanFile):
     def test(self):
         bin_path = os.path.join("bin", "test_package")
         self.run(bin_path, run_environment=True)
+        if self.options["botan"].cli and not tools.cross_building(self.settings):
+            # The CPU features detected at runtime select the accelerated implementations
+            self.run("botan cpuid", run_environment=True)
+            self.run("botan speed --msec=500 AES-128/GCM AES-256/GCM ChaCha20Poly1305 SHA-256 SHA-512 ECDSA",
+                     run_environment=True)
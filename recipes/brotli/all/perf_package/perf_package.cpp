@@ -0,0 +1,40 @@
+#include <benchmark/benchmark.h>
+#include <brotli/decode.h>
+#include <brotli/encode.h>
+#include "cci_perf.h"
+
+#include <cstdint>
+#include <string>
+#include <vector>
+
+static const std::string corpus = cci_perf::make_corpus(1 << 20);
+
+static void BM_compress(benchmark::State& state) {
+    const int quality = static_cast<int>(state.range(0));
+    std::vector<uint8_t> output(BrotliEncoderMaxCompressedSize(corpus.size()));
+    for (auto _ : state) {
+        size_t size = output.size();
+        BrotliEncoderCompress(quality, BROTLI_DEFAULT_WINDOW, BROTLI_MODE_TEXT, corpus.size(),
+                              reinterpret_cast<const uint8_t*>(corpus.data()), &size, output.data());
+        benchmark::DoNotOptimize(size);
+    }
+    state.SetBytesProcessed(static_cast<int64_t>(state.iterations()) * corpus.size());
+}
+BENCHMARK(BM_compress)->Arg(1)->Arg(5)->Arg(9);
+
+static void BM_decompress(benchmark::State& state) {
+    std::vector<uint8_t> compressed(BrotliEncoderMaxCompressedSize(corpus.size()));
+    size_t compressed_size = compressed.size();
+    BrotliEncoderCompress(static_cast<int>(state.range(0)), BROTLI_DEFAULT_WINDOW, BROTLI_MODE_TEXT, corpus.size(),
+                          reinterpret_cast<const uint8_t*>(corpus.data()), &compressed_size, compressed.data());
+    std::vector<uint8_t> output(corpus.size());
+    for (auto _ : state) {
+        size_t size = output.size();
+        BrotliDecoderDecompress(compressed_size, compressed.data(), &size, output.data());
+        benchmark::DoNotOptimize(size);
+    }
+    state.SetBytesProcessed(static_cast<int64_t>(state.iterations()) * corpus.size());
+}
+BENCHMARK(BM_decompress)->Arg(5)->Arg(11);
+
+BENCHMARK_MAIN();
@@ -20,6 +20,7 @@ class Bullet3Conan(ConanFile):
         "graphical_benchmark": [True, False],
         "double_precision": [True, False],
         "bt2_thread_locks": [True, False],
+        "multithreading": ["none", "openmp", "tbb"],
         "soft_body_multi_body_dynamics_world": [True, False],
         "network_support": [True, False],
         "extras": [True, False]
@@ -31,6 +32,7 @@ class Bullet3Conan(ConanFile):
         "graphical_benchmark": False,
         "double_precision": False,
         "bt2_thread_locks": False,
+        "multithreading": "none",
         "soft_body_multi_body_dynamics_world": False,
         "network_support": False,
         "extras": False
@@ -48,6 +50,20 @@ class Bullet3Conan(ConanFile):
             del self.options.fPIC
         if self.settings.compiler == "Visual Studio" and self.options.shared:
             raise ConanInvalidConfiguration("Shared libraries on Visual Studio not supported")
+        if self.options.multithreading == "openmp" and self.settings.compiler == "apple-clang":
+            raise ConanInvalidConfiguration("bullet3 adds -fopenmp, which apple-clang doesn't support. Use multithreading=tbb")
+        if self.options.multithreading == "tbb":
+            self.options["tbb"].tbbmalloc = True
+
+    def requirements(self):
+        if self.options.multithreading == "tbb":
+            self.requires("tbb/2020.1")
+        elif self.options.multithreading == "openmp" and self.settings.compiler == "clang":
+            self.requires("llvm-openmp/10.0.0")
+
+    @property
+    def _multithreading(self):
+        return self.options.bt2_thread_locks or self.options.multithreading != "none"
 
     def source(self):
         tools.get(**self.conan_data["sources"][self.version])
@@ -62,6 +78,16 @@ class Bullet3Conan(ConanFile):
         self._cmake.definitions["USE_GRAPHICAL_BENCHMARK"] = self.options.graphical_benchmark
         self._cmake.definitions["USE_DOUBLE_PRECISION"] = self.options.double_precision
         self._cmake.definitions["BULLET2_USE_THREAD_LOCKS"] = self.options.bt2_thread_locks
+        self._cmake.definitions["BULLET2_MULTITHREADING"] = self._multithreading
+        self._cmake.definitions["BULLET2_USE_OPEN_MP_MULTITHREADING"] = self.options.multithreading == "openmp"
+        self._cmake.definitions["BULLET2_USE_TBB_MULTITHREADING"] = self.options.multithreading == "tbb"
+        if self.options.multithreading == "tbb":
+            tbb = self.deps_cpp_info["tbb"]
+            self._cmake.definitions["BULLET2_TBB_INCLUDE_DIR"] = tbb.include_paths[0].replace("\\", "/")
+            self._cmake.definitions["BULLET2_TBB_LIB_DIR"] = tbb.lib_paths[0].replace("\\", "/")
+            # find_library() doesn't know about the _debug suffix of the tbb libraries
+            self._cmake.definitions["TBB_LIBRARY"] = next(lib for lib in tbb.libs if "malloc" not in lib)
+            self._cmake.definitions["TBBMALLOC_LIBRARY"] = next(lib for lib in tbb.libs if "malloc" in lib and "proxy" not in lib)
         self._cmake.definitions["USE_SOFT_BODY_MULTI_BODY_DYNAMICS_WORLD"] = self.options.soft_body_multi_body_dynamics_world
         self._cmake.definitions["BUILD_ENET"] = self.options.network_support
         self._cmake.definitions["BUILD_CLSOCKET"] = self.options.network_support
@@ -124,3 +150,10 @@ class Bullet3Conan(ConanFile):
         self.cpp_info.includedirs = ["include", os.path.join("include", "bullet")]
         if self.options.extras:
             self.cpp_info.includedirs.append(os.path.join("include", "bullet_robotics"))
+        if self._multithreading:
+            self.cpp_info.defines = ["BT_THREADSAFE=1"]
+            if self.settings.os == "Linux":
+                self.cpp_info.system_libs = ["pthread"]
+        if self.options.multithreading == "openmp" and not self.options.shared and self.settings.compiler == "gcc":
+            self.cpp_info.sharedlinkflags = ["-fopenmp"]
+            self.cpp_info.exelinkflags = ["-fopenmp"]
@@ -0,0 +1,92 @@
+#include <btBulletDynamicsCommon.h>
+#include <BulletCollision/CollisionDispatch/btCollisionDispatcherMt.h>
+#include <BulletDynamics/ConstraintSolver/btSequentialImpulseConstraintSolverMt.h>
+#include <BulletDynamics/Dynamics/btDiscreteDynamicsWorldMt.h>
+#include <LinearMath/btThreads.h>
+
+#include <chrono>
+#include <cstdio>
+#include <cstdlib>
+#include <vector>
+
+// Headless benchmark: a pile of boxes falling on a static ground, stepped with
+// btDiscreteDynamicsWorldMt at increasing thread counts.
+//
+//   benchmark [boxes per side] [steps]
+
+static btITaskScheduler* task_scheduler()
+{
+    if (btITaskScheduler* scheduler = btGetOpenMPTaskScheduler())
+        return scheduler;
+    if (btITaskScheduler* scheduler = btGetTBBTaskScheduler())
+        return scheduler;
+    if (btITaskScheduler* scheduler = btGetPPLTaskScheduler())
+        return scheduler;
+    return btGetSequentialTaskScheduler();
+}
+
+static double steps_per_second(int side, int steps)
+{
+    btDefaultCollisionConstructionInfo construction_info;
+    construction_info.m_defaultMaxPersistentManifoldPoolSize = 80000;
+    construction_info.m_defaultMaxCollisionAlgorithmPoolSize = 80000;
+    btDefaultCollisionConfiguration configuration(construction_info);
+    btCollisionDispatcherMt dispatcher(&configuration, 40);
+    btDbvtBroadphase broadphase;
+    btConstraintSolverPoolMt solver_pool(BT_MAX_THREAD_COUNT);
+    btSequentialImpulseConstraintSolverMt solver;
+    btDiscreteDynamicsWorldMt world(&dispatcher, &broadphase, &solver_pool, &solver, &configuration);
+    world.setGravity(btVector3(0, -10, 0));
+
+    btBoxShape ground_shape(btVector3(btScalar(side * 2), btScalar(1), btScalar(side * 2)));
+    btRigidBody ground(btRigidBody::btRigidBodyConstructionInfo(0, nullptr, &ground_shape));
+    ground.setWorldTransform(btTransform(btQuaternion::getIdentity(), btVector3(0, -1, 0)));
+    world.addRigidBody(&ground);
+
+    btBoxShape box_shape(btVector3(btScalar(0.5), btScalar(0.5), btScalar(0.5)));
+    btVector3 inertia;
+    box_shape.calculateLocalInertia(1, inertia);
+    std::vector<btDefaultMotionState> motion_states;
+    std::vector<btRigidBody*> boxes;
+    motion_states.reserve(side * side * side);
+    for (int x = 0; x < side; ++x)
+        for (int y = 0; y < side; ++y)
+            for (int z = 0; z < side; ++z) {
+                const btVector3 position(btScalar(x * 1.1 - side * 0.55), btScalar(y * 1.1 + 0.5), btScalar(z * 1.1 - side * 0.55));
+                motion_states.emplace_back(btTransform(btQuaternion::getIdentity(), position));
+                boxes.push_back(new btRigidBody(btRigidBody::btRigidBodyConstructionInfo(1, &motion_states.back(), &box_shape, inertia)));
+                world.addRigidBody(boxes.back());
+            }
+
+    world.stepSimulation(btScalar(1. / 60), 0, btScalar(1. / 60));  // warm up the pools
+    const auto start = std::chrono::steady_clock::now();
+    for (int i = 0; i < steps; ++i)
+        world.stepSimulation(btScalar(1. / 60), 0, btScalar(1. / 60));
+    const double elapsed = std::chrono::duration<double>(std::chrono::steady_clock::now() - start).count();
+
+    for (btRigidBody* box : boxes) {
+        world.removeRigidBody(box);
+        delete box;
+    }
+    world.removeRigidBody(&ground);
+    return steps / elapsed;
+}
+
+int main(int argc, char** argv)
+{
+    const int side = argc > 1 ? std::atoi(argv[1]) : 16;
+    const int steps = argc > 2 ? std::atoi(argv[2]) : 100;
+
+    btITaskScheduler* scheduler = task_scheduler();
+    btSetTaskScheduler(scheduler);
+    std::printf("%d rigid bodies, %s task scheduler\n", side * side * side, scheduler->getName());
+
+    const int max_threads = scheduler->getMaxNumThreads();
+    for (int threads = 1;; threads = threads * 2 < max_threads ? threads * 2 : max_threads) {
+        scheduler->setNumThreads(threads);
+        std::printf("%3d threads: %8.1f steps/s\n", threads, steps_per_second(side, steps));
+        if (threads == max_threads)
+            break;
+    }
+    return EXIT_SUCCESS;
+}
@@ -11,6 +11,7 @@ class CbloscConan(ConanFile):
     url = "https://github.com/conan-io/conan-center-index"
     exports_sources = ["CMakeLists.txt", "patches/**"]
     generators = "cmake"
+    python_requires = "cci-microarch/1.0"
     settings = "os", "arch", "compiler", "build_type"
     options = {
         "shared": [True, False],
@@ -39,6 +40,9 @@ class CbloscConan(ConanFile):
     def _build_subfolder(self):
         return "build_subfolder"
 
+    def init(self):
+        self.python_requires["cci-microarch"].module.init(self)
+
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
@@ -46,6 +50,7 @@ class CbloscConan(ConanFile):
     def configure(self):
         del self.settings.compiler.cppstd
         del self.settings.compiler.libcxx
+        self.python_requires["cci-microarch"].module.configure(self)
 
     def requirements(self):
         if self.options.with_lz4:
@@ -76,8 +81,15 @@ class CbloscConan(ConanFile):
         self._cmake.definitions["BUILD_SHARED"] = self.options.shared
         self._cmake.definitions["BUILD_TESTS"] = False
         self._cmake.definitions["BUILD_BENCHMARKS"] = False
-        self._cmake.definitions["DEACTIVATE_SSE2"] = False
-        self._cmake.definitions["DEACTIVATE_AVX2"] = False
+        # Without a microarch level, SSE2 and AVX2 shuffles are both built and selected at runtime
+        microarch = self.python_requires["cci-microarch"].module
+        if microarch.level(self):
+            self._cmake.definitions["DEACTIVATE_SSE2"] = "sse2" not in microarch.features(self)
+            self._cmake.definitions["DEACTIVATE_AVX2"] = "avx2" not in microarch.features(self)
+            microarch.apply_cmake(self, self._cmake)
+        else:
+            self._cmake.definitions["DEACTIVATE_SSE2"] = False
+            self._cmake.definitions["DEACTIVATE_AVX2"] = False
         self._cmake.definitions["DEACTIVATE_LZ4"] = not self.options.with_lz4
         self._cmake.definitions["DEACTIVATE_SNAPPY"] = not self.options.with_snappy
         self._cmake.definitions["DEACTIVATE_ZLIB"] = not self.options.with_zlib
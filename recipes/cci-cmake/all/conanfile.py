@@ -0,0 +1,74 @@
+import os
+from conans import ConanFile, CMake, tools
+from conans.errors import ConanException
+
+# Shared CMake setup for the recipes of this index.
+#
+# A recipe opts in with:
+#
+#     python_requires = "cci-cmake/1.0"
+#
+#     def build_requirements(self):
+#         self.python_requires["cci-cmake"].module.build_requirements(self)
+#
+#     def _configure_cmake(self):
+#         cmake = self.python_requires["cci-cmake"].module.cmake(self)
+#
+# The behaviour is driven from the build machine environment so that it never
+# changes the package ID:
+#
+#   CCI_CMAKE_NINJA              use the Ninja generator (default: True)
+#   CCI_CMAKE_COMPILER_LAUNCHER  compiler launcher, e.g. "ccache" or "sccache"
+#   CONAN_CPU_COUNT              number of parallel jobs (Conan's own variable)
+#
+# An explicit CONAN_CMAKE_GENERATOR always wins over CCI_CMAKE_NINJA.
+
+
+def _use_ninja():
+    if "CONAN_CMAKE_GENERATOR" in os.environ:
+        return os.environ["CONAN_CMAKE_GENERATOR"] == "Ninja"
+    return tools.get_env("CCI_CMAKE_NINJA", True)
+
+
+def _compiler_launcher():
+    launcher = tools.get_env("CCI_CMAKE_COMPILER_LAUNCHER")
+    if not launcher:
+        return None
+    launcher_path = tools.which(launcher)
+    if not launcher_path:
+        raise ConanException("CCI_CMAKE_COMPILER_LAUNCHER is set to '{}' but it can't be found in PATH".format(launcher))
+    return launcher_path.replace("\\", "/")
+
+
+def build_requirements(conanfile):
+    if _use_ninja() and "CONAN_CMAKE_GENERATOR" not in os.environ:
+        conanfile.build_requires("ninja/1.9.0")
+
+
+def cmake(conanfile, languages=("C", "CXX"), **kwargs):
+    if "generator" not in kwargs and _use_ninja():
+        kwargs["generator"] = "Ninja"
+    # CMake() passes -j<CONAN_CPU_COUNT> to both Makefiles and Ninja only when parallel is set
+    kwargs["parallel"] = True
+    cmake = CMake(conanfile, **kwargs)
+
+    launcher = _compiler_launcher()
+    if launcher:
+        if cmake.is_multi_configuration:
+            conanfile.output.warn("{} generator ignores compiler launchers, not using {}".format(cmake.generator, launcher))
+        else:
+            for language in languages:
+                cmake.definitions["CMAKE_{}_COMPILER_LAUNCHER".format(language)] = launcher
+    return cmake
+
+
+class CciCMakeConan(ConanFile):
+    name = "cci-cmake"
+    description = "Shared CMake build helper for conan-center-index recipes (Ninja, compiler launchers, parallel jobs)"
+    license = "MIT"
+    url = "https://github.com/conan-io/conan-center-index"
+    homepage = "https://github.com/conan-io/conan-center-index"
+    topics = ("conan", "cmake", "ninja", "ccache", "python_requires")
+
+    def package_id(self):
+        self.info.header_only()
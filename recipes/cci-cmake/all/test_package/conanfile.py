@@ -0,0 +1,21 @@
+import os
+from conans import ConanFile, tools
+
+
+class TestPackageConan(ConanFile):
+    settings = "os", "compiler", "build_type", "arch"
+    generators = "cmake"
+    python_requires = "cci-cmake/1.0"
+
+    def build_requirements(self):
+        self.python_requires["cci-cmake"].module.build_requirements(self)
+
+    def build(self):
+        cmake = self.python_requires["cci-cmake"].module.cmake(self)
+        cmake.configure()
+        cmake.build()
+
+    def test(self):
+        if not tools.cross_building(self.settings):
+            bin_path = os.path.join("bin", "test_package")
+            self.run(bin_path, run_environment=True)
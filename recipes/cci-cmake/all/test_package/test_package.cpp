@@ -0,0 +1,6 @@
+#include <iostream>
+
+int main() {
+    std::cout << "cci-cmake test_package" << std::endl;
+    return 0;
+}
@@ -0,0 +1,137 @@
+from conans import ConanFile, tools
+from conans.errors import ConanInvalidConfiguration
+
+# Shared microarchitecture level for the SIMD-sensitive recipes of this index.
+#
+# A recipe opts in with:
+#
+#     python_requires = "cci-microarch/1.0"
+#
+#     def init(self):
+#         self.python_requires["cci-microarch"].module.init(self)
+#
+#     def configure(self):
+#         self.python_requires["cci-microarch"].module.configure(self, {"with_avx": "avx", "with_sse4": "sse4.2"})
+#
+#     def _configure_cmake(self):
+#         ...
+#         self.python_requires["cci-microarch"].module.apply_cmake(self, cmake)
+#
+# init() adds a "microarch" option to the recipe, so the level is part of the package ID.
+# It is meant to be set once for all the packages of a profile:
+#
+#     [options]
+#     *:microarch=x86-64-v3
+#
+# When it is not set (None) the recipes keep their own defaults. When it is set:
+#
+#   - configure() derives the given native options of the recipe from the features of
+#     the level (e.g. with_avx=True for x86-64-v3, with_avx=False for x86-64-v2)
+#   - flags() / apply_cmake() return / add the -march (or /arch) compiler flags of the level
+#
+# The x86-64 levels are the ones of the x86-64 psABI, the armv8 ones are the -march names.
+
+_features = {
+    "x86_64": [
+        ("x86-64", ["sse", "sse2"]),
+        ("x86-64-v2", ["sse3", "ssse3", "sse4.1", "sse4.2", "popcnt", "cx16", "sahf"]),
+        ("x86-64-v3", ["avx", "avx2", "bmi", "bmi2", "f16c", "fma", "lzcnt", "movbe"]),
+        ("x86-64-v4", ["avx512f", "avx512bw", "avx512cd", "avx512dq", "avx512vl"]),
+    ],
+    "armv8": [
+        ("armv8-a", ["neon"]),
+        ("armv8.2-a", ["crc", "lse", "rdm"]),
+        ("armv8.4-a", ["dotprod"]),
+    ],
+}
+
+levels = [level for arch_levels in _features.values() for level, _ in arch_levels]
+
+
+def init(conanfile):
+    conanfile.options = dict(conanfile.options or {}, microarch=[None] + levels)
+    conanfile.default_options = dict(conanfile.default_options or {}, microarch=None)
+
+
+def level(conanfile):
+    """Returns the microarchitecture level of the package, None if not set."""
+    if "microarch" not in conanfile.options or not conanfile.options.microarch:
+        return None
+    return str(conanfile.options.microarch)
+
+
+def features(conanfile):
+    """Returns the set of instruction set extensions guaranteed by the level ("simd" for any of them)."""
+    microarch = level(conanfile)
+    result = set()
+    if microarch is None:
+        return result
+    for arch_level, arch_features in _features.get(str(conanfile.settings.arch), []):
+        result.update(arch_features)
+        result.add("simd")
+        if arch_level == microarch:
+            break
+    return result
+
+
+def configure(conanfile, native_options=None):
+    """Validates the level against the arch and derives native_options, a dict
+    {option: feature}, from it. Options removed by the recipe are skipped."""
+    arch = str(conanfile.settings.arch)
+    microarch = level(conanfile)
+    if microarch is None:
+        if arch not in _features:
+            del conanfile.options.microarch
+        return
+    if microarch not in [arch_level for arch_level, _ in _features.get(arch, [])]:
+        raise ConanInvalidConfiguration("microarch={} is not a level of arch={}".format(microarch, arch))
+
+    supported = features(conanfile)
+    for option, feature in (native_options or {}).items():
+        if option in conanfile.options:
+            setattr(conanfile.options, option, feature in supported)
+
+
+def flags(conanfile):
+    """Returns the compiler flags targeting the level."""
+    microarch = level(conanfile)
+    if microarch is None:
+        return []
+    compiler = str(conanfile.settings.compiler)
+    version = tools.Version(str(conanfile.settings.compiler.version))
+    if compiler == "Visual Studio":
+        return {"x86-64-v3": ["/arch:AVX2"], "x86-64-v4": ["/arch:AVX512"]}.get(microarch, [])
+    if not microarch.startswith("x86-64-v"):
+        return ["-march={}".format(microarch)]
+    # The x86-64-vN names are understood from GCC 11 and Clang 12 on
+    if (compiler == "gcc" and version >= "11") or (compiler == "clang" and version >= "12") or \
+            (compiler == "apple-clang" and version >= "13"):
+        return ["-march={}".format(microarch)]
+    result = ["-march=x86-64"]
+    for arch_level, arch_features in _features["x86_64"][1:]:
+        result.extend("-m{}".format(feature) for feature in arch_features)
+        if arch_level == microarch:
+            break
+    return result
+
+
+def apply_cmake(conanfile, cmake):
+    """Adds the flags() of the level to the C and C++ flags of a CMake build helper."""
+    level_flags = " ".join(flags(conanfile))
+    if not level_flags:
+        return
+    for variable in ("CMAKE_C_FLAGS", "CMAKE_CXX_FLAGS"):
+        current = cmake.definitions.get(variable)
+        cmake.definitions[variable] = "{} {}".format(current, level_flags) if current else level_flags
+
+
+class CciMicroarchConan(ConanFile):
+    name = "cci-microarch"
+    description = "Shared microarchitecture level (x86-64-v2/v3/v4, armv8.2-a...) for conan-center-index recipes"
+    license = "MIT"
+    url = "https://github.com/conan-io/conan-center-index"
+    homepage = "https://github.com/conan-io/conan-center-index"
+    topics = ("conan", "simd", "march", "microarchitecture", "python_requires")
+
+    def package_id(self):
+        self.info.header_only()
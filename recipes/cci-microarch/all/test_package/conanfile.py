@@ -0,0 +1,58 @@
+from conans import ConanFile
+from conans.errors import ConanInvalidConfiguration
+
+
+class _Values(object):
+    def __init__(self, **values):
+        self.__dict__.update(values)
+
+    def __contains__(self, name):
+        return name in self.__dict__
+
+
+class TestPackageConan(ConanFile):
+    python_requires = "cci-microarch/1.0"
+
+    def _conanfile(self, arch, microarch, compiler="gcc", version="9", **options):
+        settings = _Values(arch=arch, compiler=_Compiler(compiler, version))
+        return _Values(settings=settings, options=_Values(microarch=microarch, **options))
+
+    def test(self):
+        module = self.python_requires["cci-microarch"].module
+
+        conanfile = self._conanfile("x86_64", "x86-64-v2", with_sse4=False, with_avx=True)
+        module.configure(conanfile, {"with_sse4": "sse4.2", "with_avx": "avx", "with_neon": "neon"})
+        assert conanfile.options.with_sse4 is True and conanfile.options.with_avx is False
+        assert "neon" not in conanfile.options
+        assert module.flags(conanfile)[:3] == ["-march=x86-64", "-msse3", "-mssse3"]
+        assert "-mavx" not in module.flags(conanfile)
+
+        conanfile = self._conanfile("x86_64", "x86-64-v3", version="11")
+        assert module.flags(conanfile) == ["-march=x86-64-v3"]
+        assert {"simd", "sse2", "sse4.2", "avx2", "fma"} <= module.features(conanfile)
+        assert "avx512f" not in module.features(conanfile)
+
+        conanfile = self._conanfile("x86_64", "x86-64-v4", compiler="Visual Studio", version="16")
+        assert module.flags(conanfile) == ["/arch:AVX512"]
+
+        conanfile = self._conanfile("armv8", "armv8.2-a")
+        assert module.features(conanfile) == {"simd", "neon", "crc", "lse", "rdm"}
+        assert module.flags(conanfile) == ["-march=armv8.2-a"]
+
+        conanfile = self._conanfile("x86_64", None, with_avx=True)
+        module.configure(conanfile, {"with_avx": "avx"})
+        assert conanfile.options.with_avx is True
+        assert module.flags(conanfile) == [] and module.features(conanfile) == set()
+
+        try:
+            module.configure(self._conanfile("armv8", "x86-64-v3"))
+            raise AssertionError("x86-64-v3 accepted for armv8")
+        except ConanInvalidConfiguration:
+            pass
+
+
+class _Compiler(str):
+    def __new__(cls, name, version):
+        compiler = str.__new__(cls, name)
+        compiler.version = version
+        return compiler
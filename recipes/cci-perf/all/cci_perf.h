@@ -0,0 +1,48 @@
+// Inputs shared by the perf_package benchmarks, exported by the cci-perf helper.
+// They are deterministic, so that results can be compared with a baseline.
+#ifndef CCI_PERF_H
+#define CCI_PERF_H
+
+#include <cstddef>
+#include <cstdint>
+#include <string>
+
+namespace cci_perf {
+
+// Text of size bytes made of a few words, about as compressible as logs or source code
+inline std::string make_corpus(size_t size) {
+    static const char* const words[] = {"conan", "center", "index", "package", "recipe",
+                                        "compression", "benchmark", "library", "version", "0123456789"};
+    std::string corpus;
+    corpus.reserve(size + 16);
+    uint32_t seed = 42;
+    while (corpus.size() < size) {
+        seed = seed * 1664525u + 1013904223u;
+        corpus += words[(seed >> 16) % 10];
+        corpus += (seed & 0x100) ? '\n' : ' ';
+    }
+    corpus.resize(size);
+    return corpus;
+}
+
+// JSON array of records objects mixing integers, strings, doubles, booleans and arrays
+inline std::string make_json_document(size_t records) {
+    std::string document = "[";
+    uint32_t seed = 42;
+    for (size_t i = 0; i < records; ++i) {
+        seed = seed * 1664525u + 1013904223u;
+        if (i)
+            document += ",\n";
+        document += "  {\"id\": " + std::to_string(i) +
+                    ", \"name\": \"package_" + std::to_string(seed % 1000) + "\"" +
+                    ", \"score\": " + std::to_string((seed >> 8) % 100000 / 100.) +
+                    ", \"shared\": " + ((seed & 1) ? "true" : "false") +
+                    ", \"tags\": [\"conan\", \"center\", \"index\"]}";
+    }
+    document += "]";
+    return document;
+}
+
+}  // namespace cci_perf
+
+#endif
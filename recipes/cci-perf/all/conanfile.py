@@ -0,0 +1,127 @@
+import json
+import os
+from conans import ConanFile, CMake, tools
+from conans.errors import ConanException
+
+# Shared driver for the optional perf_package/ folder of the recipes of this index.
+#
+# perf_package/ sits next to test_package/ and contains google benchmark
+# microbenchmarks of the library, built against the package under test:
+#
+#     class PerfPackageConan(ConanFile):
+#         settings = "os", "compiler", "build_type", "arch"
+#         generators = "cmake"
+#         python_requires = "cci-perf/1.0"
+#
+#         def requirements(self):
+#             self.python_requires["cci-perf"].module.requirements(self)
+#
+#         def build(self):
+#             self.python_requires["cci-perf"].module.build(self)
+#
+#         def test(self):
+#             self.python_requires["cci-perf"].module.run(self, "zstd")
+#
+# and is run with: conan test recipes/zstd/all/perf_package zstd/1.4.4@
+#
+# The inputs shared by several libraries (text corpus, JSON document) come from the
+# cci_perf.h header exported with this helper. build() passes its folder as
+# CCI_PERF_INCLUDE_DIR:
+#
+#     include_directories(${CCI_PERF_INCLUDE_DIR})
+#
+#     #include "cci_perf.h"
+#     static const std::string corpus = cci_perf::make_corpus(1 << 20);
+#
+# The results are written as JSON to the build folder and, when CCI_PERF_BASELINES
+# points to a directory, compared with <CCI_PERF_BASELINES>/<name>.json:
+#
+#   CCI_PERF_BASELINES         directory of the baselines, one JSON file per library
+#   CCI_PERF_TOLERANCE         allowed slowdown of each benchmark (default: 0.10, i.e. 10%)
+#   CCI_PERF_REPETITIONS       repetitions of each benchmark, the median is compared (default: 5)
+#   CCI_PERF_UPDATE_BASELINE   store the results as the new baseline (default: False)
+#
+# A missing baseline is created from the current results.
+
+_time_unit_ns = {"ns": 1., "us": 1e3, "ms": 1e6, "s": 1e9}
+
+
+def requirements(conanfile):
+    conanfile.requires("benchmark/1.5.0")
+
+
+def build(conanfile):
+    cmake = CMake(conanfile)
+    cmake.definitions["CCI_PERF_INCLUDE_DIR"] = conanfile.python_requires["cci-perf"].path.replace("\\", "/")
+    cmake.configure()
+    cmake.build()
+
+
+def _medians(results):
+    medians = {}
+    for benchmark in results["benchmarks"]:
+        if benchmark.get("aggregate_name", "median") != "median":
+            continue
+        name = benchmark.get("run_name", benchmark["name"])
+        medians[name] = benchmark["cpu_time"] * _time_unit_ns[benchmark.get("time_unit", "ns")]
+    return medians
+
+
+def compare(baseline, results, tolerance):
+    """Returns the list of (benchmark, baseline_ns, current_ns) slower than the baseline by more than tolerance,
+    current_ns is None for the benchmarks of the baseline missing from the results."""
+    medians = _medians(results)
+    regressions = []
+    for name, reference in sorted(_medians(baseline).items()):
+        current = medians.get(name)
+        if current is None or current > reference * (1. + tolerance):
+            regressions.append((name, reference, current))
+    return regressions
+
+
+def run(conanfile, name, executable="perf_package"):
+    if tools.cross_building(conanfile.settings):
+        conanfile.output.warn("Cross building, not running the {} benchmarks".format(name))
+        return
+
+    results_file = os.path.join(conanfile.build_folder, "{}.json".format(name))
+    repetitions = tools.get_env("CCI_PERF_REPETITIONS", 5)
+    conanfile.run("{} --benchmark_out={} --benchmark_out_format=json --benchmark_repetitions={} "
+                  "--benchmark_report_aggregates_only=true".format(os.path.join("bin", executable), results_file, repetitions),
+                  run_environment=True)
+    conanfile.output.info("Benchmark results written to {}".format(results_file))
+
+    baselines = tools.get_env("CCI_PERF_BASELINES")
+    if not baselines:
+        return
+    results = json.loads(tools.load(results_file))
+    baseline_file = os.path.join(baselines, "{}.json".format(name))
+    if tools.get_env("CCI_PERF_UPDATE_BASELINE", False) or not os.path.isfile(baseline_file):
+        tools.save(baseline_file, json.dumps(results, indent=2))
+        conanfile.output.info("Baseline {} updated".format(baseline_file))
+        return
+
+    tolerance = tools.get_env("CCI_PERF_TOLERANCE", 0.10)
+    regressions = compare(json.loads(tools.load(baseline_file)), results, tolerance)
+    for benchmark, reference, current in regressions:
+        if current is None:
+            conanfile.output.error("{}: {:.0f} ns -> missing from the results".format(benchmark, reference))
+        else:
+            conanfile.output.error("{}: {:.0f} ns -> {:.0f} ns (+{:.1f}%)".format(benchmark, reference, current,
+                                                                              100. * (current / reference - 1.)))
+    if regressions:
+        raise ConanException("{} of the {} benchmarks are missing or more than {:.0f}% slower than {}".format(
+            len(regressions), name, 100. * tolerance, baseline_file))
+
+
+class CciPerfConan(ConanFile):
+    name = "cci-perf"
+    description = "Shared driver for the perf_package benchmarks of conan-center-index recipes"
+    license = "MIT"
+    url = "https://github.com/conan-io/conan-center-index"
+    homepage = "https://github.com/conan-io/conan-center-index"
+    topics = ("conan", "benchmark", "performance", "python_requires")
+    exports = "cci_perf.h"
+
+    def package_id(self):
+        self.info.header_only()
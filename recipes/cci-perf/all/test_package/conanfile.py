@@ -0,0 +1,18 @@
+from conans import ConanFile
+
+
+class TestPackageConan(ConanFile):
+    python_requires = "cci-perf/1.0"
+
+    def _results(self, times):
+        return {"benchmarks": [{"name": "{}_median".format(name), "run_name": name, "run_type": "aggregate",
+                                "aggregate_name": "median", "cpu_time": time, "time_unit": "us"}
+                               for name, time in times.items()]}
+
+    def test(self):
+        compare = self.python_requires["cci-perf"].module.compare
+        baseline = self._results({"BM_compress": 100., "BM_decompress": 10.})
+        assert compare(baseline, self._results({"BM_compress": 109., "BM_decompress": 5.}), 0.10) == []
+        assert compare(baseline, self._results({"BM_compress": 150., "BM_decompress": 10., "BM_new": 1.}), 0.10) == \
+            [("BM_compress", 1e5, 1.5e5)]
+        assert compare(baseline, self._results({"BM_compress": 100.}), 0.10) == [("BM_decompress", 1e4, None)]
@@ -0,0 +1,195 @@
+import hashlib
+import os
+import shutil
+import sys
+from conans import ConanFile, tools
+from conans.errors import ConanException
+
+# Content-addressed source store for the recipes of this index.
+#
+# A recipe opts in with:
+#
+#     python_requires = "cci-sources/1.0"
+#
+#     def source(self):
+#         self.python_requires["cci-sources"].module.get(self, **self.conan_data["sources"][self.version])
+#
+# CCI_SOURCES_CACHE selects the store, and every archive is stored as <sha256[:2]>/<sha256>/<filename>:
+#
+#   unset                   behave exactly like tools.get()
+#   /some/directory         read from the directory, fill it on a miss
+#   http(s)://host/mirror   try the (read-only) mirror first, then the upstream URLs
+#
+# Archives are always verified against the sha256 of conandata.yml, also on a hit.
+# The store can be filled ahead of time (e.g. for an offline farm) by running this
+# file directly:
+#
+#     python recipes/cci-sources/all/conanfile.py /some/directory recipes/zstd recipes/fftw -j 8
+
+
+def _filename(url, filename):
+    if filename:
+        return filename
+    url_base = url[0] if isinstance(url, (list, tuple)) else url
+    if "?" in url_base or "=" in url_base:
+        raise ConanException("Cannot deduce file name from the url: '{}'. Use 'filename' parameter.".format(url_base))
+    return os.path.basename(url_base)
+
+
+def _urls(url):
+    return list(url) if isinstance(url, (list, tuple)) else [url]
+
+
+def _is_remote(store):
+    return store.startswith("http://") or store.startswith("https://")
+
+
+def _sha256sum(path):
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def _store_path(store, sha256, filename):
+    return os.path.join(store, sha256[:2], sha256, filename)
+
+
+def _store_url(store, sha256, filename):
+    return "/".join([store.rstrip("/"), sha256[:2], sha256, filename])
+
+
+def _fetch_to_store(store, url, sha256, filename, download):
+    """Returns the path of the verified archive in the store, downloading it with
+    download(urls, path) if it is missing or corrupted."""
+    path = _store_path(store, sha256, filename)
+    if os.path.isfile(path):
+        if _sha256sum(path) == sha256:
+            return path
+        os.unlink(path)
+    folder = os.path.dirname(path)
+    if not os.path.isdir(folder):
+        os.makedirs(folder)
+    # Download next to the final location and rename, so that concurrent builds
+    # never see a partial archive
+    tmp_path = "{}.{}.part".format(path, os.getpid())
+    try:
+        download(_urls(url), tmp_path)
+        if _sha256sum(tmp_path) != sha256:
+            raise ConanException("sha256 signature failed for '{}' file.".format(filename))
+        if not os.path.isfile(path):
+            os.rename(tmp_path, path)
+    finally:
+        if os.path.isfile(tmp_path):
+            os.unlink(tmp_path)
+    return path
+
+
+def get(conanfile, url, sha256, destination=".", filename="", keep_permissions=False, pattern=None, **kwargs):
+    store = tools.get_env("CCI_SOURCES_CACHE")
+    if not store:
+        tools.get(url, sha256=sha256, destination=destination, filename=filename,
+                  keep_permissions=keep_permissions, pattern=pattern, **kwargs)
+        return
+
+    filename = _filename(url, filename)
+    if _is_remote(store):
+        tools.get([_store_url(store, sha256, filename)] + _urls(url), sha256=sha256, destination=destination,
+                  filename=filename, keep_permissions=keep_permissions, pattern=pattern, **kwargs)
+        return
+
+    def download(urls, path):
+        conanfile.output.info("{} not found in source cache, downloading".format(filename))
+        tools.download(urls, path, sha256=sha256, **kwargs)
+
+    path = _fetch_to_store(store, url, sha256, filename, download)
+    conanfile.output.info("Using {} from source cache".format(path))
+    tools.unzip(path, destination=destination, keep_permissions=keep_permissions, pattern=pattern)
+
+
+def _conandata_sources(recipe_folder):
+    import yaml
+
+    def walk(node):
+        if isinstance(node, dict):
+            if "url" in node and "sha256" in node:
+                yield node
+            else:
+                for value in node.values():
+                    for source in walk(value):
+                        yield source
+        elif isinstance(node, list):
+            for value in node:
+                for source in walk(value):
+                    yield source
+
+    for folder in sorted(os.listdir(recipe_folder)):
+        conandata = os.path.join(recipe_folder, folder, "conandata.yml")
+        if os.path.isfile(conandata):
+            with open(conandata) as f:
+                for source in walk(yaml.safe_load(f).get("sources", {})):
+                    yield source
+
+
+def _urllib_download(urls, path):
+    from six.moves.urllib.request import urlopen
+
+    error = None
+    for url in urls:
+        try:
+            response = urlopen(url)
+            with open(path, "wb") as f:
+                shutil.copyfileobj(response, f)
+            return
+        except Exception as e:
+            error = e
+    raise ConanException("Error downloading {}: {}".format(urls[0], error))
+
+
+def populate(store, recipe_folders, jobs=None):
+    """Fills the store with the sources of all the versions of the given recipes.
+    Returns the list of (url, error) that could not be fetched."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    sources = {}
+    for recipe_folder in recipe_folders:
+        for source in _conandata_sources(recipe_folder):
+            sources[str(source["sha256"])] = source
+
+    def fetch(source):
+        try:
+            _fetch_to_store(store, source["url"], str(source["sha256"]),
+                            _filename(source["url"], source.get("filename")), _urllib_download)
+        except Exception as e:
+            return source["url"], str(e)
+
+    with ThreadPoolExecutor(max_workers=jobs or tools.cpu_count()) as executor:
+        return [failure for failure in executor.map(fetch, sources.values()) if failure]
+
+
+class CciSourcesConan(ConanFile):
+    name = "cci-sources"
+    description = "Content-addressed source cache for conan-center-index recipes"
+    license = "MIT"
+    url = "https://github.com/conan-io/conan-center-index"
+    homepage = "https://github.com/conan-io/conan-center-index"
+    topics = ("conan", "sources", "cache", "mirror", "python_requires")
+
+    def package_id(self):
+        self.info.header_only()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Pre-populate a cci-sources store")
+    parser.add_argument("store", help="Store directory")
+    parser.add_argument("recipes", nargs="+", help="Recipe folders, e.g. recipes/zstd")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Parallel downloads")
+    args = parser.parse_args()
+
+    failures = populate(args.store, args.recipes, args.jobs)
+    for url, error in failures:
+        sys.stderr.write("{}: {}\n".format(url, error))
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,31 @@
+import hashlib
+import os
+import shutil
+from conans import ConanFile, tools
+
+
+class TestPackageConan(ConanFile):
+    python_requires = "cci-sources/1.0"
+
+    def test(self):
+        module = self.python_requires["cci-sources"].module
+        content = b"cci-sources test_package"
+        sha256 = hashlib.sha256(content).hexdigest()
+        store = os.path.join(self.build_folder, "store")
+        downloads = []
+
+        def download(urls, path):
+            downloads.append(urls)
+            tools.save(path, content)
+
+        for _ in range(2):
+            path = module._fetch_to_store(store, "https://example.com/archive.tar.gz", sha256, "archive.tar.gz", download)
+        assert len(downloads) == 1
+        assert path == os.path.join(store, sha256[:2], sha256, "archive.tar.gz")
+
+        # A corrupted entry in the store is fetched again
+        tools.save(path, "corrupted")
+        module._fetch_to_store(store, "https://example.com/archive.tar.gz", sha256, "archive.tar.gz", download)
+        assert len(downloads) == 2
+        assert tools.load(path) == content.decode()
+        shutil.rmtree(store)
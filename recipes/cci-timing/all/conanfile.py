@@ -0,0 +1,227 @@
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from conans import ConanFile, tools
+
+# Build phase timings for the recipes of this index.
+#
+# A recipe opts in with:
+#
+#     python_requires = "cci-timing/1.0"
+#
+#     def init(self):
+#         self.python_requires["cci-timing"].module.instrument(self)
+#
+# which times source(), build(), package() and the first call of _configure_cmake() /
+# _configure_autotools() (reported as "configure", it is also part of "build"). Other
+# steps can be timed explicitly with:
+#
+#     with self.python_requires["cci-timing"].module.phase(self, "patch"):
+#         ...
+#
+# Every package built gets a report next to its folder in the cache, <package_id>.timing.json
+# beside package/<package_id>, so the configurations of a reference never mix. It holds the
+# package ID of the package and of its requirements and, for each phase:
+#
+#   wall_time               seconds
+#   cpu_time                user + system seconds of Conan and of the processes it waited for
+#   cpu_utilization         cpu_time / wall_time, i.e. the parallelism actually achieved
+#   jobs                    parallel jobs allowed (CONAN_CPU_COUNT or the number of CPUs)
+#   cumulative_peak_rss_mb  peak resident memory of the largest child process of Conan finished
+#                           so far, this phase or any earlier one (not available on Windows)
+#   peak_rss_mb             the same figure when this phase raised it, i.e. the peak of the phase;
+#                           null when the phase stayed below an earlier peak
+#
+# A graph build spreads its reports over the cache (or several machines), so they are also
+# copied to CCI_TIMING_REPORTS as <name>-<version>-<package_id>.timing.json when it points
+# to a directory, for a CI job to collect. The reports found under a directory (the
+# CCI_TIMING_REPORTS one, or the data folder of a Conan cache) are summarized, with the
+# critical path of the graph, by running this file directly:
+#
+#     python recipes/cci-timing/all/conanfile.py /some/directory [--json]
+
+_configure_methods = ("_configure_cmake", "_configure_autotools")
+
+
+_suffix = ".timing.json"
+
+
+def _reports_folder():
+    return tools.get_env("CCI_TIMING_REPORTS")
+
+
+def _cpu_time():
+    times = os.times()
+    return times[0] + times[1] + times[2] + times[3]
+
+
+def _peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024. * 1024.) if sys.platform == "darwin" else peak / 1024.
+
+
+def key(name, package_id):
+    return "{}:{}".format(name, package_id)
+
+
+def _report(conanfile):
+    """The report of the package being built, kept on the recipe until the package folder is known."""
+    report = getattr(conanfile, "_cci_timing_report", None)
+    if report is None:
+        info = getattr(conanfile, "info", None)
+        if info is None:  # local flows (conan source, conan build) have no package ID
+            return None
+        report = {"name": conanfile.name, "version": str(conanfile.version), "package_id": info.package_id(),
+                  "requires": sorted(key(pref.ref.name, pref.id) for pref in info.full_requires),
+                  "phases": {}}
+        conanfile._cci_timing_report = report
+    return report
+
+
+def _record(conanfile, name, values):
+    report = _report(conanfile)
+    if report is None:
+        return
+    report["phases"][name] = values
+    # source() runs before the package folder is assigned, its phase is saved with the next ones
+    if not getattr(conanfile, "package_folder", None):
+        return
+    paths = [conanfile.package_folder.rstrip("/\\") + _suffix]
+    if _reports_folder():
+        paths.append(os.path.join(_reports_folder(), "{}-{}-{}{}".format(
+            report["name"], report["version"], report["package_id"], _suffix)))
+    for path in paths:
+        tools.save(path, json.dumps(report, indent=2, sort_keys=True))
+
+
+@contextmanager
+def phase(conanfile, name):
+    start_wall, start_cpu, start_rss = time.time(), _cpu_time(), _peak_rss_mb()
+    yield
+    wall_time, cpu_time, peak_rss = time.time() - start_wall, _cpu_time() - start_cpu, _peak_rss_mb()
+    _record(conanfile, name, {
+        "wall_time": round(wall_time, 3),
+        "cpu_time": round(cpu_time, 3),
+        "cpu_utilization": round(cpu_time / wall_time, 2) if wall_time else None,
+        "jobs": tools.cpu_count(),
+        "cumulative_peak_rss_mb": peak_rss,
+        "peak_rss_mb": peak_rss if peak_rss is not None and peak_rss > start_rss else None,
+    })
+    conanfile.output.info("{} took {:.1f} s".format(name, wall_time))
+
+
+def _timed(conanfile, method, name):
+    def wrapper(*args, **kwargs):
+        with phase(conanfile, name):
+            return method(*args, **kwargs)
+    return wrapper
+
+
+def _timed_once(conanfile, method, name):
+    timed = []
+
+    def wrapper(*args, **kwargs):
+        if timed:
+            return method(*args, **kwargs)
+        timed.append(True)
+        with phase(conanfile, name):
+            return method(*args, **kwargs)
+    return wrapper
+
+
+def instrument(conanfile):
+    for name in ("source", "build", "package"):
+        setattr(conanfile, name, _timed(conanfile, getattr(conanfile, name), name))
+    for method in _configure_methods:
+        if callable(getattr(type(conanfile), method, None)):  # not a property, which would be evaluated
+            setattr(conanfile, method, _timed_once(conanfile, getattr(conanfile, method), "configure"))
+
+
+def recipe_time(report):
+    """Wall time of a recipe: source, build (including configure) and package."""
+    phases = report.get("phases", {})
+    return sum(phases[name]["wall_time"] for name in ("source", "build", "package") if name in phases)
+
+
+def critical_path(reports):
+    """Returns (total, [keys]) of the longest chain of dependent packages, which bounds
+    the duration of the graph build whatever the number of parallel builds. reports are
+    indexed by key(name, package_id), as returned by load_reports()."""
+    longest = {}
+
+    def visit(package):
+        if package not in longest:
+            longest[package] = (0., [])  # guards against cycles in broken reports
+            report = reports[package]
+            chains = [visit(dep) for dep in report.get("requires", []) if dep in reports]
+            total, path = max(chains) if chains else (0., [])
+            longest[package] = (total + recipe_time(report), path + [package])
+        return longest[package]
+
+    return max([visit(package) for package in reports] or [(0., [])])
+
+
+def load_reports(folder):
+    """Returns the reports found under folder, indexed by key(name, package_id)."""
+    reports = {}
+    for root, _, filenames in os.walk(folder):
+        for filename in sorted(filenames):
+            if filename.endswith(_suffix):
+                report = json.loads(tools.load(os.path.join(root, filename)))
+                reports[key(report["name"], report["package_id"])] = report
+    return reports
+
+
+class CciTimingConan(ConanFile):
+    name = "cci-timing"
+    description = "Build phase timing reports for conan-center-index recipes"
+    license = "MIT"
+    url = "https://github.com/conan-io/conan-center-index"
+    homepage = "https://github.com/conan-io/conan-center-index"
+    topics = ("conan", "timing", "profiling", "build", "python_requires")
+
+    def package_id(self):
+        self.info.header_only()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Summarize the cci-timing reports of a graph build")
+    parser.add_argument("folder", help="CCI_TIMING_REPORTS directory")
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    args = parser.parse_args()
+
+    reports = load_reports(args.folder)
+    total, path = critical_path(reports)
+    if args.json:
+        print(json.dumps({"recipes": reports, "critical_path": path, "critical_path_time": total}, indent=2))
+        sys.exit(0)
+
+    def label(package):
+        report = reports[package]
+        return "{}/{}:{}".format(report["name"], report["version"], report["package_id"][:8])
+
+    # rss is the peak of the phases that raised the peak of Conan's children, "-" if none did
+    print("{:<34} {:>9} {:>9} {:>9} {:>9} {:>9} {:>8} {:>9}".format(
+        "package", "total", "source", "configure", "build", "package", "cpu/wall", "rss (MB)"))
+    for package, report in sorted(reports.items(), key=lambda item: -recipe_time(item[1])):
+        phases = report.get("phases", {})
+        build = phases.get("build", {})
+        rss = max([p["peak_rss_mb"] for p in phases.values() if p.get("peak_rss_mb")] or [None])
+        row = [label(package), recipe_time(report)]
+        row.extend(phases.get(p, {}).get("wall_time", 0.) for p in ("source", "configure", "build", "package"))
+        row.extend([build.get("cpu_utilization") or "-", "{:.0f}".format(rss) if rss else "-"])
+        print("{:<34} {:>9.1f} {:>9.1f} {:>9.1f} {:>9.1f} {:>9.1f} {:>8} {:>9}".format(*row))
+    print("")
+    print("Sum of the packages: {:.1f} s".format(sum(recipe_time(report) for report in reports.values())))
+    print("Critical path: {:.1f} s".format(total))
+    for package in path:
+        print("  {:<32} {:>9.1f}".format(label(package), recipe_time(reports[package])))
@@ -0,0 +1,34 @@
+import json
+import os
+from conans import ConanFile, tools
+
+
+class TestPackageConan(ConanFile):
+    python_requires = "cci-timing/1.0"
+
+    def _report(self, name, build, requires=(), package_id="1"):
+        return {"name": name, "version": "1.0", "package_id": package_id, "requires": list(requires),
+                "phases": {"source": {"wall_time": 1.}, "build": {"wall_time": build}, "package": {"wall_time": 1.}}}
+
+    def test(self):
+        module = self.python_requires["cci-timing"].module
+        reports = {
+            "zlib:1": self._report("zlib", 10.),
+            "bzip2:1": self._report("bzip2", 5.),
+            "openssl:1": self._report("openssl", 100., ["zlib:1"]),
+            "boost:1": self._report("boost", 200., ["zlib:1", "bzip2:1"]),
+            "folly:1": self._report("folly", 300., ["boost:1", "openssl:1", "zlib:1", "bzip2:1", "glog:1"]),
+            # another configuration of boost, which is not part of the graph of folly:1
+            "boost:2": self._report("boost", 900., ["zlib:1", "bzip2:1"], package_id="2"),
+        }
+        assert module.recipe_time(reports["zlib:1"]) == 12.
+        assert module.critical_path(reports) == (12. + 902., ["zlib:1", "boost:2"])
+        del reports["boost:2"]
+        assert module.critical_path(reports) == (12. + 202. + 302., ["zlib:1", "boost:1", "folly:1"])
+        assert module.critical_path({}) == (0., [])
+
+        folder = os.path.join(self.build_folder, "reports")
+        for report in (self._report("boost", 200.), self._report("boost", 900., package_id="2")):
+            tools.save(os.path.join(folder, "boost", "package", report["package_id"] + ".timing.json"),
+                       json.dumps(report))
+        assert sorted(module.load_reports(folder)) == ["boost:1", "boost:2"]
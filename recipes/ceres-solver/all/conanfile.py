@@ -15,9 +15,10 @@ class ceressolverConan(ConanFile):
     generators = ["cmake"]
     options = {"shared": [True, False],
                "fPIC": [True, False],
-               "use_glog":  [True, False], #TODO Set to true once gflags with nothreads=False binaries are available. Using MINILOG has a big performance drawback.
+               "use_glog":  [True, False], #Using MINILOG has a big performance drawback, so glog is the default out of Debug builds
                "use_gflags": [True, False],
                "use_custom_blas": [True, False],
+               "use_lapack": [True, False],
                "use_eigen_sparse": [True, False],
                "use_TBB": [True, False],
                "use_CXX11_threads": [True, False],
@@ -25,9 +26,10 @@ class ceressolverConan(ConanFile):
                "use_schur_specializations": [True, False]}
     default_options = {"shared": False,
                        "fPIC": True,
-                       "use_glog": False,
-                       "use_gflags": False,
+                       "use_glog": True,
+                       "use_gflags": True,
                        "use_custom_blas": True,
+                       "use_lapack": False,
                        "use_eigen_sparse": True,
                        "use_TBB": False,
                        "use_CXX11_threads": False,
@@ -50,7 +52,7 @@ class ceressolverConan(ConanFile):
             self._cmake.definitions["GFLAGS_PREFER_EXPORTED_GFLAGS_CMAKE_CONFIGURATION"] = False  #Set to false to Force CMake to use the conan-generated dependencies
             self._cmake.definitions["EIGENSPARSE"] = self.options.use_eigen_sparse
             self._cmake.definitions["SUITESPARSE"] = False  #Optional. Not sufpported right now because SuiteSparse is not part of conan-index
-            self._cmake.definitions["LAPACK"] = False       #Optional. Not supported right now because LAPACK is not part of conan-index
+            self._cmake.definitions["LAPACK"] = self.options.use_lapack   #Provided by openblas, used by the dense Schur and Cholesky solvers
             self._cmake.definitions["OPENMP"] = False
             self._cmake.definitions["CXSPARSE"] = False     #Optional. Not supported right now because CXSSPARSE is not part of conan-index
             self._cmake.definitions["MINIGLOG"] = not self.options.use_glog
@@ -66,6 +68,8 @@ class ceressolverConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             self.options.remove("fPIC")
+        if self.settings.build_type == "Debug":
+            self.options.use_glog = False
 
     def configure(self):
         if self.settings.build_type == "Debug" and self.options.use_glog:
@@ -82,6 +86,9 @@ class ceressolverConan(ConanFile):
             self.options["gflags"].nothreads = False
         if self.options.use_TBB:
             self.requires.add("tbb/2020.0")
+        if self.options.use_lapack:
+            self.requires.add("openblas/0.3.9")
+            self.options["openblas"].build_lapack = True
 
     def source(self):
         tools.get(**self.conan_data["sources"][self.version])
@@ -97,6 +104,12 @@ class ceressolverConan(ConanFile):
         tools.replace_in_file(os.path.join(self._source_subfolder, "cmake", "FindGflags.cmake"),
                               "find_library(GFLAGS_LIBRARY NAMES gflags",
                               "find_library(GFLAGS_LIBRARY NAMES gflags gflags_static")
+        #Use the LAPACK of openblas instead of looking for a system one
+        if self.options.use_lapack:
+            tools.replace_in_file(os.path.join(self._source_subfolder, "CMakeLists.txt"),
+                                  "find_package(LAPACK QUIET)",
+                                  "set(LAPACK_FOUND TRUE)\n"
+                                  "  set(LAPACK_LIBRARIES ${CONAN_LIBS_OPENBLAS} ${CONAN_SYSTEM_LIBS_OPENBLAS})")
         for patch in self.conan_data["patches"][self.version]:
             tools.patch(**patch)
         cmake = self._configure_cmake()
@@ -113,3 +126,5 @@ class ceressolverConan(ConanFile):
     def package_info(self):
         self.cpp_info.libs = tools.collect_libs(self)
         self.cpp_info.includedirs = ["include",os.path.join("include","ceres")]
+        if not self.options.use_glog:
+            self.cpp_info.includedirs.append(os.path.join("include","ceres","internal","miniglog"))
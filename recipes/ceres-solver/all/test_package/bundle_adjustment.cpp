@@ -0,0 +1,159 @@
+// Solves a synthetic bundle adjustment problem with the linear solvers relevant
+// for it and reports the solve time of each one.
+
+#include <chrono>
+#include <cmath>
+#include <cstdio>
+#include <random>
+#include <string>
+#include <vector>
+
+#include "ceres/ceres.h"
+#include "ceres/rotation.h"
+
+namespace {
+
+const int kNumCameras = 16;
+const int kNumPoints = 1000;
+const int kObservationsPerPoint = 6;
+
+// Pinhole camera with 9 parameters: angle-axis rotation, translation, focal
+// length and two radial distortion coefficients (as in the BAL datasets).
+struct ReprojectionError {
+  ReprojectionError(double observed_x, double observed_y)
+      : observed_x(observed_x), observed_y(observed_y) {}
+
+  template <typename T>
+  bool operator()(const T* const camera, const T* const point, T* residuals) const {
+    T p[3];
+    ceres::AngleAxisRotatePoint(camera, point, p);
+    p[0] += camera[3];
+    p[1] += camera[4];
+    p[2] += camera[5];
+
+    const T xp = -p[0] / p[2];
+    const T yp = -p[1] / p[2];
+    const T r2 = xp * xp + yp * yp;
+    const T distortion = T(1.0) + r2 * (camera[7] + camera[8] * r2);
+
+    residuals[0] = camera[6] * distortion * xp - T(observed_x);
+    residuals[1] = camera[6] * distortion * yp - T(observed_y);
+    return true;
+  }
+
+  static ceres::CostFunction* Create(double observed_x, double observed_y) {
+    return new ceres::AutoDiffCostFunction<ReprojectionError, 2, 9, 3>(
+        new ReprojectionError(observed_x, observed_y));
+  }
+
+  double observed_x;
+  double observed_y;
+};
+
+struct Observation {
+  int camera;
+  int point;
+  double x;
+  double y;
+};
+
+struct Scene {
+  std::vector<double> cameras;
+  std::vector<double> points;
+  std::vector<Observation> observations;
+};
+
+Scene MakeScene() {
+  std::mt19937 rng(42);
+  std::uniform_real_distribution<double> uniform(-1.0, 1.0);
+  std::normal_distribution<double> pixel_noise(0.0, 0.5);
+  std::normal_distribution<double> parameter_noise(0.0, 0.01);
+
+  Scene truth;
+  for (int i = 0; i < kNumCameras; ++i) {
+    const double camera[9] = {0.1 * uniform(rng), 0.1 * uniform(rng), 0.1 * uniform(rng),
+                              uniform(rng), uniform(rng), -10.0 + uniform(rng),
+                              500.0, 0.0, 0.0};
+    truth.cameras.insert(truth.cameras.end(), camera, camera + 9);
+  }
+  for (int j = 0; j < kNumPoints; ++j) {
+    const double point[3] = {2.0 * uniform(rng), 2.0 * uniform(rng), 2.0 * uniform(rng)};
+    truth.points.insert(truth.points.end(), point, point + 3);
+  }
+
+  std::uniform_int_distribution<int> camera_index(0, kNumCameras - 1);
+  for (int j = 0; j < kNumPoints; ++j) {
+    for (int k = 0; k < kObservationsPerPoint; ++k) {
+      Observation observation;
+      observation.camera = (camera_index(rng) + k) % kNumCameras;
+      observation.point = j;
+      double residuals[2];
+      ReprojectionError(0.0, 0.0)(&truth.cameras[9 * observation.camera],
+                                  &truth.points[3 * j], residuals);
+      observation.x = residuals[0] + pixel_noise(rng);
+      observation.y = residuals[1] + pixel_noise(rng);
+      truth.observations.push_back(observation);
+    }
+  }
+
+  // Start the optimization from a perturbed scene
+  Scene scene = truth;
+  for (size_t i = 0; i < scene.cameras.size(); ++i) {
+    if (i % 9 < 6) {
+      scene.cameras[i] += parameter_noise(rng);
+    }
+  }
+  for (size_t i = 0; i < scene.points.size(); ++i) {
+    scene.points[i] += 10.0 * parameter_noise(rng);
+  }
+  return scene;
+}
+
+void Solve(const Scene& initial, ceres::LinearSolverType linear_solver) {
+  ceres::Solver::Options options;
+  options.linear_solver_type = linear_solver;
+  options.preconditioner_type = ceres::SCHUR_JACOBI;
+  options.max_num_iterations = 20;
+
+  std::string error;
+  if (!options.IsValid(&error)) {
+    std::printf("%-24s not available: %s\n", ceres::LinearSolverTypeToString(linear_solver), error.c_str());
+    return;
+  }
+
+  Scene scene = initial;
+  ceres::Problem problem;
+  for (const Observation& observation : scene.observations) {
+    problem.AddResidualBlock(ReprojectionError::Create(observation.x, observation.y), NULL,
+                             &scene.cameras[9 * observation.camera], &scene.points[3 * observation.point]);
+  }
+
+  ceres::Solver::Summary summary;
+  const auto start = std::chrono::steady_clock::now();
+  ceres::Solve(options, &problem, &summary);
+  const std::chrono::duration<double> elapsed = std::chrono::steady_clock::now() - start;
+
+  std::printf("%-24s %8.3f s  %3d iterations  cost %.3e -> %.3e  (linear solver %.3f s)\n",
+              ceres::LinearSolverTypeToString(linear_solver), elapsed.count(),
+              static_cast<int>(summary.iterations.size()), summary.initial_cost, summary.final_cost,
+              summary.linear_solver_time_in_seconds);
+}
+
+}  // namespace
+
+int main() {
+  const Scene scene = MakeScene();
+  std::printf("Bundle adjustment: %d cameras, %d points, %d observations\n",
+              kNumCameras, kNumPoints, static_cast<int>(scene.observations.size()));
+
+  const ceres::LinearSolverType linear_solvers[] = {
+      ceres::DENSE_SCHUR,
+      ceres::SPARSE_SCHUR,
+      ceres::ITERATIVE_SCHUR,
+      ceres::SPARSE_NORMAL_CHOLESKY,
+  };
+  for (ceres::LinearSolverType linear_solver : linear_solvers) {
+    Solve(scene, linear_solver);
+  }
+  return 0;
+}
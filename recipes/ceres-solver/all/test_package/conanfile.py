@@ -14,3 +14,5 @@ class apriltagTestConan(ConanFile):
         if not tools.cross_building(self.settings):
             bin_path = os.path.join("bin", "example")
             self.run(bin_path, run_environment=True)
+            bin_path = os.path.join("bin", "bundle_adjustment")
+            self.run(bin_path, run_environment=True)
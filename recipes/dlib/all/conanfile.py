@@ -13,6 +13,7 @@ class DlibConan(ConanFile):
     license = "BSL-1.0"
     exports_sources = "CMakeLists.txt"
     generators = "cmake"
+    python_requires = "cci-microarch/1.0"
 
     settings = "os", "arch", "compiler", "build_type"
     options = {
@@ -23,7 +24,10 @@ class DlibConan(ConanFile):
         "with_png": [True, False],
         "with_sse2": [True, False, "auto"],
         "with_sse4": [True, False, "auto"],
-        "with_avx": [True, False, "auto"]
+        "with_avx": [True, False, "auto"],
+        "with_avx2": [True, False],
+        "with_blas": [True, False],
+        "with_lapack": [True, False]
     }
     default_options = {
         "shared": False,
@@ -33,7 +37,10 @@ class DlibConan(ConanFile):
         "with_png": True,
         "with_sse2": "auto",
         "with_sse4": "auto",
-        "with_avx": "auto"
+        "with_avx": "auto",
+        "with_avx2": False,
+        "with_blas": True,
+        "with_lapack": False
     }
 
     _cmake = None
@@ -46,6 +53,9 @@ class DlibConan(ConanFile):
     def _build_subfolder(self):
         return "build_subfolder"
 
+    def init(self):
+        self.python_requires["cci-microarch"].module.init(self)
+
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
@@ -53,8 +63,15 @@ class DlibConan(ConanFile):
             del self.options.with_sse2
             del self.options.with_sse4
             del self.options.with_avx
+            del self.options.with_avx2
 
     def configure(self):
+        self.python_requires["cci-microarch"].module.configure(self, {"with_sse2": "sse2",
+                                                                      "with_sse4": "sse4.2",
+                                                                      "with_avx": "avx",
+                                                                      "with_avx2": "avx2"})
+        if self.options.get_safe("with_avx2") and self.options.with_avx == False:
+            raise ConanInvalidConfiguration("with_avx2 requires with_avx")
         if self.settings.compiler == "Visual Studio" and self.options.shared:
             raise ConanInvalidConfiguration("dlib can not be built as a shared library with Visual Studio")
 
@@ -67,6 +84,10 @@ class DlibConan(ConanFile):
             self.requires("libjpeg/9d")
         if self.options.with_png:
             self.requires("libpng/1.6.37")
+        if self.options.with_blas or self.options.with_lapack:
+            self.requires("openblas/0.3.9")
+        if self.options.with_lapack:
+            self.options["openblas"].build_lapack = True
 
     def source(self):
         tools.get(**self.conan_data["sources"][self.version])
@@ -86,6 +107,9 @@ class DlibConan(ConanFile):
         self._cmake.definitions["DLIB_GIF_SUPPORT"] = self.options.with_gif
         self._cmake.definitions["DLIB_JPEG_SUPPORT"] = self.options.with_jpeg
         self._cmake.definitions["DLIB_PNG_SUPPORT"] = self.options.with_png
+        self._cmake.definitions["DLIB_USE_BLAS"] = self.options.with_blas
+        self._cmake.definitions["DLIB_USE_LAPACK"] = self.options.with_lapack
+        self._cmake.definitions["DLIB_USE_MKL_FFT"] = False
 
         # Configure SIMD options if possible
         if self.settings.arch in ["x86", "x86_64"]:
@@ -95,11 +119,28 @@ class DlibConan(ConanFile):
                 self._cmake.definitions["USE_SSE4_INSTRUCTIONS"] = self.options.with_sse4
             if self.options.with_avx != "auto":
                 self._cmake.definitions["USE_AVX_INSTRUCTIONS"] = self.options.with_avx
+            if self.options.with_avx2 and not self.python_requires["cci-microarch"].module.level(self):
+                # dlib has no AVX2 switch, its SIMD code checks __AVX2__ and __FMA__
+                self._cmake.definitions["USE_AVX_INSTRUCTIONS"] = True
+                avx2_flags = "/arch:AVX2" if self.settings.compiler == "Visual Studio" else "-mavx2 -mfma"
+                self._cmake.definitions["CMAKE_CXX_FLAGS"] = avx2_flags
+        self.python_requires["cci-microarch"].module.apply_cmake(self, self._cmake)
 
         self._cmake.configure(build_folder=self._build_subfolder)
         return self._cmake
 
+    def _patch_sources(self):
+        # Use the BLAS and LAPACK of openblas instead of looking for the ones of the system
+        tools.replace_in_file(os.path.join(self._source_subfolder, "dlib", "CMakeLists.txt"),
+                              "include(cmake_utils/find_blas.cmake)",
+                              "set(blas_found TRUE)\n"
+                              "set(blas_libraries ${CONAN_LIBS_OPENBLAS} ${CONAN_SYSTEM_LIBS_OPENBLAS})\n"
+                              "set(lapack_found TRUE)\n"
+                              "set(lapack_libraries ${blas_libraries})\n"
+                              "set(lapack_with_underscore TRUE)")
+
     def build(self):
+        self._patch_sources()
         cmake = self._configure_cmake()
         cmake.build()
 
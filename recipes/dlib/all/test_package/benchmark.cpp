@@ -0,0 +1,71 @@
+#include <dlib/dnn.h>
+#include <dlib/matrix.h>
+
+#include <chrono>
+#include <cstdlib>
+#include <cstring>
+#include <iostream>
+#include <vector>
+
+// LeNet-like network, timed on random 28x28 images
+using net_type = dlib::loss_multiclass_log<
+                 dlib::fc<10, dlib::relu<dlib::fc<84, dlib::relu<dlib::fc<120,
+                 dlib::max_pool<2, 2, 2, 2, dlib::relu<dlib::con<16, 5, 5, 1, 1,
+                 dlib::max_pool<2, 2, 2, 2, dlib::relu<dlib::con<6, 5, 5, 1, 1,
+                 dlib::input<dlib::matrix<unsigned char>>>>>>>>>>>>>>;
+
+template <typename F>
+static double seconds(F f)
+{
+    const auto start = std::chrono::steady_clock::now();
+    f();
+    return std::chrono::duration<double>(std::chrono::steady_clock::now() - start).count();
+}
+
+static void benchmark_gemm(long n, int iterations)
+{
+    const dlib::matrix<float> a = dlib::matrix_cast<float>(dlib::randm(n, n));
+    const dlib::matrix<float> b = dlib::matrix_cast<float>(dlib::randm(n, n));
+    dlib::matrix<float> c = a * b;
+
+    const double elapsed = seconds([&] {
+        for (int i = 0; i < iterations; ++i)
+            c = a * b;
+    });
+    std::cout << "sgemm " << n << "x" << n << ": " << elapsed / iterations * 1e3 << " ms, "
+              << 2.0 * n * n * n * iterations / elapsed * 1e-9 << " GFLOP/s" << std::endl;
+}
+
+static void benchmark_cnn(size_t images, size_t batch_size)
+{
+    dlib::rand rnd;
+    std::vector<dlib::matrix<unsigned char>> samples(images, dlib::matrix<unsigned char>(28, 28));
+    for (auto& sample : samples)
+        for (auto& pixel : sample)
+            pixel = rnd.get_random_8bit_number();
+
+    net_type net;
+    net(samples, batch_size);  // allocates and initializes the layers
+
+    const double elapsed = seconds([&] { net(samples, batch_size); });
+    std::cout << "cnn forward (LeNet, batch " << batch_size << "): " << images / elapsed << " images/s" << std::endl;
+}
+
+int main(int argc, char** argv)
+{
+#ifdef DLIB_USE_BLAS
+    const bool blas = true;
+#else
+    const bool blas = false;
+#endif
+    std::cout << "BLAS: " << (blas ? "yes" : "no") << std::endl;
+    if (argc > 1 && std::strcmp(argv[1], "--expect-blas") == 0 && !blas) {
+        std::cerr << "dlib was built without BLAS" << std::endl;
+        return EXIT_FAILURE;
+    }
+
+    benchmark_gemm(256, 20);
+    benchmark_gemm(1024, 3);
+    benchmark_cnn(2048, 64);
+    return EXIT_SUCCESS;
+}
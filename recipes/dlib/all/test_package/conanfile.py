@@ -15,3 +15,7 @@ class DlibTestConan(ConanFile):
     def test(self):
         bin_path = os.path.join("bin", "test_package")
         self.run(bin_path, run_environment=True)
+        bin_path = os.path.join("bin", "benchmark")
+        if self.options["dlib"].with_blas:
+            bin_path += " --expect-blas"
+        self.run(bin_path, run_environment=True)
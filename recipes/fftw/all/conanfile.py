@@ -1,4 +1,4 @@
-from conans import ConanFile, CMake, tools
+from conans import ConanFile, tools
 import os
 
 
@@ -11,6 +11,7 @@ class FFTWConan(ConanFile):
     topics = ("conan", "fftw", "dft", "dct", "dst")
     exports_sources = ["CMakeLists.txt"]
     generators = "cmake"
+    python_requires = "cci-cmake/1.0", "cci-sources/1.0"
     settings = "os", "arch", "compiler", "build_type"
     options = {"shared": [True, False],
                "fPIC": [True, False],
@@ -36,12 +37,15 @@ class FFTWConan(ConanFile):
             del self.options.fPIC
 
     def source(self):
-        tools.get(**self.conan_data["sources"][self.version])
+        self.python_requires["cci-sources"].module.get(self, **self.conan_data["sources"][self.version])
         extracted_dir = self.name + "-" + self.version
         os.rename(extracted_dir, self._source_subfolder)
 
+    def build_requirements(self):
+        self.python_requires["cci-cmake"].module.build_requirements(self)
+
     def _configure_cmake(self):
-        cmake = CMake(self)
+        cmake = self.python_requires["cci-cmake"].module.cmake(self)
         cmake.definitions["BUILD_TESTS"] = False
         cmake.definitions["ENABLE_OPENMP"] = self.options.openmp
         cmake.definitions["ENABLE_THREADS"] = self.options.threads
@@ -0,0 +1,78 @@
+#include <cstdint>
+#include <unordered_map>
+#include <vector>
+
+#include <folly/Benchmark.h>
+#include <folly/container/F14Map.h>
+#include <folly/hash/Hash.h>
+#include <folly/init/Init.h>
+
+// F14 maps against std::unordered_map, 64-bit keys
+
+static const std::vector<uint64_t>& keys() {
+  static const std::vector<uint64_t> keys = [] {
+    std::vector<uint64_t> result(1 << 20);
+    for (size_t i = 0; i < result.size(); ++i) {
+      result[i] = folly::hash::twang_mix64(i);
+    }
+    return result;
+  }();
+  return keys;
+}
+
+template <typename Map>
+void insert(unsigned iters) {
+  folly::BenchmarkSuspender suspender;
+  const auto& k = keys();
+  suspender.dismiss();
+  Map map;
+  for (unsigned i = 0; i < iters; ++i) {
+    map[k[i % k.size()]] = i;
+  }
+  folly::doNotOptimizeAway(map.size());
+}
+
+template <typename Map>
+void find(unsigned iters) {
+  folly::BenchmarkSuspender suspender;
+  const auto& k = keys();
+  static const Map map = [&] {
+    Map result;
+    for (size_t i = 0; i < k.size(); i += 2) {
+      result[k[i]] = i;
+    }
+    return result;
+  }();
+  suspender.dismiss();
+  size_t found = 0;
+  for (unsigned i = 0; i < iters; ++i) {
+    found += map.count(k[i % k.size()]);
+  }
+  folly::doNotOptimizeAway(found);
+}
+
+BENCHMARK(std_unordered_map_insert, iters) {
+  insert<std::unordered_map<uint64_t, uint64_t>>(iters);
+}
+BENCHMARK_RELATIVE(F14ValueMap_insert, iters) {
+  insert<folly::F14ValueMap<uint64_t, uint64_t>>(iters);
+}
+BENCHMARK_RELATIVE(F14FastMap_insert, iters) {
+  insert<folly::F14FastMap<uint64_t, uint64_t>>(iters);
+}
+BENCHMARK_DRAW_LINE();
+BENCHMARK(std_unordered_map_find, iters) {
+  find<std::unordered_map<uint64_t, uint64_t>>(iters);
+}
+BENCHMARK_RELATIVE(F14ValueMap_find, iters) {
+  find<folly::F14ValueMap<uint64_t, uint64_t>>(iters);
+}
+BENCHMARK_RELATIVE(F14FastMap_find, iters) {
+  find<folly::F14FastMap<uint64_t, uint64_t>>(iters);
+}
+
+int main(int argc, char** argv) {
+  folly::init(&argc, &argv);
+  folly::runBenchmarks();
+  return 0;
+}
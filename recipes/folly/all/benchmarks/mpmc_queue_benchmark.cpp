@@ -0,0 +1,46 @@
+#include <thread>
+#include <vector>
+
+#include <folly/Benchmark.h>
+#include <folly/MPMCQueue.h>
+#include <folly/init/Init.h>
+
+// Messages through a folly::MPMCQueue with P producers and as many consumers
+
+void producersConsumers(unsigned iters, unsigned pairs) {
+  folly::MPMCQueue<unsigned> queue(1024);
+  std::vector<std::thread> threads;
+  for (unsigned p = 0; p < pairs; ++p) {
+    threads.emplace_back([&, p] {
+      for (unsigned i = p; i < iters; i += pairs) {
+        queue.blockingWrite(i);
+      }
+    });
+    threads.emplace_back([&, p] {
+      unsigned value;
+      for (unsigned i = p; i < iters; i += pairs) {
+        queue.blockingRead(value);
+        folly::doNotOptimizeAway(value);
+      }
+    });
+  }
+  for (auto& thread : threads) {
+    thread.join();
+  }
+}
+
+BENCHMARK(MPMCQueue_1p1c, iters) {
+  producersConsumers(iters, 1);
+}
+BENCHMARK(MPMCQueue_2p2c, iters) {
+  producersConsumers(iters, 2);
+}
+BENCHMARK(MPMCQueue_4p4c, iters) {
+  producersConsumers(iters, 4);
+}
+
+int main(int argc, char** argv) {
+  folly::init(&argc, &argv);
+  folly::runBenchmarks();
+  return 0;
+}
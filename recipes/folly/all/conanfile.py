@@ -1,7 +1,7 @@
 import os
 from conans import ConanFile, CMake, tools
 from conans.tools import Version
-from conans.errors import ConanInvalidConfiguration
+from conans.errors import ConanException, ConanInvalidConfiguration
 
 
 class FollyConan(ConanFile):
@@ -12,10 +12,23 @@ class FollyConan(ConanFile):
     homepage = "https://github.com/facebook/folly"
     license = "Apache-2.0"
     settings = "os", "arch", "compiler", "build_type"
-    options = {"shared": [True, False], "fPIC": [True, False]}
-    default_options = {"shared": False, "fPIC": True}
-    exports_sources = ["CMakeLists.txt", "patches/*"]
+    options = {
+        "shared": [True, False],
+        "fPIC": [True, False],
+        "with_jemalloc": [True, False],
+        "with_libaio": [True, False],
+        "benchmarks": [True, False]
+    }
+    default_options = {
+        "shared": False,
+        "fPIC": True,
+        "with_jemalloc": False,
+        "with_libaio": False,
+        "benchmarks": False
+    }
+    exports_sources = ["CMakeLists.txt", "patches/*", "benchmarks/*"]
     generators = "cmake", "cmake_find_package"
+    python_requires = "cci-timing/1.0", "cci-microarch/1.0"
     requires = (
         "boost/1.72.0",
         "double-conversion/3.1.5",
@@ -30,6 +43,15 @@ class FollyConan(ConanFile):
         "snappy/1.1.7"
     )
     _cmake = None
+    # benchmarks installed by the benchmarks option, they only need folly/Benchmark.h and gflags. F14 and
+    # MPMCQueue are only timed by gtest suites upstream, benchmarks/ has folly::Benchmark ports of them
+    _benchmarks = {
+        "folly_fbstring_benchmark": "source_subfolder/folly/test/FBStringBenchmark.cpp",
+        "folly_concurrent_hash_map_benchmark": "source_subfolder/folly/concurrency/test/ConcurrentHashMapBench.cpp",
+        "folly_producer_consumer_queue_benchmark": "source_subfolder/folly/test/ProducerConsumerQueueBenchmark.cpp",
+        "folly_f14_map_benchmark": "benchmarks/f14_map_benchmark.cpp",
+        "folly_mpmc_queue_benchmark": "benchmarks/mpmc_queue_benchmark.cpp",
+    }
 
     @property
     def _source_subfolder(self):
@@ -39,11 +61,18 @@ class FollyConan(ConanFile):
     def _build_subfolder(self):
         return "build_subfolder"
 
+    def init(self):
+        self.python_requires["cci-timing"].module.instrument(self)
+        self.python_requires["cci-microarch"].module.init(self)
+
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if self.settings.os != "Linux":
+            del self.options.with_libaio
 
     def configure(self):
+        self.python_requires["cci-microarch"].module.configure(self)
         compiler_version = Version(self.settings.compiler.version)
         if self.settings.os == "Windows" and \
             self.settings.compiler == "Visual Studio" and \
@@ -82,6 +111,22 @@ class FollyConan(ConanFile):
             if self.settings.os == "Linux":
                 self.requires("libiberty/9.1.0")
                 self.requires("libunwind/1.3.1")
+        if self.options.with_jemalloc:
+            self.requires("jemalloc/5.2.1")
+
+    def system_requirements(self):
+        # There is no libaio package in the index, folly's AsyncIO is built against the system one
+        if self.options.get_safe("with_libaio"):
+            package_tool = tools.SystemPackageTool(conanfile=self)
+            os_info = tools.OSInfo()
+            if os_info.with_apt:
+                package_tool.install(packages="libaio-dev", update=True)
+            elif os_info.with_yum or os_info.with_zypper:
+                package_tool.install(packages="libaio-devel", update=True)
+            elif os_info.with_pacman:
+                package_tool.install(packages="libaio", update=True)
+            else:
+                self.output.warn("Could not install libaio: Undefined package name for current platform.")
 
     def source(self):
         tools.get(**self.conan_data["sources"][self.version])
@@ -95,12 +140,24 @@ class FollyConan(ConanFile):
             if self.settings.compiler == "Visual Studio":
                 self._cmake.definitions["MSVC_ENABLE_ALL_WARNINGS"] = False
                 self._cmake.definitions["MSVC_USE_STATIC_RUNTIME"] = "MT" in self.settings.compiler.runtime
+            # Keep folly from picking up a libaio of the build machine that the package does not declare
+            self._cmake.definitions["CMAKE_DISABLE_FIND_PACKAGE_LibAIO"] = not self.options.get_safe("with_libaio")
+            self._cmake.definitions["FOLLY_USE_JEMALLOC"] = self.options.with_jemalloc
+            if self.options.benchmarks:
+                self._cmake.definitions["FOLLY_CONAN_BENCHMARKS"] = ";".join(
+                    "{}={}".format(name, source) for name, source in sorted(self._benchmarks.items()))
+            self.python_requires["cci-microarch"].module.apply_cmake(self, self._cmake)
             self._cmake.configure(build_folder=self._build_subfolder)
         return self._cmake
 
     def build(self):
         for patch in self.conan_data["patches"][self.version]:
             tools.patch(**patch)
+        if self.options.benchmarks:
+            missing = [source for source in sorted(self._benchmarks.values())
+                       if not os.path.isfile(os.path.join(self.source_folder, source))]
+            if missing:
+                raise ConanException("Benchmark sources not found in folly {}: {}".format(self.version, ", ".join(missing)))
         cmake = self._configure_cmake()
         cmake.build()
 
@@ -122,3 +179,15 @@ class FollyConan(ConanFile):
            (self.settings.os == "Macos" and self.settings.compiler == "apple-clang" and
            Version(self.settings.compiler.version.value) == "9.0" and self.settings.compiler.libcxx == "libc++"):
             self.cpp_info.system_libs.append("atomic")
+        if self.options.get_safe("with_libaio"):
+            self.cpp_info.system_libs.append("aio")
+        if self.options.with_jemalloc:
+            # folly/memory/Malloc.h then relies on jemalloc instead of probing for it at runtime
+            self.cpp_info.defines.append("FOLLY_USE_JEMALLOC=1")
+        # The F14 containers check at link time that their users are built with the same
+        # SIMD support (SSE4.2 CRC32 hashing) as folly
+        self.cpp_info.cxxflags.extend(self.python_requires["cci-microarch"].module.flags(self))
+        if self.options.benchmarks:
+            bin_path = os.path.join(self.package_folder, "bin")
+            self.output.info("Appending PATH environment variable: {}".format(bin_path))
+            self.env_info.PATH.append(bin_path)
@@ -15,3 +15,5 @@ class TestPackageConan(ConanFile):
         if not tools.cross_building(self.settings):
             bin_path = os.path.join("bin", "test_package")
             self.run(command=bin_path, run_environment=True)
+            if self.options["folly"].benchmarks:
+                self.run("folly_f14_map_benchmark", run_environment=True)
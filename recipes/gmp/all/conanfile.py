@@ -13,8 +13,10 @@ class GmpConan(ConanFile):
     homepage = "https://gmplib.org"
     settings = "os", "arch", "compiler", "build_type"
     options = {"shared": [True, False], "fPIC": [True, False], "disable_assembly": [True, False],
+               "fat": [True, False], "host_cpu": "ANY",
                "run_checks": [True, False], "enable_cxx" : [True, False]}
-    default_options = {'shared': False, 'fPIC': True, 'disable_assembly': True, 'run_checks': False, "enable_cxx" : True}
+    default_options = {'shared': False, 'fPIC': True, 'disable_assembly': True, 'fat': False, 'host_cpu': None,
+                       'run_checks': False, "enable_cxx" : True}
 
     _source_subfolder = "source_subfolder"
     _autotools = None
@@ -22,11 +24,23 @@ class GmpConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        # --enable-fat is only implemented for x86 in gmp 6.1
+        if self.settings.arch not in ["x86", "x86_64"]:
+            del self.options.fat
 
     def configure(self):
         if self.settings.compiler == 'Visual Studio':
             raise ConanInvalidConfiguration("The gmp package cannot be built on Visual Studio.")
 
+        if self.options.get_safe("fat"):
+            if self.options.host_cpu:
+                raise ConanInvalidConfiguration("fat and host_cpu can't be used together, fat selects the cpu at runtime")
+            if self.options.disable_assembly:
+                raise ConanInvalidConfiguration("fat builds the assembly kernels of every cpu, it requires disable_assembly=False")
+        # host_cpu only selects the assembly kernels, the generic C build is the same for every cpu
+        if self.options.host_cpu and self.options.disable_assembly:
+            raise ConanInvalidConfiguration("host_cpu requires disable_assembly=False")
+
         if not self.options.enable_cxx:
             del self.settings.compiler.libcxx
             del self.settings.compiler.cppstd
@@ -46,15 +60,32 @@ class GmpConan(ConanFile):
             configure_args = []
             if self.options.disable_assembly:
                 configure_args.append('--disable-assembly')
+            if self.options.get_safe("fat"):
+                # mpn kernels of all the x86 microarchitectures, selected at load time from cpuid
+                configure_args.append('--enable-fat')
             if self.options.shared:
                 configure_args.extend(["--enable-shared", "--disable-static"])
             else:
                 configure_args.extend(["--disable-shared", "--enable-static"])
             if self.options.enable_cxx:
                 configure_args.append('--enable-cxx')
-            self._autotools.configure(args=configure_args)
+            # Without fat or host_cpu, assembly builds are tuned for the cpu of the build machine
+            host = self._host_triplet
+            build = None if tools.cross_building(self.settings) else host
+            self._autotools.configure(args=configure_args, build=build, host=host)
         return self._autotools
 
+    @property
+    def _host_triplet(self):
+        """<host_cpu>-<vendor>-<os> pinning the mpn kernels to host_cpu (e.g. haswell, skylake, zen)"""
+        if not self.options.host_cpu:
+            return None
+        triplet = tools.get_gnu_triplet(str(self.settings.os), str(self.settings.arch), str(self.settings.compiler))
+        system = triplet.split("-", 1)[1]
+        if system.count("-") == 0 or system.startswith("linux"):
+            system = "pc-" + system if self.settings.arch in ["x86", "x86_64"] else "unknown-" + system
+        return "{}-{}".format(self.options.host_cpu, system)
+
     def build(self):
         with tools.chdir(self._source_subfolder):
             autotools = self._configure_autotools()
@@ -19,3 +19,5 @@ class TestPackageConan(ConanFile):
             if self.options["gmp"].enable_cxx:
                 bin_path = os.path.join("bin", "test_package_cpp")
                 self.run(bin_path, run_environment=True)
+            bin_path = os.path.join("bin", "benchmark")
+            self.run(bin_path, run_environment=True)
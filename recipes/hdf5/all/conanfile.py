@@ -1,7 +1,7 @@
 import glob
 import os
 
-from conans import ConanFile, CMake, tools
+from conans import ConanFile, tools
 from conans.errors import ConanInvalidConfiguration
 
 class Hdf5Conan(ConanFile):
@@ -13,6 +13,7 @@ class Hdf5Conan(ConanFile):
     url = "https://github.com/conan-io/conan-center-index"
     exports_sources = ["CMakeLists.txt", "patches/**"]
     generators = "cmake"
+    python_requires = "cci-cmake/1.0", "cci-sources/1.0"
     settings = "os", "arch", "compiler", "build_type"
     options = {
         "shared": [True, False],
@@ -71,7 +72,7 @@ class Hdf5Conan(ConanFile):
             self.requires.add("szip/2.1.1")
 
     def source(self):
-        tools.get(**self.conan_data["sources"][self.version])
+        self.python_requires["cci-sources"].module.get(self, **self.conan_data["sources"][self.version])
         extracted_dir = "{0}-{0}-{1}".format(self.name, self.version.replace('.', '_'))
         os.rename(extracted_dir, self._source_subfolder)
 
@@ -87,10 +88,13 @@ class Hdf5Conan(ConanFile):
         tools.replace_in_file(os.path.join(self._source_subfolder, "CMakeLists.txt"),
                               "set (CMAKE_POSITION_INDEPENDENT_CODE ON)", "")
 
+    def build_requirements(self):
+        self.python_requires["cci-cmake"].module.build_requirements(self)
+
     def _configure_cmake(self):
         if self._cmake:
             return self._cmake
-        self._cmake = CMake(self)
+        self._cmake = self.python_requires["cci-cmake"].module.cmake(self)
         self._cmake.definitions["HDF5_EXTERNALLY_CONFIGURED"] = True
         self._cmake.definitions["HDF5_EXTERNAL_LIB_PREFIX"] = ""
         self._cmake.definitions["HDF5_USE_FOLDERS"] = False
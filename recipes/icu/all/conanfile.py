@@ -18,6 +18,7 @@ class ICUBase(ConanFile):
     _build_subfolder = "build_subfolder"
     _env_build = None
     settings = "os", "arch", "compiler", "build_type"
+    python_requires = "cci-timing/1.0"
     options = {"shared": [True, False],
                "fPIC": [True, False],
                "data_packaging": ["files", "archive", "library", "static"],
@@ -44,6 +45,9 @@ class ICUBase(ConanFile):
                 tools.os_info.detect_windows_subsystem() != "msys2":
             self.build_requires("msys2/20190524")
 
+    def init(self):
+        self.python_requires["cci-timing"].module.instrument(self)
+
     def source(self):
         tools.get(**self.conan_data["sources"][self.version])
         os.rename("icu", self._source_subfolder)
@@ -94,7 +98,8 @@ class ICUBase(ConanFile):
                     # workaround for https://unicode-org.atlassian.net/browse/ICU-20531
                     os.makedirs(os.path.join("data", "out", "tmp"))
 
-                    self.run(self._build_config_cmd, win_bash=tools.os_info.is_windows)
+                    with self.python_requires["cci-timing"].module.phase(self, "configure"):
+                        self.run(self._build_config_cmd, win_bash=tools.os_info.is_windows)
                     if self.options.get_safe("silent"):
                         silent = '--silent' if self.options.silent else 'VERBOSE=1'
                     else:
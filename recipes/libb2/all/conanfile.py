@@ -14,6 +14,7 @@ class libb2Conan(ConanFile):
     topics = ("conan", "blake2", "hash")
     exports_sources = ["CMakeLists.txt"]
     generators = ["cmake"]
+    python_requires = "cci-microarch/1.0"
     options = {"fPIC": [True, False], "shared": [True, False], "use_sse": [True, False], "use_neon": [True, False]}
     default_options = {"fPIC": True, "shared": True, "use_sse": False, "use_neon": False}
     _cmake = None
@@ -26,9 +27,13 @@ class libb2Conan(ConanFile):
     def _build_subfolder(self):
         return "build_subfolder"
 
+    def init(self):
+        self.python_requires["cci-microarch"].module.init(self)
+
     def configure(self):
         del self.settings.compiler.libcxx
         del self.settings.compiler.cppstd
+        self.python_requires["cci-microarch"].module.configure(self, {"use_sse": "sse2", "use_neon": "neon"})
         if self.options.use_neon and not "arm" in self.settings.arch:
             raise ConanInvalidConfiguration("Neon sources only supported on arm-based CPUs")
         if self.options.use_neon and self.options.use_sse:
@@ -48,6 +53,7 @@ class libb2Conan(ConanFile):
             self._cmake = CMake(self)
             self._cmake.definitions["USE_SSE"] = self.options.use_sse
             self._cmake.definitions["USE_NEON"] = self.options.use_neon
+            self.python_requires["cci-microarch"].module.apply_cmake(self, self._cmake)
             self._cmake.configure(build_folder=self._build_subfolder)
         return self._cmake
 
@@ -13,6 +13,7 @@ class LibjpegTurboConan(ConanFile):
     license = "BSD-3-Clause, Zlib"
     exports_sources = "CMakeLists.txt"
     generators = "cmake"
+    python_requires = "cci-microarch/1.0"
     settings = "os", "arch", "compiler", "build_type"
     options = {"shared": [True, False],
                "fPIC": [True, False],
@@ -47,6 +48,9 @@ class LibjpegTurboConan(ConanFile):
     def _build_subfolder(self):
         return "build_subfolder"
 
+    def init(self):
+        self.python_requires["cci-microarch"].module.init(self)
+
     def build_requirements(self):
         self.build_requires("nasm/2.14")
 
@@ -57,6 +61,7 @@ class LibjpegTurboConan(ConanFile):
             self.options.remove("fPIC")
         if self.settings.os == "Emscripten":
             del self.options.SIMD
+        self.python_requires["cci-microarch"].module.configure(self, {"SIMD": "simd"})
 
     def source(self):
         tools.get(**self.conan_data["sources"][self.version])
@@ -75,6 +80,7 @@ class LibjpegTurboConan(ConanFile):
         self._cmake.definitions["ENABLE_STATIC"] = not self.options.shared
         self._cmake.definitions["ENABLE_SHARED"] = self.options.shared
         self._cmake.definitions["WITH_SIMD"] = self._simd
+        self.python_requires["cci-microarch"].module.apply_cmake(self, self._cmake)
         self._cmake.definitions["WITH_ARITH_ENC"] = self.options.arithmetic_encoder
         self._cmake.definitions["WITH_ARITH_DEC"] = self.options.arithmetic_decoder
         self._cmake.definitions["WITH_JPEG7"] = self.options.libjpeg7_compatibility
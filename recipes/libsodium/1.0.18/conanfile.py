@@ -20,6 +20,10 @@ class LibsodiumConan(ConanFile):
         "fPIC": [True, False],
         "use_soname" : [True, False],
         "PIE"    : [True, False],
+        "optimized": [True, False],
+        "minimal": [True, False],
+        "with_avx2": [True, False],
+        "with_avx512": [True, False],
     }
 
     default_options = {
@@ -27,6 +31,10 @@ class LibsodiumConan(ConanFile):
         "fPIC": True,
         "use_soname": True,
         "PIE": False,
+        "optimized": False,
+        "minimal": False,
+        "with_avx2": True,
+        "with_avx512": True,
     }
 
     @property
@@ -60,10 +68,20 @@ class LibsodiumConan(ConanFile):
     def configure(self):
         del self.settings.compiler.libcxx
         del self.settings.compiler.cppstd
+        if self.settings.compiler == "Visual Studio" and (self.options.optimized or self.options.minimal):
+            raise ConanInvalidConfiguration("optimized and minimal builds are only available with autotools")
+        if self.options.optimized:
+            self.output.warn("optimized=True tunes libsodium for the CPU of the build machine, the package isn't portable")
 
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if self.settings.arch not in ["x86", "x86_64"]:
+            del self.options.with_avx2
+            del self.options.with_avx512
+        elif self.settings.compiler == "Visual Studio":
+            # the msvc projects never build the AVX-512 implementations
+            del self.options.with_avx512
 
     def build_requirements(self):
         # There are several unix tools used (bash scripts for Emscripten, autoreconf on MinGW, etc...)
@@ -88,6 +106,12 @@ class LibsodiumConan(ConanFile):
             win_bash = True
 
         autotools = AutoToolsBuildEnvironment(self, win_bash=win_bash)
+        # configure defines HAVE_*INTRIN_H when the compiler supports the instruction set, the
+        # implementations using it are then compiled and picked at runtime from the cpu features
+        if self.options.get_safe("with_avx2") == False:
+            autotools.flags.append("-UHAVE_AVX2INTRIN_H")
+        if self.options.get_safe("with_avx512") == False:
+            autotools.flags.append("-UHAVE_AVX512FINTRIN_H")
         if self._is_mingw:
             self.run("autoreconf -i", cwd=self._source_subfolder, win_bash=win_bash)
         autotools.configure(args=configure_args, configure_dir=self._source_subfolder, host=False)
@@ -153,6 +177,9 @@ class LibsodiumConan(ConanFile):
             tools.patch(**patch)
         if self.settings.os == "Macos":
             tools.replace_in_file(os.path.join(self._source_subfolder, "configure"), r"-install_name \$rpath/", "-install_name ")
+        if self.settings.compiler == "Visual Studio" and self.options.get_safe("with_avx2") == False:
+            tools.replace_in_file(os.path.join(self._source_subfolder, "src", "libsodium", "include", "sodium", "private", "common.h"),
+                                  "#  define HAVE_AVX2INTRIN_H 1", "")
         if self.settings.compiler != "Visual Studio":
             self._build_autotools()
         else:
@@ -200,7 +227,9 @@ class LibsodiumConan(ConanFile):
             self._autotools_bool_arg("shared", self.options.shared),
             self._autotools_bool_arg("static", not self.options.shared),
             self._autotools_bool_arg("soname-versions", self.options.use_soname),
-            self._autotools_bool_arg("pie", self.options.PIE)
+            self._autotools_bool_arg("pie", self.options.PIE),
+            self._autotools_bool_arg("opt", self.options.optimized),
+            self._autotools_bool_arg("minimal", self.options.minimal)
         ]
         if self.options.get_safe("fPIC"):
             args.append("--with-pic")
@@ -0,0 +1,76 @@
+#include <chrono>
+#include <cstdlib>
+#include <iostream>
+#include <vector>
+
+#include <sodium.h>
+
+// Throughput of secretbox, XChaCha20-Poly1305, BLAKE2b and Argon2id, each run for about one second
+
+typedef std::chrono::steady_clock Clock;
+
+template <typename F>
+static double runsPerSecond(F f)
+{
+    const Clock::time_point start = Clock::now();
+    double elapsed = 0;
+    size_t runs = 0;
+    do {
+        f();
+        ++runs;
+        elapsed = std::chrono::duration<double>(Clock::now() - start).count();
+    } while (elapsed < 1.0);
+    return runs / elapsed;
+}
+
+int main()
+{
+    if (sodium_init() == -1) {
+        return EXIT_FAILURE;
+    }
+    // 1 when the cpu supports the instruction set and libsodium was built with its implementations
+    std::cout << "avx2: " << sodium_runtime_has_avx2() << ", avx512f: " << sodium_runtime_has_avx512f() << std::endl;
+
+    const size_t size = 1 << 20;
+    std::vector<unsigned char> message(size);
+    std::vector<unsigned char> ciphertext(size + crypto_aead_xchacha20poly1305_ietf_ABYTES);
+    randombytes_buf(message.data(), size);
+    const double megabytes = size / 1e6;
+
+    unsigned char key[crypto_secretbox_KEYBYTES];
+    unsigned char nonce[crypto_aead_xchacha20poly1305_ietf_NPUBBYTES];
+    unsigned char hash[crypto_generichash_BYTES];
+    randombytes_buf(key, sizeof key);
+    randombytes_buf(nonce, sizeof nonce);
+
+    std::cout << "crypto_secretbox_easy:                      "
+              << megabytes * runsPerSecond([&] { crypto_secretbox_easy(ciphertext.data(), message.data(), size, nonce, key); })
+              << " MB/s" << std::endl;
+
+    std::cout << "crypto_aead_xchacha20poly1305_ietf_encrypt: "
+              << megabytes * runsPerSecond([&] {
+                     crypto_aead_xchacha20poly1305_ietf_encrypt(ciphertext.data(), NULL, message.data(), size,
+                                                                NULL, 0, NULL, nonce, key);
+                 })
+              << " MB/s" << std::endl;
+
+    std::cout << "crypto_generichash:                         "
+              << megabytes * runsPerSecond([&] { crypto_generichash(hash, sizeof hash, message.data(), size, NULL, 0); })
+              << " MB/s" << std::endl;
+
+    const char password[] = "correct horse battery staple";
+    unsigned char salt[crypto_pwhash_SALTBYTES];
+    randombytes_buf(salt, sizeof salt);
+    std::cout << "crypto_pwhash (argon2id, interactive):      "
+              << runsPerSecond([&] {
+                     if (crypto_pwhash(key, sizeof key, password, sizeof password - 1, salt,
+                                       crypto_pwhash_OPSLIMIT_INTERACTIVE, crypto_pwhash_MEMLIMIT_INTERACTIVE,
+                                       crypto_pwhash_ALG_ARGON2ID13) != 0) {
+                         std::cerr << "crypto_pwhash: out of memory" << std::endl;
+                         std::exit(EXIT_FAILURE);
+                     }
+                 })
+              << " hashes/s" << std::endl;
+
+    return EXIT_SUCCESS;
+}
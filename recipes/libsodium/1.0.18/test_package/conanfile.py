@@ -22,3 +22,4 @@ class PackageTest(ConanFile):
             assert(os.path.exists(os.path.join("bin", exe_name)))
         else:
             self.run(os.path.join("bin", "example"), run_environment=True)
+            self.run(os.path.join("bin", "benchmark"), run_environment=True)
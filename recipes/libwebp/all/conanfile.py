@@ -1,5 +1,5 @@
 import os
-from conans import ConanFile, CMake, tools
+from conans import ConanFile, tools
 
 
 class LibwebpConan(ConanFile):
@@ -11,13 +11,16 @@ class LibwebpConan(ConanFile):
     license = "BSD-3-Clause"
     exports_sources = ["CMakeLists.txt", "patches/**"]
     generators = "cmake"
+    python_requires = "cci-cmake/1.0", "cci-sources/1.0", "cci-microarch/1.0"
     settings = "os", "compiler", "build_type", "arch"
     options = {"shared": [True, False], "fPIC": [True, False],
                "with_simd": [True, False], "near_lossless": [True, False],
-               "swap_16bit_csp": [True, False]}
+               "swap_16bit_csp": [True, False], "threads": [True, False],
+               "tools": [True, False]}
     default_options = {"shared": False, "fPIC": True,
                        "with_simd": True, "near_lossless": True,
-                       "swap_16bit_csp": False}
+                       "swap_16bit_csp": False, "threads": True,
+                       "tools": False}
 
     _cmake = None
 
@@ -25,6 +28,9 @@ class LibwebpConan(ConanFile):
     def _source_subfolder(self):
         return "source_subfolder"
 
+    def init(self):
+        self.python_requires["cci-microarch"].module.init(self)
+
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
@@ -32,9 +38,10 @@ class LibwebpConan(ConanFile):
     def configure(self):
         del self.settings.compiler.libcxx
         del self.settings.compiler.cppstd
+        self.python_requires["cci-microarch"].module.configure(self, {"with_simd": "simd"})
 
     def source(self):
-        tools.get(**self.conan_data["sources"][self.version])
+        self.python_requires["cci-sources"].module.get(self, **self.conan_data["sources"][self.version])
         extracted_dir = self.name + "-" + self.version
         os.rename(extracted_dir, self._source_subfolder)
 
@@ -42,29 +49,36 @@ class LibwebpConan(ConanFile):
     def _version_components(self):
         return [int(x) for x in self.version.split(".")]
 
+    def build_requirements(self):
+        self.python_requires["cci-cmake"].module.build_requirements(self)
+
     def _configure_cmake(self):
         if self._cmake:
             return self._cmake
-        self._cmake = CMake(self)
+        self._cmake = self.python_requires["cci-cmake"].module.cmake(self)
         # should be an option but it doesn't work yet
         self._cmake.definitions["WEBP_ENABLE_SIMD"] = self.options.with_simd
+        self.python_requires["cci-microarch"].module.apply_cmake(self, self._cmake)
         if self._version_components[0] >= 1:
             self._cmake.definitions["WEBP_NEAR_LOSSLESS"] = self.options.near_lossless
         else:
             self._cmake.definitions["WEBP_ENABLE_NEAR_LOSSLESS"] = self.options.near_lossless
         self._cmake.definitions["WEBP_ENABLE_SWAP_16BIT_CSP"] = self.options.swap_16bit_csp
+        # worker threads for encoder analysis and decoder filtering (WebPConfig::thread_level, cwebp -mt)
+        self._cmake.definitions["WEBP_USE_THREAD"] = self.options.threads
         # avoid finding system libs
         self._cmake.definitions["CMAKE_DISABLE_FIND_PACKAGE_GIF"] = True
         self._cmake.definitions["CMAKE_DISABLE_FIND_PACKAGE_PNG"] = True
         self._cmake.definitions["CMAKE_DISABLE_FIND_PACKAGE_TIFF"] = True
         self._cmake.definitions["CMAKE_DISABLE_FIND_PACKAGE_JPEG"] = True
         self._cmake.definitions["WEBP_BUILD_ANIM_UTILS"] = False
-        self._cmake.definitions["WEBP_BUILD_CWEBP"] = False
-        self._cmake.definitions["WEBP_BUILD_DWEBP"] = False
+        self._cmake.definitions["WEBP_BUILD_CWEBP"] = self.options.tools
+        self._cmake.definitions["WEBP_BUILD_DWEBP"] = self.options.tools
         self._cmake.definitions["WEBP_BUILD_IMG2WEBP"] = False
         self._cmake.definitions["WEBP_BUILD_GIF2WEBP"] = False
         self._cmake.definitions["WEBP_BUILD_VWEBP"] = False
-        self._cmake.definitions["WEBP_BUILD_EXTRAS"] = False
+        # extras provide get_disto, to measure the quality of cwebp presets
+        self._cmake.definitions["WEBP_BUILD_EXTRAS"] = self.options.tools
         self._cmake.definitions["WEBP_BUILD_WEBPINFO"] = False
         self._cmake.definitions["WEBP_BUILD_WEBPMUX"] = False
 
@@ -86,6 +100,10 @@ class LibwebpConan(ConanFile):
         cmake = self._configure_cmake()
         cmake.install()
         self.copy("COPYING", dst="licenses", src=self._source_subfolder)
+        if self.options.tools:
+            # extras are not installed by upstream
+            for get_disto in ["get_disto", "get_disto.exe"]:
+                self.copy(get_disto, dst="bin", src="bin", keep_path=False)
         tools.rmdir(os.path.join(self.package_folder, "lib", "pkgconfig"))
         tools.rmdir(os.path.join(self.package_folder, "share"))
 
@@ -93,7 +111,11 @@ class LibwebpConan(ConanFile):
         self.cpp_info.libs = ["webpmux", "webpdemux", "webpdecoder", "webp"]
         if self.options.shared and self.settings.os == "Windows" and self.settings.compiler != "Visual Studio":
             self.cpp_info.libs = [lib + ".dll" for lib in self.cpp_info.libs]
-        if self.settings.os == "Linux":
+        if self.settings.os == "Linux" and self.options.threads:
             self.cpp_info.system_libs.append("pthread")
         if self.settings.os == "Linux" or self.settings.os == "Android":
             self.cpp_info.system_libs.append("m")
+        if self.options.tools:
+            bin_path = os.path.join(self.package_folder, "bin")
+            self.output.info("Appending PATH environment variable: {}".format(bin_path))
+            self.env_info.PATH.append(bin_path)
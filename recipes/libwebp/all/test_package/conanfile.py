@@ -15,3 +15,6 @@ class TestPackageConan(ConanFile):
         if not tools.cross_building(self.settings):
             bin_path = os.path.join("bin", "test_package")
             self.run(bin_path, run_environment=True)
+            if self.options["libwebp"].tools:
+                self.run("cwebp -version", run_environment=True)
+                self.run("dwebp -version", run_environment=True)
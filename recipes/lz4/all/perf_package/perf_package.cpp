@@ -0,0 +1,50 @@
+#include <benchmark/benchmark.h>
+#include <lz4.h>
+#include <lz4hc.h>
+#include "cci_perf.h"
+
+#include <cstdint>
+#include <string>
+#include <vector>
+
+static const std::string corpus = cci_perf::make_corpus(1 << 20);
+
+static void BM_compress_fast(benchmark::State& state) {
+    const int acceleration = static_cast<int>(state.range(0));
+    std::vector<char> output(LZ4_compressBound(static_cast<int>(corpus.size())));
+    for (auto _ : state) {
+        const int size = LZ4_compress_fast(corpus.data(), output.data(), static_cast<int>(corpus.size()),
+                                           static_cast<int>(output.size()), acceleration);
+        benchmark::DoNotOptimize(size);
+    }
+    state.SetBytesProcessed(static_cast<int64_t>(state.iterations()) * corpus.size());
+}
+BENCHMARK(BM_compress_fast)->Arg(1)->Arg(8);
+
+static void BM_compress_hc(benchmark::State& state) {
+    const int level = static_cast<int>(state.range(0));
+    std::vector<char> output(LZ4_compressBound(static_cast<int>(corpus.size())));
+    for (auto _ : state) {
+        const int size = LZ4_compress_HC(corpus.data(), output.data(), static_cast<int>(corpus.size()),
+                                         static_cast<int>(output.size()), level);
+        benchmark::DoNotOptimize(size);
+    }
+    state.SetBytesProcessed(static_cast<int64_t>(state.iterations()) * corpus.size());
+}
+BENCHMARK(BM_compress_hc)->Arg(LZ4HC_CLEVEL_DEFAULT);
+
+static void BM_decompress(benchmark::State& state) {
+    std::vector<char> compressed(LZ4_compressBound(static_cast<int>(corpus.size())));
+    compressed.resize(LZ4_compress_default(corpus.data(), compressed.data(), static_cast<int>(corpus.size()),
+                                           static_cast<int>(compressed.size())));
+    std::string output(corpus.size(), '\0');
+    for (auto _ : state) {
+        const int size = LZ4_decompress_safe(compressed.data(), &output[0], static_cast<int>(compressed.size()),
+                                             static_cast<int>(output.size()));
+        benchmark::DoNotOptimize(size);
+    }
+    state.SetBytesProcessed(static_cast<int64_t>(state.iterations()) * corpus.size());
+}
+BENCHMARK(BM_decompress);
+
+BENCHMARK_MAIN();
@@ -1,4 +1,6 @@
 from conans import CMake, ConanFile, tools
+from conans.errors import ConanInvalidConfiguration
+import hashlib
 import os
 
 
@@ -9,18 +11,24 @@ class MBedTLSConan(ConanFile):
     url = "https://github.com/conan-io/conan-center-index"
     homepage = "https://tls.mbed.org"
     license = ("GPL-2.0", "Apache-2.0",)
-    exports_sources = "CMakeLists.txt", "patches/**"
+    exports_sources = "CMakeLists.txt", "patches/**", "profiles/*"
     generators = "cmake"
     settings = "os", "compiler", "build_type", "arch"
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
         "with_zlib": [True, False],
+        "config_profile": ["default", "performance", "small"],
+        "user_config_file": "ANY",
+        "benchmark": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "with_zlib": True,
+        "config_profile": "default",
+        "user_config_file": None,
+        "benchmark": False,
     }
     _source_subfolder = "source_subfolder"
 
@@ -39,6 +47,8 @@ class MBedTLSConan(ConanFile):
     def configure(self):
         del self.settings.compiler.cppstd
         del self.settings.compiler.libcxx
+        if self.options.user_config_file and not os.path.isfile(str(self.options.user_config_file)):
+            raise ConanInvalidConfiguration("user_config_file {} doesn't exist".format(self.options.user_config_file))
 
     def requirements(self):
         if self.options.with_zlib:
@@ -54,7 +64,7 @@ class MBedTLSConan(ConanFile):
         cmake.definitions["USE_SHARED_MBEDTLS_LIBRARY"] = self.options.shared
         cmake.definitions["USE_STATIC_MBEDTLS_LIBRARY"] = not self.options.shared
         cmake.definitions["ENABLE_ZLIB_SUPPORT"] = self.options.with_zlib
-        cmake.definitions["ENABLE_PROGRAMS"] = False
+        cmake.definitions["ENABLE_PROGRAMS"] = self.options.benchmark
         cmake.definitions["ENABLE_TESTING"] = False
 
         cmake.configure()
@@ -64,10 +74,25 @@ class MBedTLSConan(ConanFile):
     def build(self):
         for patch in self.conan_data["patches"][self.version]:
             tools.patch(**patch)
+        self._patch_config()
 
         cmake = self._configure_cmake()
         cmake.build()
 
+    def _patch_config(self):
+        # The profile and the user configuration are appended to the installed config.h,
+        # so that consumers are always compiled with the configuration of the library
+        overrides = []
+        if self.options.config_profile != "default":
+            overrides.append(tools.load(os.path.join(self.source_folder, "profiles",
+                                                     "{}.h".format(self.options.config_profile))))
+        if self.options.user_config_file:
+            overrides.append(tools.load(str(self.options.user_config_file)))
+        if overrides:
+            tools.replace_in_file(os.path.join(self._source_subfolder, "include", "mbedtls", "config.h"),
+                                  '#include "check_config.h"',
+                                  "\n".join(overrides) + '\n#include "check_config.h"')
+
     def package(self):
         self.copy("LICENSE", src=os.path.join(self.source_folder, self._source_subfolder), dst="licenses")
         if self._license == "gpl":
@@ -78,8 +103,24 @@ class MBedTLSConan(ConanFile):
         cmake.install()
 
         tools.rmdir(os.path.join(self.package_folder, "lib", "pkgconfig"))
+        if self.options.benchmark:
+            # ENABLE_PROGRAMS installs all the sample programs, keep only programs/test/benchmark
+            bin_folder = os.path.join(self.package_folder, "bin")
+            for filename in os.listdir(bin_folder):
+                if os.path.splitext(filename)[0] != "benchmark" and not filename.endswith(".dll"):
+                    os.remove(os.path.join(bin_folder, filename))
+
+    def package_id(self):
+        # the content of the user configuration, not its path, defines the package
+        if self.options.user_config_file:
+            self.info.options.user_config_file = hashlib.sha256(
+                tools.load(str(self.options.user_config_file)).encode()).hexdigest()
 
     def package_info(self):
         self.cpp_info.names["cmake_find_package"] = "MbedTLS"
         self.cpp_info.names["cmake_find_package_multi"] = "MbedTLS"
         self.cpp_info.libs = ["mbedtls", "mbedx509", "mbedcrypto", ]
+        if self.options.benchmark:
+            bin_path = os.path.join(self.package_folder, "bin")
+            self.output.info("Appending PATH environment variable: {}".format(bin_path))
+            self.env_info.PATH.append(bin_path)
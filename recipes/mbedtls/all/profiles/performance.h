@@ -0,0 +1,21 @@
+/* Performance profile: assembly, hardware acceleration and the largest precomputation windows */
+
+#define MBEDTLS_HAVE_ASM
+#define MBEDTLS_AESNI_C
+#define MBEDTLS_PADLOCK_C
+#undef MBEDTLS_AES_ROM_TABLES
+#undef MBEDTLS_AES_FEWER_TABLES
+#undef MBEDTLS_SHA256_SMALLER
+
+#undef MBEDTLS_MPI_WINDOW_SIZE
+#define MBEDTLS_MPI_WINDOW_SIZE 6
+#undef MBEDTLS_ECP_WINDOW_SIZE
+#define MBEDTLS_ECP_WINDOW_SIZE 7
+#undef MBEDTLS_ECP_FIXED_POINT_OPTIM
+#define MBEDTLS_ECP_FIXED_POINT_OPTIM 1
+#define MBEDTLS_ECP_NIST_OPTIM
+
+/* Session resumption, sparing full handshakes */
+#define MBEDTLS_SSL_CACHE_C
+#define MBEDTLS_SSL_SESSION_TICKETS
+#define MBEDTLS_SSL_TICKET_C
@@ -15,3 +15,5 @@ class TestPackageConan(ConanFile):
         if not tools.cross_building(self.settings):
             bin_path = os.path.join("bin", "test_package")
             self.run(bin_path, run_environment=True)
+            if self.options["mbedtls"].benchmark:
+                self.run("benchmark aes_cbc aes_gcm chachapoly sha256 rsa ecdsa ecdh", run_environment=True)
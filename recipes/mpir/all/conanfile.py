@@ -12,8 +12,8 @@ class MpirConan(ConanFile):
     homepage = "http://mpir.org/"
     license = "LGPL-3.0-or-later"
     settings = "os", "compiler", "arch", "build_type"
-    options = {"shared": [True, False], "fPIC": [True, False]}
-    default_options = {"shared": False, "fPIC": True}
+    options = {"shared": [True, False], "fPIC": [True, False], "fat": [True, False], "host_cpu": "ANY"}
+    default_options = {"shared": False, "fPIC": True, "fat": False, "host_cpu": None}
     _source_subfolder = "source_subfolder"
     _platforms = {'x86': 'Win32', 'x86_64': 'x64'}
     _autotools = None
@@ -24,6 +24,13 @@ class MpirConan(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        # --enable-fat is only implemented for x86, and not by the Visual Studio projects
+        if self.settings.arch not in ["x86", "x86_64"] or self.settings.compiler == "Visual Studio":
+            del self.options.fat
+
+    def configure(self):
+        if self.options.get_safe("fat") and self.options.host_cpu:
+            raise ConanInvalidConfiguration("fat and host_cpu can't be used together, fat selects the cpu at runtime")
 
     @property
     def _dll_or_lib(self):
@@ -33,8 +40,24 @@ class MpirConan(ConanFile):
     def _vcxproj_path(self):
         compiler_version = self.settings.compiler.version if tools.Version(self.settings.compiler.version) < "16" else "15"
         return os.path.join(self._source_subfolder,"build.vc{}".format(compiler_version),
-                                                   "{}_mpir_gc".format(self._dll_or_lib),
-                                                   "{}_mpir_gc.vcxproj".format(self._dll_or_lib))
+                                                   "{}_mpir_{}".format(self._dll_or_lib, self._vs_cpu),
+                                                   "{}_mpir_{}.vcxproj".format(self._dll_or_lib, self._vs_cpu))
+
+    @property
+    def _vs_cpu(self):
+        # generic C, or the project of a cpu, e.g. haswell or skylake
+        return str(self.options.host_cpu) if self.options.host_cpu else "gc"
+
+    @property
+    def _host_triplet(self):
+        """<host_cpu>-<vendor>-<os> pinning the mpn kernels to host_cpu (e.g. haswell, skylake, bulldozer)"""
+        if not self.options.host_cpu:
+            return None
+        triplet = tools.get_gnu_triplet(str(self.settings.os), str(self.settings.arch), str(self.settings.compiler))
+        system = triplet.split("-", 1)[1]
+        if system.count("-") == 0 or system.startswith("linux"):
+            system = "pc-" + system if self.settings.arch in ["x86", "x86_64"] else "unknown-" + system
+        return "{}-{}".format(self.options.host_cpu, system)
 
     def source(self):
         tools.get(keep_permissions=True, **self.conan_data["sources"][self.version])
@@ -64,7 +87,13 @@ class MpirConan(ConanFile):
                 args.extend(['--disable-shared', '--enable-static'])
 
             args.extend(['--disable-silent-rules', '--enable-gmpcompat', '--enable-cxx'])
-            self._autotools.configure(args=args)
+            if self.options.get_safe("fat"):
+                # mpn kernels of all the x86 microarchitectures, selected at load time from cpuid
+                args.append('--enable-fat')
+            # Without fat or host_cpu, the build is tuned for the cpu of the build machine
+            host = self._host_triplet
+            build = None if tools.cross_building(self.settings) else host
+            self._autotools.configure(args=args, build=build, host=host)
         return self._autotools
 
     def build(self):
@@ -0,0 +1,42 @@
+#include <stdio.h>
+#include <time.h>
+#include <mpir.h>
+
+/* Multiplies random integers of several sizes, reports the time per multiplication */
+int main(void)
+{
+    static const unsigned long sizes[] = {1000, 10000, 100000, 1000000, 10000000};
+    gmp_randstate_t state;
+    mpz_t a, b, c;
+    size_t i;
+
+    printf("MPIR %s, %d-bit limbs\n", mpir_version, mp_bits_per_limb);
+#ifdef __GMP_CFLAGS
+    printf("CFLAGS: %s\n", __GMP_CFLAGS);
+#endif
+
+    gmp_randinit_default(state);
+    mpz_init(a);
+    mpz_init(b);
+    mpz_init(c);
+    for (i = 0; i < sizeof(sizes) / sizeof(sizes[0]); ++i) {
+        unsigned long iterations = 0;
+        double elapsed;
+        clock_t start;
+
+        mpz_urandomb(a, state, sizes[i]);
+        mpz_urandomb(b, state, sizes[i]);
+        start = clock();
+        do {
+            mpz_mul(c, a, b);
+            ++iterations;
+            elapsed = (double)(clock() - start) / CLOCKS_PER_SEC;
+        } while (elapsed < 0.2);
+        printf("mpz_mul %9lu bits: %12.3f us\n", sizes[i], 1e6 * elapsed / iterations);
+    }
+    mpz_clear(a);
+    mpz_clear(b);
+    mpz_clear(c);
+    gmp_randclear(state);
+    return 0;
+}
@@ -17,3 +17,7 @@ class TestPackageConan(ConanFile):
             if tools.os_info.is_windows:
                 bin_path += ".exe"
             self.run(bin_path, run_environment=True)
+            bin_path = os.path.join("bin", "benchmark")
+            if tools.os_info.is_windows:
+                bin_path += ".exe"
+            self.run(bin_path, run_environment=True)
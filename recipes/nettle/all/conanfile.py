@@ -15,11 +15,21 @@ class NettleTLS(ConanFile):
         "shared": [True, False],
         "fPIC": [True, False],
         "public_key": [True, False],
+        "fat": [True, False],
+        "x86_aesni": [True, False],
+        "x86_sha_ni": [True, False],
+        "arm_neon": [True, False],
+        "benchmark": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "public_key": True,
+        "fat": True,
+        "x86_aesni": False,
+        "x86_sha_ni": False,
+        "arm_neon": False,
+        "benchmark": False,
     }
 
     _autotools = None
@@ -28,6 +38,14 @@ class NettleTLS(ConanFile):
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        # Accelerated implementations selected at runtime, only for x86_64 and arm in nettle 3.5
+        if self.settings.arch != "x86_64" and not str(self.settings.arch).startswith("armv7"):
+            del self.options.fat
+        if self.settings.arch != "x86_64":
+            del self.options.x86_aesni
+            del self.options.x86_sha_ni
+        if not str(self.settings.arch).startswith("armv7"):
+            del self.options.arm_neon
 
     def requirements(self):
         if self.options.public_key:
@@ -40,6 +58,10 @@ class NettleTLS(ConanFile):
             raise ConanInvalidConfiguration("Nettle cannot be built using Visual Studio")
         del self.settings.compiler.libcxx
         del self.settings.compiler.cppstd
+        if self.options.get_safe("fat") and \
+                (self.options.get_safe("x86_aesni") or self.options.get_safe("x86_sha_ni") or self.options.get_safe("arm_neon")):
+            raise ConanInvalidConfiguration("fat already selects the accelerated implementations at runtime, "
+                                            "x86_aesni, x86_sha_ni and arm_neon make them unconditional and require fat=False")
 
     def source(self):
         tools.get(**self.conan_data["sources"][self.version])
@@ -60,10 +82,17 @@ class NettleTLS(ConanFile):
             conf_args.extend(["--enable-shared", "--disable-static"])
         else:
             conf_args.extend(["--disable-shared", "--enable-static"])
-        if self.settings.arch == "x86_64":
+        if self.options.get_safe("fat"):
+            conf_args.append("--enable-fat")
+        if self.options.get_safe("x86_aesni"):
             conf_args.append("--enable-x86-aesni")
-            if self.version >= "3.5":
-                conf_args.append("--enable-x86-sha-ni")
+        if self.options.get_safe("x86_sha_ni"):
+            conf_args.append("--enable-x86-sha-ni")
+        if self.options.get_safe("arm_neon"):
+            conf_args.append("--enable-arm-neon")
+        if self.options.benchmark:
+            # nettle-benchmark would also compare with the system openssl
+            conf_args.append("--disable-openssl")
         self._autotools.configure(args=conf_args, configure_dir=self._source_subfolder)
         return self._autotools
 
@@ -77,14 +106,23 @@ class NettleTLS(ConanFile):
         self._patch_sources()
         autotools = self._configure_autotools()
         autotools.make()
+        if self.options.benchmark:
+            autotools.make(args=["-C", "examples"], target="nettle-benchmark")
 
     def package(self):
         self.copy(pattern="COPYING*", src=self._source_subfolder, dst="licenses")
         autotools = self._configure_autotools()
         autotools.install()
+        if self.options.benchmark:
+            self.copy("nettle-benchmark", src="examples", dst="bin", keep_path=False)
+            self.copy("nettle-benchmark.exe", src="examples", dst="bin", keep_path=False)
         tools.rmdir(os.path.join(self.package_folder, "lib", "pkgconfig"))
         tools.rmdir(os.path.join(self.package_folder, "share"))
 
     def package_info(self):
         self.cpp_info.libs = ["hogweed", "nettle"]
         self.cpp_info.includedirs.append(os.path.join("include", "nettle"))
+        if self.options.benchmark:
+            bin_path = os.path.join(self.package_folder, "bin")
+            self.output.info("Appending PATH environment variable: {}".format(bin_path))
+            self.env_info.PATH.append(bin_path)
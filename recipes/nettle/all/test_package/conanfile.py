@@ -1,4 +1,4 @@
-from conans import ConanFile, CMake
+from conans import ConanFile, CMake, tools
 import os
 
 
@@ -12,5 +12,10 @@ class TestPackageConan(ConanFile):
         cmake.build()
 
     def test(self):
-        bin_path = os.path.join("bin", "test_package")
-        self.run(bin_path, run_environment=True)
+        # With fat, libnettle reports the cpu features and the implementations it selected
+        with tools.environment_append({"NETTLE_FAT_VERBOSE": "1"}):
+            bin_path = os.path.join("bin", "test_package")
+            self.run(bin_path, run_environment=True)
+            if self.options["nettle"].benchmark and not tools.cross_building(self.settings):
+                self.run("nettle-benchmark aes", run_environment=True)
+                self.run("nettle-benchmark sha", run_environment=True)
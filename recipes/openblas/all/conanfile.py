@@ -1,4 +1,4 @@
-from conans import ConanFile, CMake, tools
+from conans import ConanFile, tools
 import os
 
 
@@ -30,6 +30,7 @@ class OpenblasConan(ConanFile):
     }
     exports_sources = ["CMakeLists.txt"]
     generators = "cmake"
+    python_requires = "cci-cmake/1.0", "cci-sources/1.0"
 
     _cmake = None
     _source_subfolder = "source_subfolder"
@@ -40,13 +41,16 @@ class OpenblasConan(ConanFile):
             del self.options.fPIC
 
     def source(self):
-        tools.get(**self.conan_data["sources"][self.version])
+        self.python_requires["cci-sources"].module.get(self, **self.conan_data["sources"][self.version])
         os.rename('OpenBLAS-{}'.format(self.version), self._source_subfolder)
 
+    def build_requirements(self):
+        self.python_requires["cci-cmake"].module.build_requirements(self)
+
     def _configure_cmake(self):
         if self._cmake:
             return self._cmake
-        self._cmake = CMake(self)
+        self._cmake = self.python_requires["cci-cmake"].module.cmake(self)
         if self.options.build_lapack:
             self.output.warn("Building with lapack support requires a Fortran compiler.")
 
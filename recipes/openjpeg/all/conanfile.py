@@ -8,8 +8,8 @@ class OpenjpegConan(ConanFile):
     url = "https://github.com/conan-io/conan-center-index"
     description = "OpenJPEG is an open-source JPEG 2000 codec written in C language."
     topics = ("conan", "jpeg2000", "jp2", "openjpeg", "image", "multimedia", "format", "graphics")
-    options = {"shared": [True, False], "build_codec": [True, False], "fPIC": [True, False]}
-    default_options = {'shared': False, 'build_codec': True, 'fPIC': True}
+    options = {"shared": [True, False], "build_codec": [True, False], "fPIC": [True, False], "threads": [True, False]}
+    default_options = {'shared': False, 'build_codec': False, 'fPIC': True, 'threads': True}
     settings = "os", "compiler", "build_type", "arch"
     generators = "cmake", "cmake_find_package"
     homepage = "https://github.com/uclouvain/openjpeg"
@@ -26,6 +26,13 @@ class OpenjpegConan(ConanFile):
         del self.settings.compiler.libcxx
         del self.settings.compiler.cppstd
 
+    def requirements(self):
+        if self.options.build_codec:
+            self.requires("lcms/2.9")
+            self.requires("libpng/1.6.37")
+            self.requires("libtiff/4.1.0")
+            self.requires("zlib/1.2.11")
+
     def source(self):
         tools.get(**self.conan_data["sources"][self.version])
         extracted_dir = self.name + "-" + self.version
@@ -37,7 +44,14 @@ class OpenjpegConan(ConanFile):
         cmake.definitions['BUILD_STATIC_LIBS'] = not self.options.shared
         cmake.definitions['BUILD_PKGCONFIG_FILES'] = False
         cmake.definitions['CMAKE_INSTALL_SYSTEM_RUNTIME_LIBS_SKIP'] = True
-        cmake.definitions['BUILD_CODEC'] = False
+        cmake.definitions['BUILD_CODEC'] = self.options.build_codec
+        cmake.definitions['BUILD_THIRDPARTY'] = False
+        cmake.definitions['BUILD_MJ2'] = False
+        cmake.definitions['BUILD_JPWL'] = False
+        cmake.definitions['BUILD_JPIP'] = False
+        cmake.definitions['BUILD_JAVA'] = False
+        # thread pool used by opj_codec_set_threads() for multi-threaded tile decoding
+        cmake.definitions['OPJ_USE_THREAD'] = self.options.threads
 
         cmake.configure()
         return cmake
@@ -68,13 +82,6 @@ class OpenjpegConan(ConanFile):
                               'set(LCMS_INCLUDE_DIRNAME ${LCMS2_INCLUDE_DIRS} PARENT_SCOPE)',
                               'set(LCMS_INCLUDE_DIRNAME ${lcms_INCLUDE_DIRS} PARENT_SCOPE)')
 
-        # avoid always linking PNG
-        tools.save(os.path.join(self._source_subfolder, 'thirdparty', 'CMakeLists.txt'),
-                   'set(OPJ_HAVE_PNG_H 0 PARENT_SCOPE)\n' \
-                   'set(OPJ_HAVE_LIBPNG 0 PARENT_SCOPE)\n' \
-                   'set(PNG_LIBNAME "" PARENT_SCOPE)\n',
-                   append=True)
-
         # fix missing TIFF_INCLUDE_DIR by cmake generator
         tools.replace_in_file(os.path.join(self._source_subfolder, 'thirdparty', 'CMakeLists.txt'),
                               'set(TIFF_INCLUDE_DIRNAME ${TIFF_INCLUDE_DIR} PARENT_SCOPE)',
@@ -101,9 +108,13 @@ class OpenjpegConan(ConanFile):
         if not self.options.shared:
             self.cpp_info.defines.append('OPJ_STATIC')
         if self.settings.os == "Linux":
-            self.cpp_info.system_libs = ["pthread", "m"]
+            self.cpp_info.system_libs = ["pthread", "m"] if self.options.threads else ["m"]
         elif self.settings.os == "Android":
             self.cpp_info.system_libs = ["m"]
         self.cpp_info.names["cmake_find_package"] = "OpenJPEG"
         self.cpp_info.names["cmake_find_package_multi"] = "OpenJPEG"
         self.cpp_info.names['pkg_config'] = 'libopenjp2'
+        if self.options.build_codec:
+            bin_path = os.path.join(self.package_folder, "bin")
+            self.output.info("Appending PATH environment variable: {}".format(bin_path))
+            self.env_info.PATH.append(bin_path)
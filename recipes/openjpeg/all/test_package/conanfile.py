@@ -1,5 +1,6 @@
 from conans import ConanFile, CMake, tools
 import os
+import time
 
 
 class TestPackageConan(ConanFile):
@@ -8,10 +9,27 @@ class TestPackageConan(ConanFile):
 
     def build(self):
         cmake = CMake(self)
+        cmake.definitions["OPENJPEG_WITH_THREADS"] = self.options["openjpeg"].threads
         cmake.configure()
         cmake.build()
 
+    def _write_pgm(self, path, width, height):
+        pixels = bytearray((x * 7 + y * 13 + (x * y >> 5)) & 0xff for y in range(height) for x in range(width))
+        with open(path, "wb") as f:
+            f.write("P5\n{} {}\n255\n".format(width, height).encode())
+            f.write(pixels)
+
+    def _benchmark_decompress(self):
+        self._write_pgm("image.pgm", 2048, 2048)
+        self.run("opj_compress -i image.pgm -o image.j2k -t 256,256", run_environment=True)
+        for threads in sorted({1, 2, tools.cpu_count()}):
+            start = time.time()
+            self.run("opj_decompress -i image.j2k -o decoded.pgm -threads {}".format(threads), run_environment=True)
+            self.output.info("opj_decompress with {} threads: {:.3f} s".format(threads, time.time() - start))
+
     def test(self):
         if not tools.cross_building(self.settings):
             bin_path = os.path.join("bin", "test_package")
             self.run(bin_path, run_environment=True)
+            if self.options["openjpeg"].build_codec:
+                self._benchmark_decompress()
@@ -7,5 +7,12 @@ int main() {
     std::cout << "opj_has_thread_support: " << opj_has_thread_support() << std::endl;
     std::cout << "opj_get_num_cpus: " << opj_get_num_cpus() << std::endl;
 
+#ifdef OPENJPEG_WITH_THREADS
+    if (!opj_has_thread_support()) {
+        std::cerr << "openjpeg was built without thread support" << std::endl;
+        return EXIT_FAILURE;
+    }
+#endif
+
     return EXIT_SUCCESS;
 }
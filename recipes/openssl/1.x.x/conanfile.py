@@ -66,6 +66,7 @@ class OpenSSLConan(ConanFile):
     license = "OpenSSL"
     topics = ("conan", "openssl", "ssl", "tls", "encryption", "security")
     description = "A toolkit for the Transport Layer Security (TLS) and Secure Sockets Layer (SSL) protocols"
+    python_requires = "cci-timing/1.0"
     options = {"no_threads": [True, False],
                "no_zlib": [True, False],
                "shared": [True, False],
@@ -90,6 +91,7 @@ class OpenSSLConan(ConanFile):
                "no_async": [True, False],
                "no_dso": [True, False],
                "capieng_dialog": [True, False],
+               "no_programs": [True, False],
                "openssldir": "ANY"}
     default_options = {key: False for key in options.keys()}
     default_options["fPIC"] = True
@@ -127,6 +129,9 @@ class OpenSSLConan(ConanFile):
     def _full_version(self):
         return OpenSSLVersion(self.version)
 
+    def init(self):
+        self.python_requires["cci-timing"].module.instrument(self)
+
     def source(self):
         try:
             tools.get(**self.conan_data["sources"][self.version])
@@ -147,6 +152,8 @@ class OpenSSLConan(ConanFile):
             del self.options.no_md2
             del self.options.no_rc4
             del self.options.no_rc5
+        if self._full_version < "1.1.1":
+            del self.options.no_programs
 
     def config_options(self):
         if self.settings.os != "Windows":
@@ -555,7 +562,8 @@ class OpenSSLConan(ConanFile):
             if self._use_nmake and self._full_version >= "1.1.0":
                 self._replace_runtime_in_file(os.path.join("Configurations", "10-main.conf"))
 
-            self.run('{perl} ./Configure {args}'.format(perl=self._perl, args=args), win_bash=self._win_bash)
+            with self.python_requires["cci-timing"].module.phase(self, "configure"):
+                self.run('{perl} ./Configure {args}'.format(perl=self._perl, args=args), win_bash=self._win_bash)
 
             self._patch_install_name()
 
@@ -573,7 +581,24 @@ class OpenSSLConan(ConanFile):
 
                 self._run_make(makefile=self._nmake_makefile)
             else:
-                self._run_make()
+                self._run_make(targets=self._build_targets)
+
+    @property
+    def _build_targets(self):
+        # the default target of 1.1.x also generates the man pages with pod2man (build_docs)
+        if self._full_version < "1.1.0":
+            return None
+        targets = ["build_libs", "build_engines"]
+        if not self.options.get_safe("no_programs"):
+            targets.append("build_programs")
+        return targets
+
+    @property
+    def _install_targets(self):
+        if self.options.get_safe("no_programs"):
+            # install_sw = install_dev + install_engines + install_runtime (the programs)
+            return ["install_dev", "install_engines"]
+        return ["install_sw"]
 
     def _make_install(self):
         with tools.chdir(self._source_subfolder):
@@ -584,7 +609,8 @@ class OpenSSLConan(ConanFile):
             if self._use_nmake and self._full_version < "1.1.0":
                 self._run_make(makefile=self._nmake_makefile, targets=["install"], parallel=False)
             else:
-                self._run_make(targets=["install_sw"], parallel=False)
+                # the install targets of 1.1.1 only depend on the build targets and can run in parallel
+                self._run_make(targets=self._install_targets, parallel=self._full_version >= "1.1.1")
 
     @property
     def _cc(self):
@@ -1,4 +1,5 @@
 from conans import ConanFile, CMake, tools
+from conans.errors import ConanInvalidConfiguration
 import os
 
 
@@ -22,13 +23,24 @@ class PCREConan(ConanFile):
         "with_utf": [True, False],
         "with_unicode_properties": [True, False]
     }
-    default_options = {'shared': False, 'fPIC': True, 'with_bzip2': True, 'with_zlib': True, 'with_jit': False, 'build_pcrecpp': False, 'build_pcregrep': False, 'with_utf': False, 'with_unicode_properties': False}
+    default_options = {'shared': False, 'fPIC': True, 'with_bzip2': True, 'with_zlib': True, 'with_jit': True, 'build_pcrecpp': False, 'build_pcregrep': False, 'with_utf': False, 'with_unicode_properties': False}
     _source_subfolder = "source_subfolder"
     _build_subfolder = "build_subfolder"
 
+    @property
+    def _jit_supported(self):
+        # architectures of the sljit compiler bundled with pcre 8.x
+        # Apple mobile platforms don't allow to map executable memory
+        return str(self.settings.arch) in ["x86", "x86_64", "armv5el", "armv5hf", "armv6", "armv7", "armv7hf",
+                                           "armv7s", "armv7k", "armv8", "armv8.3", "ppc32", "ppc32be",
+                                           "ppc64", "ppc64le", "mips", "mips64", "sparc"] and \
+            self.settings.os not in ["iOS", "watchOS", "tvOS"]
+
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if not self._jit_supported:
+            self.options.with_jit = False
 
     def configure(self):
         if not self.options.build_pcrecpp:
@@ -36,6 +48,8 @@ class PCREConan(ConanFile):
             del self.settings.compiler.cppstd
         if self.options.with_unicode_properties:
             self.options.with_utf = True
+        if self.options.with_jit and not self._jit_supported:
+            raise ConanInvalidConfiguration("pcre JIT is not supported on {} {}".format(self.settings.os, self.settings.arch))
 
     def patch_cmake(self):
         """Patch CMake file to avoid man and share during install stage
@@ -0,0 +1,113 @@
+/* Match throughput of a few log-processing patterns over a generated corpus,
+   with the interpreter and with the JIT compiler (when pcre supports it).
+
+       benchmark [--expect-jit] [lines]
+*/
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+#include "pcre.h"
+
+static const char *patterns[] = {
+    "\\b(?:\\d{1,3}\\.){3}\\d{1,3}\\b",
+    "\"(GET|POST|PUT|DELETE) ([^ \"]+) HTTP/1\\.[01]\" (5\\d\\d)",
+    "\\[(\\d{2})/(\\w{3})/(\\d{4}):(\\d{2}):(\\d{2}):(\\d{2})",
+    "(?i)\\b(error|fatal|timeout)\\b",
+    "[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
+    "user=([\\w.+-]+@[\\w-]+\\.[\\w.]+)",
+};
+
+static const char *methods[] = {"GET", "POST", "PUT", "DELETE"};
+static const char *paths[] = {"/", "/index.html", "/api/v1/users", "/api/v1/orders/42", "/static/app.js"};
+static const char *messages[] = {"ok", "slow request", "upstream timeout", "ERROR in handler", "cache miss"};
+
+static char *generate_corpus(int lines, size_t *size)
+{
+    char *corpus = malloc((size_t)lines * 256);
+    char *line = corpus;
+    int i;
+
+    srand(42);
+    for (i = 0; i < lines; ++i) {
+        int status = rand() % 10 == 0 ? 500 + rand() % 4 : 200;
+        line += sprintf(line, "10.%d.%d.%d - - [%02d/Oct/2020:%02d:%02d:%02d +0000] \"%s %s HTTP/1.1\" %d %d "
+                        "request_id=%08x-%04x-4%03x-a%03x-%012x user=user%d@example.com msg=\"%s\"\n",
+                        rand() % 256, rand() % 256, rand() % 256, 1 + rand() % 28, rand() % 24, rand() % 60, rand() % 60,
+                        methods[rand() % 4], paths[rand() % 5], status, rand() % 100000,
+                        (unsigned)rand(), rand() % 0x10000, rand() % 0x1000, rand() % 0x1000, (unsigned)rand(),
+                        rand() % 1000, messages[rand() % 5]);
+    }
+    *size = (size_t)(line - corpus);
+    return corpus;
+}
+
+/* Returns the throughput in MB/s of matching every line of the corpus, stores the number of matching lines */
+static double throughput(const pcre *re, const pcre_extra *extra, const char *corpus, size_t size, int *matches)
+{
+    int ovector[30];
+    const char *line = corpus;
+    const char *end = corpus + size;
+    clock_t start = clock();
+    double elapsed;
+
+    *matches = 0;
+    while (line < end) {
+        const char *eol = memchr(line, '\n', (size_t)(end - line));
+        if (pcre_exec(re, extra, line, (int)(eol - line), 0, 0, ovector, 30) >= 0)
+            ++*matches;
+        line = eol + 1;
+    }
+    elapsed = (double)(clock() - start) / CLOCKS_PER_SEC;
+    return elapsed > 0 ? size / elapsed / 1e6 : 0;
+}
+
+int main(int argc, char **argv)
+{
+    int expect_jit = argc > 1 && strcmp(argv[1], "--expect-jit") == 0;
+    int lines = argc > 1 + expect_jit ? atoi(argv[1 + expect_jit]) : 200000;
+    int jit = 0;
+    size_t size;
+    char *corpus;
+    size_t i;
+
+    pcre_config(PCRE_CONFIG_JIT, &jit);
+    printf("JIT: %s\n", jit ? "yes" : "no");
+    if (expect_jit && !jit) {
+        fprintf(stderr, "pcre was built without JIT support\n");
+        return EXIT_FAILURE;
+    }
+
+    corpus = generate_corpus(lines, &size);
+    printf("corpus: %d lines, %.1f MB\n", lines, size / 1e6);
+
+    for (i = 0; i < sizeof(patterns) / sizeof(patterns[0]); ++i) {
+        const char *error;
+        int error_offset;
+        int matches;
+        pcre_extra *extra;
+        pcre *re = pcre_compile(patterns[i], 0, &error, &error_offset, NULL);
+        if (re == NULL) {
+            fprintf(stderr, "%s: compilation failed at offset %d: %s\n", patterns[i], error_offset, error);
+            return EXIT_FAILURE;
+        }
+
+        printf("%s\n", patterns[i]);
+        extra = pcre_study(re, 0, &error);
+        printf("  interpreter: %8.1f MB/s", throughput(re, extra, corpus, size, &matches));
+        printf(" (%d matching lines)\n", matches);
+        pcre_free_study(extra);
+
+        if (jit) {
+            extra = pcre_study(re, PCRE_STUDY_JIT_COMPILE, &error);
+            printf("  JIT:         %8.1f MB/s", throughput(re, extra, corpus, size, &matches));
+            printf(" (%d matching lines)\n", matches);
+            pcre_free_study(extra);
+        }
+        pcre_free(re);
+    }
+
+    free(corpus);
+    return EXIT_SUCCESS;
+}
@@ -16,3 +16,7 @@ class TestPackageConan(ConanFile):
             bin_path = os.path.join("bin", "test_package")
             arguments = "%sw+ Bincrafters" % ("\\" if self.settings.os == "Windows" else "\\\\")
             self.run("%s %s" % (bin_path, arguments), run_environment=True)
+            bin_path = os.path.join("bin", "benchmark")
+            if self.options["pcre"].with_jit:
+                bin_path += " --expect-jit"
+            self.run(bin_path, run_environment=True)
@@ -17,6 +17,7 @@ class PhysXConan(ConanFile):
     url = "https://github.com/conan-io/conan-center-index"
     exports_sources = ["CMakeLists.txt", "patches/**"]
     generators = "cmake"
+    python_requires = "cci-microarch/1.0"
     settings = "os", "compiler", "arch", "build_type"
     short_paths = True
     no_copy_source = True
@@ -45,6 +46,9 @@ class PhysXConan(ConanFile):
     def _build_subfolder(self):
         return "build_subfolder"
 
+    def init(self):
+        self.python_requires["cci-microarch"].module.init(self)
+
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
@@ -56,6 +60,8 @@ class PhysXConan(ConanFile):
             del self.options.enable_simd
 
     def configure(self):
+        self.python_requires["cci-microarch"].module.configure(self, {"enable_simd": "simd"})
+
         if self.settings.os not in ["Windows", "Linux", "Macos", "Android", "iOS"]:
             raise ConanInvalidConfiguration("Current os is not supported")
 
@@ -186,6 +192,7 @@ class PhysXConan(ConanFile):
         self._cmake.definitions["PXSHARED_PATH"] = os.path.join(self.build_folder, self._source_subfolder, "pxshared").replace("\\", "/")
         self._cmake.definitions["PXSHARED_INSTALL_PREFIX"] = self.package_folder.replace("\\", "/")
         self._cmake.definitions["PX_GENERATE_SOURCE_DISTRO"] = False
+        self.python_requires["cci-microarch"].module.apply_cmake(self, self._cmake)
 
         # Options defined in externals/cmakemodules/NVidiaBuildOptions.cmake
         self._cmake.definitions["NV_APPEND_CONFIG_NAME"] = False
@@ -292,6 +299,17 @@ class PhysXConan(ConanFile):
         self.cpp_info.names["cmake_find_package"] = "PhysX"
         self.cpp_info.names["cmake_find_package_multi"] = "PhysX"
 
+        # Same configuration macros as the PhysX libraries, so that the instrumentation of
+        # the public headers (PX_PROFILE_ZONE, PVD, checks) matches the one of the package.
+        # Profiler zones are emitted by debug, checked and profile builds, to the callback
+        # registered with PxSetProfilerCallback() (or to PVD with PxPvdInstrumentationFlag::ePROFILE)
+        self.cpp_info.defines = {
+            "debug": ["PX_DEBUG=1", "PX_CHECKED=1"],
+            "checked": ["PX_CHECKED=1"],
+            "profile": ["PX_PROFILE=1"],
+            "release": [],
+        }.get(self._get_physx_build_type())
+
     def _get_cpp_info_ordered_libs(self):
         gen_libs = tools.collect_libs(self)
 
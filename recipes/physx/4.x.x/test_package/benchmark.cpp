@@ -0,0 +1,133 @@
+#include <algorithm>
+#include <chrono>
+#include <cmath>
+#include <cstdlib>
+#include <iostream>
+#include <map>
+#include <mutex>
+#include <string>
+#include <thread>
+#include <utility>
+#include <vector>
+
+#include "PxConfig.h"
+#include "PxPhysicsAPI.h"
+
+// Headless benchmark: boxes falling on a plane, simulated with PxDefaultCpuDispatcherCreate()
+// at 1..N worker threads. Debug, checked and profile builds of PhysX also report the time
+// spent in their profiler zones, collected with a PxProfilerCallback.
+//
+//   benchmark [bodies] [frames]
+
+using namespace physx;
+typedef std::chrono::steady_clock Clock;
+
+class ZoneTimer : public PxProfilerCallback {
+public:
+  void *zoneStart(const char *, bool, uint64_t) override {
+    return new Clock::time_point(Clock::now());
+  }
+
+  void zoneEnd(void *profilerData, const char *eventName, bool, uint64_t) override {
+    Clock::time_point *start = static_cast<Clock::time_point *>(profilerData);
+    const double elapsed = std::chrono::duration<double, std::milli>(Clock::now() - *start).count();
+    delete start;
+    std::lock_guard<std::mutex> lock(mMutex);
+    mTotals[eventName] += elapsed;
+  }
+
+  void reset() {
+    std::lock_guard<std::mutex> lock(mMutex);
+    mTotals.clear();
+  }
+
+  void report(PxU32 frames, size_t count) {
+    std::lock_guard<std::mutex> lock(mMutex);
+    std::vector<std::pair<double, std::string> > zones;
+    for (const auto &zone : mTotals) {
+      zones.push_back(std::make_pair(zone.second, zone.first));
+    }
+    std::sort(zones.rbegin(), zones.rend());
+    for (size_t i = 0; i < std::min(count, zones.size()); ++i) {
+      std::cout << "    " << zones[i].second << ": " << zones[i].first / frames << " ms/frame\n";
+    }
+  }
+
+private:
+  std::mutex mMutex;
+  std::map<std::string, double> mTotals;
+};
+
+static double frameTime(PxPhysics &physics, ZoneTimer &zoneTimer, PxU32 workers, PxU32 bodies, PxU32 frames) {
+  PxDefaultCpuDispatcher *dispatcher = PxDefaultCpuDispatcherCreate(workers);
+  PxSceneDesc sceneDesc(physics.getTolerancesScale());
+  sceneDesc.gravity = PxVec3(0.0f, -9.81f, 0.0f);
+  sceneDesc.cpuDispatcher = dispatcher;
+  sceneDesc.filterShader = PxDefaultSimulationFilterShader;
+  PxScene *scene = physics.createScene(sceneDesc);
+
+  PxMaterial *material = physics.createMaterial(0.5f, 0.5f, 0.6f);
+  std::vector<PxRigidActor *> actors;
+  actors.push_back(PxCreatePlane(physics, PxPlane(0, 1, 0, 0), *material));
+  scene->addActor(*actors.back());
+
+  PxShape *shape = physics.createShape(PxBoxGeometry(0.5f, 0.5f, 0.5f), *material);
+  const PxU32 side = PxU32(std::max(1.0, std::sqrt(bodies / 10.0)));
+  for (PxU32 i = 0; i < bodies; ++i) {
+    const PxU32 layer = i / (side * side);
+    const PxVec3 position(PxReal(i % side) * 1.1f, 0.5f + PxReal(layer) * 1.1f, PxReal((i / side) % side) * 1.1f);
+    PxRigidDynamic *body = physics.createRigidDynamic(PxTransform(position));
+    body->attachShape(*shape);
+    PxRigidBodyExt::updateMassAndInertia(*body, 10.0f);
+    scene->addActor(*body);
+    actors.push_back(body);
+  }
+  shape->release();
+
+  scene->simulate(1.0f / 60.0f);
+  scene->fetchResults(true);
+  zoneTimer.reset();
+  const Clock::time_point start = Clock::now();
+  for (PxU32 i = 0; i < frames; ++i) {
+    scene->simulate(1.0f / 60.0f);
+    scene->fetchResults(true);
+  }
+  const double elapsed = std::chrono::duration<double, std::milli>(Clock::now() - start).count();
+
+  for (PxRigidActor *actor : actors) {
+    actor->release();
+  }
+  material->release();
+  scene->release();
+  dispatcher->release();
+  return elapsed / frames;
+}
+
+int main(int argc, char **argv) {
+  const PxU32 bodies = argc > 1 ? PxU32(std::atoi(argv[1])) : 4000;
+  const PxU32 frames = argc > 2 ? PxU32(std::atoi(argv[2])) : 100;
+  const PxU32 maxWorkers = std::max(1u, std::thread::hardware_concurrency());
+
+  PxDefaultAllocator allocator;
+  PxDefaultErrorCallback errorCallback;
+  ZoneTimer zoneTimer;
+  PxFoundation *foundation = PxCreateFoundation(PX_PHYSICS_VERSION, allocator, errorCallback);
+  PxSetProfilerCallback(&zoneTimer);
+  PxPhysics *physics = PxCreatePhysics(PX_PHYSICS_VERSION, *foundation, PxTolerancesScale());
+
+  std::cout << bodies << " rigid bodies, " << frames << " frames\n";
+  for (PxU32 workers = 1;; workers = std::min(workers * 2, maxWorkers)) {
+    std::cout << "  " << workers << " workers: " << frameTime(*physics, zoneTimer, workers, bodies, frames) << " ms/frame\n";
+#if PX_DEBUG || PX_CHECKED || PX_PROFILE
+    zoneTimer.report(frames, 5);
+#endif
+    if (workers == maxWorkers) {
+      break;
+    }
+  }
+
+  physics->release();
+  PxSetProfilerCallback(NULL);
+  foundation->release();
+  return 0;
+}
@@ -17,3 +17,5 @@ class TestPackageConan(ConanFile):
         if not tools.cross_building(self.settings):
             bin_path = os.path.join("bin", "test_package")
             self.run(bin_path, run_environment=True)
+            bin_path = os.path.join("bin", "benchmark")
+            self.run(bin_path, run_environment=True)
@@ -1,5 +1,5 @@
 import os
-from conans import ConanFile, CMake, tools
+from conans import ConanFile, tools
 from conans.errors import ConanInvalidConfiguration
 from conans.tools import Version
 
@@ -14,6 +14,7 @@ class ProtobufConan(ConanFile):
     license = "BSD-3-Clause"
     exports_sources = ["CMakeLists.txt", "patches/*"]
     generators = "cmake"
+    python_requires = "cci-cmake/1.0", "cci-sources/1.0", "cci-timing/1.0"
     short_paths = True
     settings = "os", "arch", "compiler", "build_type"
     options = {"shared": [True, False], "with_zlib": [
@@ -33,8 +34,11 @@ class ProtobufConan(ConanFile):
     def _is_clang_x86(self):
         return self.settings.compiler == "clang" and self.settings.arch == "x86"
 
+    def init(self):
+        self.python_requires["cci-timing"].module.instrument(self)
+
     def source(self):
-        tools.get(**self.conan_data["sources"][self.version])
+        self.python_requires["cci-sources"].module.get(self, **self.conan_data["sources"][self.version])
         extracted_folder = self.name + "-" + self.version
         os.rename(extracted_folder, self._source_subfolder)
 
@@ -50,8 +54,11 @@ class ProtobufConan(ConanFile):
         if self.options.with_zlib:
             self.requires("zlib/1.2.11")
 
+    def build_requirements(self):
+        self.python_requires["cci-cmake"].module.build_requirements(self)
+
     def _configure_cmake(self):
-        cmake = CMake(self)
+        cmake = self.python_requires["cci-cmake"].module.cmake(self)
         cmake.definitions["protobuf_BUILD_TESTS"] = False
         cmake.definitions["protobuf_WITH_ZLIB"] = self.options.with_zlib
         cmake.definitions["protobuf_BUILD_PROTOC_BINARIES"] = not self.options.lite
@@ -16,11 +16,21 @@ class QuillConan(ConanFile):
 
     options = {"fPIC": [True, False],
                "with_bounded_queue": [True, False],
-               "with_no_exceptions": [True, False]}
+               "with_no_exceptions": [True, False],
+               "queue_capacity": "ANY",
+               "clock": ["rdtsc", "chrono"],
+               "rdtsc_resync_interval": "ANY",
+               "backend_thread_sleep_duration": "ANY",
+               "backend_thread_cpu_affinity": "ANY"}
 
     default_options = {"fPIC": True,
                        "with_bounded_queue": False,
-                       "with_no_exceptions": False}
+                       "with_no_exceptions": False,
+                       "queue_capacity": "default",
+                       "clock": "rdtsc",
+                       "rdtsc_resync_interval": "default",
+                       "backend_thread_sleep_duration": "default",
+                       "backend_thread_cpu_affinity": "default"}
 
     _cmake = None
 
@@ -63,6 +73,41 @@ class QuillConan(ConanFile):
                     "The compiler {} {} does not support C++14".format(self.settings.compiler,
                                                                        self.settings.compiler.version))
 
+        for option in ["queue_capacity", "rdtsc_resync_interval", "backend_thread_sleep_duration", "backend_thread_cpu_affinity"]:
+            value = str(self.options.get_safe(option))
+            if value != "default" and not value.isdigit():
+                raise ConanInvalidConfiguration("{} must be a number or 'default'".format(option))
+        queue_capacity = str(self.options.queue_capacity)
+        if queue_capacity != "default" and (int(queue_capacity) == 0 or int(queue_capacity) & (int(queue_capacity) - 1)):
+            raise ConanInvalidConfiguration("queue_capacity must be a power of two")
+
+    @property
+    def _abi_defines(self):
+        # change the queue and log record types seen by the logging threads
+        defines = []
+        if self.options.with_bounded_queue:
+            defines.append("QUILL_USE_BOUNDED_QUEUE")
+        if self.options.with_no_exceptions:
+            defines.append("QUILL_NO_EXCEPTIONS")
+        if self.options.queue_capacity != "default":
+            defines.append("QUILL_QUEUE_CAPACITY={}".format(self.options.queue_capacity))
+        if self.options.clock == "chrono":
+            defines.append("QUILL_CHRONO_CLOCK")
+        return defines
+
+    @property
+    def _backend_defines(self):
+        # only used by the backend thread, compiled in the library
+        defines = []
+        if self.options.rdtsc_resync_interval != "default":
+            defines.append("QUILL_RDTSC_RESYNC_INTERVAL={}".format(self.options.rdtsc_resync_interval))
+        if self.options.backend_thread_sleep_duration != "default":
+            # nanoseconds, 0 makes the backend thread yield instead of sleeping
+            defines.append("QUILL_BACKEND_THREAD_SLEEP_DURATION={}".format(self.options.backend_thread_sleep_duration))
+        if self.options.backend_thread_cpu_affinity != "default":
+            defines.append("QUILL_BACKEND_THREAD_CPU_AFFINITY={}".format(self.options.backend_thread_cpu_affinity))
+        return defines
+
     def requirements(self):
         self.requires("fmt/6.1.2")
 
@@ -80,6 +125,7 @@ class QuillConan(ConanFile):
         self._cmake.definitions["QUILL_ENABLE_INSTALL"] = True
         self._cmake.definitions["QUILL_USE_BOUNDED_QUEUE"] = self.options.with_bounded_queue
         self._cmake.definitions["QUILL_NO_EXCEPTIONS"] = self.options.with_no_exceptions
+        self._cmake.definitions["CONAN_QUILL_DEFINITIONS"] = ";".join("-D" + define for define in self._abi_defines + self._backend_defines)
         self._cmake.configure(build_folder=self._build_subfolder)
 
         return self._cmake
@@ -103,7 +149,7 @@ class QuillConan(ConanFile):
 
     def package_info(self):
         self.cpp_info.libs = tools.collect_libs(self)
-        self.cpp_info.defines = ["QUILL_FMT_EXTERNAL"]
+        self.cpp_info.defines = ["QUILL_FMT_EXTERNAL"] + self._abi_defines
 
         if self.settings.os == "Linux":
             self.cpp_info.system_libs.append("pthread")
@@ -0,0 +1,38 @@
+#include <benchmark/benchmark.h>
+#include "quill/Quill.h"
+
+#include <cstdint>
+#include <string>
+
+// Latency of the hot (logging) thread, the backend thread formats and writes asynchronously
+
+static quill::Logger* logger() {
+    static quill::Logger* const logger = [] {
+        quill::start();
+        return quill::create_logger("perf_package", quill::file_handler("perf_package.log", "w"));
+    }();
+    return logger;
+}
+
+static void BM_log_info(benchmark::State& state) {
+    quill::Logger* const perf_logger = logger();
+    uint64_t i = 0;
+    for (auto _ : state) {
+        LOG_INFO(perf_logger, "Benchmark message {} with a double {}", i, i * 0.5);
+        ++i;
+    }
+    state.SetItemsProcessed(static_cast<int64_t>(state.iterations()));
+}
+BENCHMARK(BM_log_info);
+
+static void BM_log_info_string(benchmark::State& state) {
+    quill::Logger* const perf_logger = logger();
+    const std::string value = "a string argument copied to the queue";
+    for (auto _ : state) {
+        LOG_INFO(perf_logger, "Benchmark message with a string {}", value);
+    }
+    state.SetItemsProcessed(static_cast<int64_t>(state.iterations()));
+}
+BENCHMARK(BM_log_info_string);
+
+BENCHMARK_MAIN();
@@ -1,5 +1,36 @@
 #include "quill/Quill.h"
 
+#include <algorithm>
+#include <chrono>
+#include <cstdint>
+#include <iostream>
+#include <vector>
+
+// Per-call latency of the hot (logging) thread, the backend thread formats and writes asynchronously
+static void benchmark_hot_path(quill::Logger *logger)
+{
+    const size_t iterations = 100000;
+    std::vector<int64_t> latencies;
+    latencies.reserve(iterations);
+
+    for (size_t i = 0; i < iterations; ++i)
+    {
+        const auto start = std::chrono::steady_clock::now();
+        LOG_INFO(logger, "Benchmark message {} with a double {}", i, i * 0.5);
+        const auto end = std::chrono::steady_clock::now();
+        latencies.push_back(std::chrono::duration_cast<std::chrono::nanoseconds>(end - start).count());
+    }
+
+    std::sort(latencies.begin(), latencies.end());
+    std::cout << "LOG_INFO latency over " << iterations << " calls (ns):";
+    for (const double percentile : {50., 90., 99., 99.9})
+    {
+        const size_t index = static_cast<size_t>(percentile / 100. * (latencies.size() - 1));
+        std::cout << " p" << percentile << "=" << latencies[index];
+    }
+    std::cout << " max=" << latencies.back() << std::endl;
+}
+
 int main()
 {
     quill::start();
@@ -8,4 +39,6 @@ int main()
 
     LOG_INFO(my_logger, "Hello from {}", "Quill");
     LOG_CRITICAL(my_logger, "This is a conan example {}", 1234);
+
+    benchmark_hot_path(my_logger);
 }
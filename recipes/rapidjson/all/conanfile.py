@@ -1,4 +1,5 @@
 from conans import ConanFile, tools
+from conans.errors import ConanInvalidConfiguration
 import os
 import glob
 
@@ -10,12 +11,49 @@ class RapidjsonConan(ConanFile):
     url = "https://github.com/conan-io/conan-center-index"
     homepage = "http://rapidjson.org"
     license = "MIT"
+    settings = "os", "compiler", "arch"
+    options = {"simd": ["auto", "none", "sse2", "sse42", "neon"],
+               "optimize_48bit_pointers": [True, False],
+               "has_stdstring": [True, False],
+               "allocator_chunk_capacity": "ANY"}
+    default_options = {"simd": "auto",
+                       "optimize_48bit_pointers": True,
+                       "has_stdstring": False,
+                       "allocator_chunk_capacity": "default"}
     no_copy_source = True
 
     @property
     def _source_subfolder(self):
         return "source_subfolder"
 
+    @property
+    def _is_64bit_pointer_arch(self):
+        return str(self.settings.arch) in ["x86_64", "armv8"]
+
+    def config_options(self):
+        # upstream only compresses pointers on 64-bit architectures with a 48-bit address space
+        if not self._is_64bit_pointer_arch:
+            del self.options.optimize_48bit_pointers
+        # RAPIDJSON_ALLOCATOR_DEFAULT_CHUNK_CAPACITY is not in the 1.1.0 release
+        if self.version == "1.1.0":
+            del self.options.allocator_chunk_capacity
+
+    def configure(self):
+        arch = str(self.settings.arch)
+        if self.options.simd in ["sse2", "sse42"] and arch not in ["x86", "x86_64"]:
+            raise ConanInvalidConfiguration("simd={} requires an x86 architecture".format(self.options.simd))
+        if self.options.simd == "neon" and not arch.startswith("arm"):
+            raise ConanInvalidConfiguration("simd=neon requires an ARM architecture")
+        chunk_capacity = self.options.get_safe("allocator_chunk_capacity")
+        if chunk_capacity and chunk_capacity != "default" and not str(chunk_capacity).isdigit():
+            raise ConanInvalidConfiguration("allocator_chunk_capacity must be a number of bytes or 'default'")
+
+    @property
+    def _simd(self):
+        if self.options.simd != "auto":
+            return str(self.options.simd)
+        return {"x86": "sse2", "x86_64": "sse2", "armv8": "neon"}.get(str(self.settings.arch), "none")
+
     def source(self):
         tools.get(**self.conan_data["sources"][self.version])
         extracted_dir = glob.glob(self.name + "-*/")[0]
@@ -32,3 +70,23 @@ class RapidjsonConan(ConanFile):
     def package_info(self):
         self.cpp_info.names["cmake_find_package"] = "RapidJSON"
         self.cpp_info.names["cmake_find_package_multi"] = "RapidJSON"
+        # vectorized whitespace skipping
+        simd = self._simd
+        if simd == "sse2":
+            self.cpp_info.defines.append("RAPIDJSON_SSE2")
+            if self.settings.compiler != "Visual Studio" and self.settings.arch == "x86":
+                self.cpp_info.cxxflags.append("-msse2")
+        elif simd == "sse42":
+            self.cpp_info.defines.append("RAPIDJSON_SSE42")
+            if self.settings.compiler != "Visual Studio":
+                self.cpp_info.cxxflags.append("-msse4.2")
+        elif simd == "neon":
+            self.cpp_info.defines.append("RAPIDJSON_NEON")
+        if self._is_64bit_pointer_arch:
+            self.cpp_info.defines.append("RAPIDJSON_48BITPOINTER_OPTIMIZATION={}".format(
+                1 if self.options.get_safe("optimize_48bit_pointers") else 0))
+        if self.options.has_stdstring:
+            self.cpp_info.defines.append("RAPIDJSON_HAS_STDSTRING=1")
+        chunk_capacity = self.options.get_safe("allocator_chunk_capacity")
+        if chunk_capacity and chunk_capacity != "default":
+            self.cpp_info.defines.append("RAPIDJSON_ALLOCATOR_DEFAULT_CHUNK_CAPACITY={}".format(chunk_capacity))
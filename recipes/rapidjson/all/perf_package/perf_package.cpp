@@ -0,0 +1,49 @@
+#include <benchmark/benchmark.h>
+#include <rapidjson/document.h>
+#include <rapidjson/stringbuffer.h>
+#include <rapidjson/writer.h>
+#include "cci_perf.h"
+
+#include <cstdint>
+#include <string>
+
+static const std::string document = cci_perf::make_json_document(10000);
+
+static void BM_parse(benchmark::State& state) {
+    for (auto _ : state) {
+        rapidjson::Document parsed;
+        parsed.Parse(document.c_str(), document.size());
+        benchmark::DoNotOptimize(parsed.HasParseError());
+    }
+    state.SetBytesProcessed(static_cast<int64_t>(state.iterations()) * document.size());
+}
+BENCHMARK(BM_parse);
+
+static void BM_parse_insitu(benchmark::State& state) {
+    std::string buffer;
+    for (auto _ : state) {
+        state.PauseTiming();
+        buffer = document;
+        state.ResumeTiming();
+        rapidjson::Document parsed;
+        parsed.ParseInsitu(&buffer[0]);
+        benchmark::DoNotOptimize(parsed.HasParseError());
+    }
+    state.SetBytesProcessed(static_cast<int64_t>(state.iterations()) * document.size());
+}
+BENCHMARK(BM_parse_insitu);
+
+static void BM_serialize(benchmark::State& state) {
+    rapidjson::Document parsed;
+    parsed.Parse(document.c_str(), document.size());
+    for (auto _ : state) {
+        rapidjson::StringBuffer buffer;
+        rapidjson::Writer<rapidjson::StringBuffer> writer(buffer);
+        parsed.Accept(writer);
+        benchmark::DoNotOptimize(buffer.GetSize());
+    }
+    state.SetBytesProcessed(static_cast<int64_t>(state.iterations()) * document.size());
+}
+BENCHMARK(BM_serialize);
+
+BENCHMARK_MAIN();
@@ -2,10 +2,53 @@
 #include "rapidjson/writer.h"
 #include "rapidjson/stringbuffer.h"
 
+#include <chrono>
 #include <iostream>
+#include <string>
 
 using namespace rapidjson;
 
+static std::string make_document(size_t records) {
+    // indented, so that whitespace skipping is part of the measurement
+    std::string document = "[\n";
+    for (size_t i = 0; i < records; ++i) {
+        if (i)
+            document += ",\n";
+        document += "    {\n"
+                    "        \"id\": " + std::to_string(i) + ",\n"
+                    "        \"name\": \"package_" + std::to_string(i % 997) + "\",\n"
+                    "        \"score\": " + std::to_string(i * 0.25) + ",\n"
+                    "        \"tags\": [ \"conan\", \"center\", \"index\" ]\n"
+                    "    }";
+    }
+    document += "\n]\n";
+    return document;
+}
+
+static void benchmark(const std::string& json) {
+    const int iterations = 20;
+    size_t serialized = 0;
+
+    std::chrono::duration<double> parse_time(0), serialize_time(0);
+    for (int i = 0; i < iterations; ++i) {
+        const auto start = std::chrono::steady_clock::now();
+        Document d;
+        d.Parse(json.c_str(), json.size());
+        const auto parsed = std::chrono::steady_clock::now();
+        StringBuffer buffer;
+        Writer<StringBuffer> writer(buffer);
+        d.Accept(writer);
+        serialized = buffer.GetSize();
+        parse_time += parsed - start;
+        serialize_time += std::chrono::steady_clock::now() - parsed;
+    }
+
+    const double megabytes = static_cast<double>(json.size()) * iterations / (1024. * 1024.);
+    std::cout << "document: " << json.size() << " bytes, serialized: " << serialized << " bytes" << std::endl;
+    std::cout << "parse: " << megabytes / parse_time.count() << " MB/s" << std::endl;
+    std::cout << "serialize: " << megabytes / serialize_time.count() << " MB/s" << std::endl;
+}
+
 int main() {
     const char* json = "{\"working\":\"false\"}";
     Document d;
@@ -19,5 +62,16 @@ int main() {
     d.Accept(writer);
 
     std::cout << buffer.GetString() << std::endl;
+
+#if defined(RAPIDJSON_SSE42)
+    std::cout << "SIMD: SSE4.2" << std::endl;
+#elif defined(RAPIDJSON_SSE2)
+    std::cout << "SIMD: SSE2" << std::endl;
+#elif defined(RAPIDJSON_NEON)
+    std::cout << "SIMD: NEON" << std::endl;
+#else
+    std::cout << "SIMD: none" << std::endl;
+#endif
+    benchmark(make_document(20000));
     return 0;
 }
@@ -13,6 +13,7 @@ class SimdjsonConan(ConanFile):
     license = "Apache-2.0"
     exports_sources = ["CMakeLists.txt"]
     generators = "cmake"
+    python_requires = "cci-microarch/1.0"
     settings = "os", "arch", "compiler", "build_type"
     options = {"shared": [True, False],
                "fPIC": [True, False],
@@ -33,7 +34,11 @@ class SimdjsonConan(ConanFile):
         compiler, version = self.settings.compiler, Version(self.settings.compiler.version)
         return any(compiler == sc[0] and version >= sc[1] for sc in supported_compilers)
 
+    def init(self):
+        self.python_requires["cci-microarch"].module.init(self)
+
     def configure(self):
+        self.python_requires["cci-microarch"].module.configure(self, {"avx": "avx2"})
         if self.settings.compiler == "Visual Studio":
             self.options.remove("fPIC")
         if self.settings.compiler.cppstd and \
@@ -73,6 +78,7 @@ class SimdjsonConan(ConanFile):
         cmake.definitions['SIMDJSON_DISABLE_AVX'] = not self.options.avx
         cmake.definitions['SIMDJSON_SANITIZE'] = False
         cmake.definitions['ENABLE_FUZZING'] = False
+        self.python_requires["cci-microarch"].module.apply_cmake(self, cmake)
         cmake.configure()
         return cmake
 
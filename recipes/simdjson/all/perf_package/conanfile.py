@@ -0,0 +1,16 @@
+from conans import ConanFile
+
+
+class PerfPackageConan(ConanFile):
+    settings = "os", "compiler", "build_type", "arch"
+    generators = "cmake"
+    python_requires = "cci-perf/1.0"
+
+    def requirements(self):
+        self.python_requires["cci-perf"].module.requirements(self)
+
+    def build(self):
+        self.python_requires["cci-perf"].module.build(self)
+
+    def test(self):
+        self.python_requires["cci-perf"].module.run(self, "simdjson")
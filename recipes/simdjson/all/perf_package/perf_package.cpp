@@ -0,0 +1,39 @@
+#include <benchmark/benchmark.h>
+#include <simdjson/jsonparser.h>
+#include "cci_perf.h"
+
+#include <cstdint>
+#include <string>
+
+static const std::string document = cci_perf::make_json_document(10000);
+
+static void BM_parse(benchmark::State& state) {
+    simdjson::ParsedJson pj;
+    pj.allocate_capacity(document.size());
+    for (auto _ : state) {
+        const int result = simdjson::json_parse(document, pj);
+        benchmark::DoNotOptimize(result);
+    }
+    state.SetBytesProcessed(static_cast<int64_t>(state.iterations()) * document.size());
+}
+BENCHMARK(BM_parse);
+
+static void BM_parse_and_iterate(benchmark::State& state) {
+    simdjson::ParsedJson pj;
+    pj.allocate_capacity(document.size());
+    for (auto _ : state) {
+        simdjson::json_parse(document, pj);
+        simdjson::ParsedJson::Iterator it(pj);
+        size_t records = 0;
+        if (it.down()) {
+            do {
+                ++records;
+            } while (it.next());
+        }
+        benchmark::DoNotOptimize(records);
+    }
+    state.SetBytesProcessed(static_cast<int64_t>(state.iterations()) * document.size());
+}
+BENCHMARK(BM_parse_and_iterate);
+
+BENCHMARK_MAIN();
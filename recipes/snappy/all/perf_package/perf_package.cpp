@@ -0,0 +1,32 @@
+#include <benchmark/benchmark.h>
+#include <snappy.h>
+#include "cci_perf.h"
+
+#include <cstdint>
+#include <string>
+
+static const std::string corpus = cci_perf::make_corpus(1 << 20);
+
+static void BM_compress(benchmark::State& state) {
+    std::string output;
+    for (auto _ : state) {
+        const size_t size = snappy::Compress(corpus.data(), corpus.size(), &output);
+        benchmark::DoNotOptimize(size);
+    }
+    state.SetBytesProcessed(static_cast<int64_t>(state.iterations()) * corpus.size());
+}
+BENCHMARK(BM_compress);
+
+static void BM_decompress(benchmark::State& state) {
+    std::string compressed;
+    snappy::Compress(corpus.data(), corpus.size(), &compressed);
+    std::string output;
+    for (auto _ : state) {
+        const bool ok = snappy::Uncompress(compressed.data(), compressed.size(), &output);
+        benchmark::DoNotOptimize(ok);
+    }
+    state.SetBytesProcessed(static_cast<int64_t>(state.iterations()) * corpus.size());
+}
+BENCHMARK(BM_decompress);
+
+BENCHMARK_MAIN();
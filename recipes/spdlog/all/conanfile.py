@@ -19,13 +19,25 @@ class SpdlogConan(ConanFile):
                "header_only": [True, False],
                "wchar_support": [True, False],
                "wchar_filenames": [True, False],
-               "no_exceptions": [True, False]}
+               "no_exceptions": [True, False],
+               "active_level": ["default", "trace", "debug", "info", "warn", "error", "critical", "off"],
+               "no_thread_id": [True, False],
+               "no_datetime": [True, False],
+               "no_atomic_levels": [True, False],
+               "async_queue_size": "ANY",
+               "bench": [True, False]}
     default_options = {"shared": False,
                        "fPIC": True,
                        "header_only": False,
                        "wchar_support": False,
                        "wchar_filenames": False,
-                       "no_exceptions": False}
+                       "no_exceptions": False,
+                       "active_level": "default",
+                       "no_thread_id": False,
+                       "no_datetime": False,
+                       "no_atomic_levels": False,
+                       "async_queue_size": "8192",
+                       "bench": False}
 
     _cmake = None
 
@@ -46,6 +58,8 @@ class SpdlogConan(ConanFile):
         if self.settings.os != "Windows" and \
            (self.options.wchar_support or self.options.wchar_filenames):
             raise ConanInvalidConfiguration("wchar is not yet supported under windows")
+        if not str(self.options.async_queue_size).isdigit():
+            raise ConanInvalidConfiguration("async_queue_size must be a number of messages")
 
     def requirements(self):
         if Version(self.version) >= "1.5.0":
@@ -53,6 +67,10 @@ class SpdlogConan(ConanFile):
         else:
             self.requires("fmt/6.0.0")
 
+    def build_requirements(self):
+        if self.options.bench:
+            self.build_requires("benchmark/1.5.0")
+
     def source(self):
         tools.get(**self.conan_data["sources"][self.version])
         extracted_dir = self.name + "-" + self.version
@@ -66,7 +84,7 @@ class SpdlogConan(ConanFile):
         self._cmake.definitions["SPDLOG_BUILD_EXAMPLE_HO"] = False
         self._cmake.definitions["SPDLOG_BUILD_TESTS"] = False
         self._cmake.definitions["SPDLOG_BUILD_TESTS_HO"] = False
-        self._cmake.definitions["SPDLOG_BUILD_BENCH"] = False
+        self._cmake.definitions["SPDLOG_BUILD_BENCH"] = self.options.bench
         self._cmake.definitions["SPDLOG_FMT_EXTERNAL"] = True
         self._cmake.definitions["SPDLOG_BUILD_SHARED"] = not self.options.header_only and self.options.shared
         self._cmake.definitions["SPDLOG_WCHAR_SUPPORT"] = self.options.wchar_support
@@ -75,9 +93,33 @@ class SpdlogConan(ConanFile):
         self._cmake.definitions["SPDLOG_NO_EXCEPTIONS"] = self.options.no_exceptions
         if self.settings.os in ("iOS", "tvOS", "watchOS"):
             self._cmake.definitions["SPDLOG_NO_TLS"] = True
+        # the compiled library must see the same log_msg and logger layout as the consumers
+        self._cmake.definitions["CONAN_SPDLOG_DEFINITIONS"] = ";".join("-D" + define for define in self._abi_defines)
         self._cmake.configure()
         return self._cmake
 
+    @property
+    def _abi_defines(self):
+        defines = []
+        if self.options.no_thread_id:
+            defines.append("SPDLOG_NO_THREAD_ID")
+        if self.options.no_datetime:
+            defines.append("SPDLOG_NO_DATETIME")
+        if self.options.no_atomic_levels:
+            defines.append("SPDLOG_NO_ATOMIC_LEVELS")
+        return defines
+
+    def _patch_async_queue_size(self):
+        if str(self.options.async_queue_size) != "8192":
+            tools.replace_in_file(os.path.join(self._source_subfolder, "include", "spdlog", "async.h"),
+                                  "default_async_q_size = 8192;",
+                                  "default_async_q_size = {};".format(self.options.async_queue_size))
+
+    def _patch_bench(self):
+        # google benchmark comes from conan, through cmake_find_package
+        tools.replace_in_file(os.path.join(self._source_subfolder, "bench", "CMakeLists.txt"),
+                              "find_package(benchmark CONFIG", "find_package(benchmark", strict=False)
+
     def _disable_werror(self):
         tools.replace_in_file(os.path.join(self._source_subfolder, "cmake", "utils.cmake"), "/WX", "")
 
@@ -85,6 +127,9 @@ class SpdlogConan(ConanFile):
         self._disable_werror()
         if self.options.header_only:
             tools.patch(**self.conan_data["patches"][self.version])
+        self._patch_async_queue_size()
+        if self.options.bench:
+            self._patch_bench()
         cmake = self._configure_cmake()
         cmake.build()
 
@@ -95,10 +140,18 @@ class SpdlogConan(ConanFile):
         tools.rmdir(os.path.join(self.package_folder, "lib", "cmake"))
         tools.rmdir(os.path.join(self.package_folder, "lib", "pkgconfig"))
         tools.rmdir(os.path.join(self.package_folder, "lib", "spdlog", "cmake"))
+        if self.options.bench:
+            # upstream does not install the benchmarks
+            for bench in ["bench", "async_bench", "latency", "formatter-bench"]:
+                for executable in [bench, bench + ".exe"]:
+                    self.copy(executable, dst="bin", src="bin", keep_path=False)
 
     def package_id(self):
-        if self.options.header_only:
+        # async.h is patched and the benchmarks are built in header-only mode too, such packages keep their full ID
+        if self.options.header_only and str(self.options.async_queue_size) == "8192" and not self.options.bench:
             self.info.header_only()
+        # only changes which logging macros the consumers compile in
+        del self.info.options.active_level
 
     def package_info(self):
         if self.options.header_only:
@@ -112,5 +165,12 @@ class SpdlogConan(ConanFile):
             self.cpp_info.defines.append("SPDLOG_WCHAR_FILENAMES")
         if self.options.no_exceptions:
             self.cpp_info.defines.append("SPDLOG_NO_EXCEPTIONS")
+        if self.options.active_level != "default":
+            self.cpp_info.defines.append("SPDLOG_ACTIVE_LEVEL=SPDLOG_LEVEL_{}".format(str(self.options.active_level).upper()))
+        self.cpp_info.defines.extend(self._abi_defines)
+        if self.options.bench:
+            bin_path = os.path.join(self.package_folder, "bin")
+            self.output.info("Appending PATH environment variable: {}".format(bin_path))
+            self.env_info.PATH.append(bin_path)
         if self.settings.os == "Linux":
             self.cpp_info.system_libs = ["pthread"]
@@ -12,11 +12,20 @@ class TesseractConan(ConanFile):
     homepage = "https://github.com/tesseract-ocr/tesseract"
     exports_sources = ["CMakeLists.txt"]
     generators = "cmake", "cmake_find_package"
+    python_requires = "cci-microarch/1.0"
     settings = "os", "arch", "compiler", "build_type"
     options = {"shared": [True, False],
                "fPIC": [True, False],
-               "with_training": [True, False]}
-    default_options = {'shared': False, 'fPIC': True, 'with_training': False}
+               "with_training": [True, False],
+               "openmp": [True, False],
+               "graphics": [True, False],
+               "with_sse41": [True, False],
+               "with_avx": [True, False],
+               "with_avx2": [True, False],
+               "with_fma": [True, False]}
+    default_options = {'shared': False, 'fPIC': True, 'with_training': False,
+                       'openmp': False, 'graphics': True,
+                       'with_sse41': True, 'with_avx': True, 'with_avx2': True, 'with_fma': True}
     _source_subfolder = "source_subfolder"
     _build_subfolder = "build_subfolder"
     _cmake = None
@@ -28,9 +37,20 @@ class TesseractConan(ConanFile):
         extracted_dir = self.name + "-" + self.version
         os.rename(extracted_dir, self._source_subfolder)
 
+    @property
+    def _simd_options(self):
+        # dot product kernels, selected at runtime among the ones that are built
+        return {"with_sse41": "HAVE_SSE4_1", "with_avx": "HAVE_AVX", "with_avx2": "HAVE_AVX2", "with_fma": "HAVE_FMA"}
+
+    def init(self):
+        self.python_requires["cci-microarch"].module.init(self)
+
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        if self.settings.arch not in ["x86", "x86_64"]:
+            for option in self._simd_options:
+                delattr(self.options, option)
         if self.options.with_training:
             # do not enforce failure and allow user to build with system cairo, pango, fontconfig
             self.output.warn("*** Build with training is not yet supported, continue on your own")
@@ -41,6 +61,8 @@ class TesseractConan(ConanFile):
         if (self.settings.compiler == "gcc" and compiler_version < "5") or \
                 (self.settings.compiler == "clang" and compiler_version < "5"):
             raise ConanInvalidConfiguration("tesseract/{} requires Clang >= 5".format(self.version))
+        self.python_requires["cci-microarch"].module.configure(self, {"with_sse41": "sse4.1", "with_avx": "avx",
+                                                                      "with_avx2": "avx2", "with_fma": "fma"})
 
     def _configure_cmake(self):
         if self._cmake:
@@ -48,6 +70,15 @@ class TesseractConan(ConanFile):
         cmake = self._cmake = CMake(self)
         cmake.definitions['BUILD_TRAINING_TOOLS'] = self.options.with_training
         cmake.definitions["STATIC"] = not self.options.shared
+        # OpenMP parallelizes the recognition of a single page; upstream recommends it off
+        # for throughput when many single-threaded instances run concurrently
+        cmake.definitions["OPENMP_BUILD"] = self.options.openmp
+        cmake.definitions["GRAPHICS_DISABLED"] = not self.options.graphics
+        # Predefined check results skip the compiler flag detection of the kernels
+        for option, variable in self._simd_options.items():
+            if option in self.options and not self.options.get_safe(option):
+                cmake.definitions[variable] = False
+        self.python_requires["cci-microarch"].module.apply_cmake(self, cmake)
         # Use CMake-based package build and dependency detection, not the pkg-config, cppan or SW
         cmake.definitions['CPPAN_BUILD'] = False
         cmake.definitions['SW_BUILD'] = False
@@ -100,5 +131,8 @@ class TesseractConan(ConanFile):
         elif self.settings.compiler == "Visual Studio":
             if not self.options.shared:
                 self.cpp_info.system_libs = ["ws2_32"]
+        if self.options.openmp and not self.options.shared and self.settings.compiler in ["gcc", "clang"]:
+            self.cpp_info.sharedlinkflags.append("-fopenmp")
+            self.cpp_info.exelinkflags.append("-fopenmp")
         self.cpp_info.names["cmake_find_package"] = "Tesseract"
         self.cpp_info.names["cmake_find_package_multi"] = "Tesseract"
@@ -0,0 +1,109 @@
+// OCR throughput: recognizes a generated page in a loop and reports pages/s.
+// Usage: benchmark <tessdata directory> [pages]
+
+#include <chrono>
+#include <cstdio>
+#include <cstdlib>
+#include <random>
+
+#include <leptonica/allheaders.h>
+#include <tesseract/baseapi.h>
+
+namespace {
+
+// 5x7 glyphs of the uppercase letters, one byte per row
+const unsigned char kFont[26][7] = {
+    {0x0E, 0x11, 0x11, 0x1F, 0x11, 0x11, 0x11}, {0x1E, 0x11, 0x11, 0x1E, 0x11, 0x11, 0x1E},
+    {0x0E, 0x11, 0x10, 0x10, 0x10, 0x11, 0x0E}, {0x1C, 0x12, 0x11, 0x11, 0x11, 0x12, 0x1C},
+    {0x1F, 0x10, 0x10, 0x1E, 0x10, 0x10, 0x1F}, {0x1F, 0x10, 0x10, 0x1E, 0x10, 0x10, 0x10},
+    {0x0E, 0x11, 0x10, 0x17, 0x11, 0x11, 0x0F}, {0x11, 0x11, 0x11, 0x1F, 0x11, 0x11, 0x11},
+    {0x0E, 0x04, 0x04, 0x04, 0x04, 0x04, 0x0E}, {0x07, 0x02, 0x02, 0x02, 0x02, 0x12, 0x0C},
+    {0x11, 0x12, 0x14, 0x18, 0x14, 0x12, 0x11}, {0x10, 0x10, 0x10, 0x10, 0x10, 0x10, 0x1F},
+    {0x11, 0x1B, 0x15, 0x15, 0x11, 0x11, 0x11}, {0x11, 0x11, 0x19, 0x15, 0x13, 0x11, 0x11},
+    {0x0E, 0x11, 0x11, 0x11, 0x11, 0x11, 0x0E}, {0x1E, 0x11, 0x11, 0x1E, 0x10, 0x10, 0x10},
+    {0x0E, 0x11, 0x11, 0x11, 0x15, 0x12, 0x0D}, {0x1E, 0x11, 0x11, 0x1E, 0x14, 0x12, 0x11},
+    {0x0F, 0x10, 0x10, 0x0E, 0x01, 0x01, 0x1E}, {0x1F, 0x04, 0x04, 0x04, 0x04, 0x04, 0x04},
+    {0x11, 0x11, 0x11, 0x11, 0x11, 0x11, 0x0E}, {0x11, 0x11, 0x11, 0x11, 0x11, 0x0A, 0x04},
+    {0x11, 0x11, 0x11, 0x15, 0x15, 0x15, 0x0A}, {0x11, 0x11, 0x0A, 0x04, 0x0A, 0x11, 0x11},
+    {0x11, 0x11, 0x11, 0x0A, 0x04, 0x04, 0x04}, {0x1F, 0x01, 0x02, 0x04, 0x08, 0x10, 0x1F},
+};
+
+const int kScale = 4;
+const int kAdvance = 6 * kScale;
+const int kLineHeight = 12 * kScale;
+const int kMargin = 100;
+
+void DrawGlyph(PIX* pix, int x, int y, int letter) {
+  for (int row = 0; row < 7; ++row) {
+    for (int col = 0; col < 5; ++col) {
+      if (!(kFont[letter][row] & (0x10 >> col))) {
+        continue;
+      }
+      for (int dy = 0; dy < kScale; ++dy) {
+        for (int dx = 0; dx < kScale; ++dx) {
+          pixSetPixel(pix, x + col * kScale + dx, y + row * kScale + dy, 1);
+        }
+      }
+    }
+  }
+}
+
+// A4 page at 300 dpi filled with lines of random words
+PIX* MakePage() {
+  const int width = 2480, height = 3508;
+  PIX* pix = pixCreate(width, height, 1);
+  pixSetResolution(pix, 300, 300);
+  std::mt19937 rng(42);
+  std::uniform_int_distribution<int> letter(0, 25), word_length(2, 9);
+  for (int y = kMargin; y + kLineHeight < height - kMargin; y += kLineHeight) {
+    int x = kMargin;
+    while (true) {
+      const int length = word_length(rng);
+      if (x + length * kAdvance > width - kMargin) {
+        break;
+      }
+      for (int i = 0; i < length; ++i, x += kAdvance) {
+        DrawGlyph(pix, x, y, letter(rng));
+      }
+      x += kAdvance;
+    }
+  }
+  return pix;
+}
+
+}  // namespace
+
+int main(int argc, char** argv) {
+  if (argc < 2) {
+    std::fprintf(stderr, "Usage: %s <tessdata directory> [pages]\n", argv[0]);
+    return 1;
+  }
+  const int pages = argc > 2 ? std::atoi(argv[2]) : 10;
+
+  tesseract::TessBaseAPI api;
+  if (api.Init(argv[1], "eng") != 0) {
+    std::fprintf(stderr, "Could not initialize tesseract with %s/eng.traineddata\n", argv[1]);
+    return 1;
+  }
+  api.SetPageSegMode(tesseract::PSM_AUTO);
+
+  PIX* page = MakePage();
+  size_t characters = 0;
+  const auto start = std::chrono::steady_clock::now();
+  for (int i = 0; i < pages; ++i) {
+    api.SetImage(page);
+    char* text = api.GetUTF8Text();
+    for (const char* c = text; *c; ++c) {
+      characters += *c != ' ' && *c != '\n';
+    }
+    delete[] text;
+    api.Clear();
+  }
+  const std::chrono::duration<double> elapsed = std::chrono::steady_clock::now() - start;
+  std::printf("OCR: %d pages in %.2f s, %.2f pages/s (%zu characters per page)\n", pages, elapsed.count(),
+              pages / elapsed.count(), characters / pages);
+
+  pixDestroy(&page);
+  api.End();
+  return 0;
+}
@@ -15,3 +15,11 @@ class TestPackageConan(ConanFile):
         if not tools.cross_building(self.settings):
             bin_path = os.path.join("bin", "test_package")
             self.run(bin_path, run_environment=True)
+            # The benchmark needs eng.traineddata, e.g. from https://github.com/tesseract-ocr/tessdata_fast
+            tessdata = tools.get_env("TESSDATA_PREFIX")
+            if tessdata:
+                bin_path = os.path.join("bin", "benchmark")
+                self.run("{} {} {}".format(bin_path, tessdata, tools.get_env("TESSERACT_BENCHMARK_PAGES", 10)),
+                         run_environment=True)
+            else:
+                self.output.warn("TESSDATA_PREFIX is not set, skipping the OCR benchmark")
@@ -0,0 +1,43 @@
+#include <benchmark/benchmark.h>
+#include <yaml-cpp/yaml.h>
+
+#include <cstdint>
+#include <string>
+
+static std::string make_document(size_t records) {
+    std::string document;
+    uint32_t seed = 42;
+    for (size_t i = 0; i < records; ++i) {
+        seed = seed * 1664525u + 1013904223u;
+        document += "- id: " + std::to_string(i) + "\n"
+                    "  name: package_" + std::to_string(seed % 1000) + "\n"
+                    "  score: " + std::to_string((seed >> 8) % 100000 / 100.) + "\n"
+                    "  shared: " + ((seed & 1) ? "true" : "false") + "\n"
+                    "  tags: [conan, center, index]\n";
+    }
+    return document;
+}
+
+static const std::string document = make_document(2000);
+
+static void BM_parse(benchmark::State& state) {
+    for (auto _ : state) {
+        YAML::Node parsed = YAML::Load(document);
+        benchmark::DoNotOptimize(parsed.size());
+    }
+    state.SetBytesProcessed(static_cast<int64_t>(state.iterations()) * document.size());
+}
+BENCHMARK(BM_parse);
+
+static void BM_emit(benchmark::State& state) {
+    const YAML::Node parsed = YAML::Load(document);
+    for (auto _ : state) {
+        YAML::Emitter emitter;
+        emitter << parsed;
+        benchmark::DoNotOptimize(emitter.size());
+    }
+    state.SetBytesProcessed(static_cast<int64_t>(state.iterations()) * document.size());
+}
+BENCHMARK(BM_emit);
+
+BENCHMARK_MAIN();
@@ -1,5 +1,6 @@
 import os
 from conans import ConanFile, tools, CMake
+from conans.errors import ConanException, ConanInvalidConfiguration
 
 
 class ZeroMQConan(ConanFile):
@@ -15,11 +16,17 @@ class ZeroMQConan(ConanFile):
         "shared": [True, False],
         "fPIC": [True, False],
         "encryption": [None, "libsodium", "tweetnacl"],
+        "poller": [None, "epoll", "kqueue", "poll", "select"],
+        "enable_drafts": [True, False],
+        "perf_tools": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "encryption": "libsodium",
+        "poller": None,
+        "enable_drafts": False,
+        "perf_tools": False,
     }
     generators = "cmake", "cmake_find_package"
 
@@ -40,6 +47,13 @@ class ZeroMQConan(ConanFile):
     def configure(self):
         if self.options.shared:
             del self.options.fPIC
+        if self.options.poller == "epoll" and self.settings.os not in ["Linux", "Android"]:
+            raise ConanInvalidConfiguration("epoll poller is only available on Linux and Android")
+        if self.options.poller == "kqueue" and self.settings.os not in ["Macos", "iOS", "FreeBSD"]:
+            raise ConanInvalidConfiguration("kqueue poller is only available on Apple platforms and FreeBSD")
+        # libzmq's CMakeLists.txt skips the perf tools when CMAKE_BUILD_TYPE is Debug
+        if self.options.perf_tools and self.settings.build_type == "Debug":
+            raise ConanInvalidConfiguration("zeromq perf_tools are not built in Debug")
 
     def requirements(self):
         if self.options.encryption == "libsodium":
@@ -56,7 +70,10 @@ class ZeroMQConan(ConanFile):
         self._cmake.definitions["ENABLE_CURVE"] = bool(self.options.encryption)
         self._cmake.definitions["WITH_LIBSODIUM"] = self.options.encryption == "libsodium"
         self._cmake.definitions["ZMQ_BUILD_TESTS"] = False
-        self._cmake.definitions["WITH_PERF_TOOL"] = False
+        self._cmake.definitions["WITH_PERF_TOOL"] = self.options.perf_tools
+        self._cmake.definitions["ENABLE_DRAFTS"] = self.options.enable_drafts
+        if self.options.poller:
+            self._cmake.definitions["POLLER"] = self.options.poller
         self._cmake.definitions["BUILD_SHARED"] = self.options.shared
         self._cmake.definitions["BUILD_STATIC"] = not self.options.shared
         self._cmake.definitions["BUILD_TESTS"] = False
@@ -66,6 +83,10 @@ class ZeroMQConan(ConanFile):
         self._cmake.configure(build_folder=self._build_subfolder)
         return self._cmake
 
+    @property
+    def _perf_tools(self):
+        return ["local_lat", "remote_lat", "local_thr", "remote_thr", "inproc_lat", "inproc_thr"]
+
     def _patch_sources(self):
         for patch in self.conan_data["patches"][self.version]:
             tools.patch(**patch)
@@ -96,6 +117,16 @@ class ZeroMQConan(ConanFile):
         tools.rmdir(os.path.join(self.package_folder, "lib", "pkgconfig"))
         tools.rmdir(os.path.join(self.package_folder, "share"))
         tools.rmdir(os.path.join(self.package_folder, "CMake"))
+        if self.options.perf_tools:
+            # not every generator installs the PerfTools component
+            for tool in self._perf_tools:
+                for executable in [tool, tool + ".exe"]:
+                    self.copy(executable, dst="bin", src=os.path.join(self._build_subfolder, "bin"), keep_path=False)
+            missing = [tool for tool in self._perf_tools
+                       if not any(os.path.isfile(os.path.join(self.package_folder, "bin", executable))
+                                  for executable in [tool, tool + ".exe"])]
+            if missing:
+                raise ConanException("zeromq perf tools were not built: {}".format(", ".join(missing)))
 
     def package_info(self):
         self.cpp_info.names["cmake_find_package"] = "ZeroMQ"
@@ -123,3 +154,9 @@ class ZeroMQConan(ConanFile):
             self.cpp_info.system_libs = ["pthread", "rt", "m"]
         if not self.options.shared:
             self.cpp_info.defines.append("ZMQ_STATIC")
+        if self.options.enable_drafts:
+            self.cpp_info.defines.append("ZMQ_BUILD_DRAFT_API")
+        if self.options.perf_tools:
+            bin_path = os.path.join(self.package_folder, "bin")
+            self.output.info("Appending PATH environment variable: {}".format(bin_path))
+            self.env_info.PATH.append(bin_path)
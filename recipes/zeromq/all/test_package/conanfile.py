@@ -1,5 +1,7 @@
-from conans import ConanFile, CMake, tools
+from conans import ConanFile, CMake, tools, RunEnvironment
+from conans.errors import ConanException
 import os
+import subprocess
 
 
 class TestPackageConan(ConanFile):
@@ -12,7 +14,28 @@ class TestPackageConan(ConanFile):
         cmake.configure()
         cmake.build()
 
+    def _run_perf_pair(self, local, remote, address, message_size, count):
+        args = [address, str(message_size), str(count)]
+        with tools.environment_append(RunEnvironment(self).vars):
+            server = subprocess.Popen([local] + args)
+            try:
+                self.run(" ".join([remote] + args))
+            finally:
+                server.wait()
+        if server.returncode != 0:
+            raise ConanException("{} failed with code {}".format(local, server.returncode))
+
+    def _run_perf_tools(self):
+        self.run("inproc_lat 64 10000", run_environment=True)
+        self.run("inproc_thr 64 1000000", run_environment=True)
+        self._run_perf_pair("local_lat", "remote_lat", "tcp://127.0.0.1:25555", 64, 10000)
+        self._run_perf_pair("local_thr", "remote_thr", "tcp://127.0.0.1:25556", 64, 1000000)
+        if self.settings.os != "Windows":
+            self._run_perf_pair("local_thr", "remote_thr", "ipc://zeromq-test-package-thr", 64, 1000000)
+
     def test(self):
         if not tools.cross_building(self.settings):
             bin_path = os.path.join("bin", "test_package")
             self.run(bin_path, run_environment=True)
+            if self.options["zeromq"].perf_tools:
+                self._run_perf_tools()
@@ -11,6 +11,14 @@ int main() try
     int is_server = 0;
     if (0 != zmq_setsockopt(requester, ZMQ_CURVE_SERVER, &is_server, sizeof(is_server)))
         throw std::runtime_error("zmq_setsockopt with ZMQ_CURVE_SERVER failed");
+#endif
+#if defined(ZMQ_BUILD_DRAFT_API)
+    void *poller = zmq_poller_new();
+    if (!poller)
+        throw std::runtime_error("zmq_poller_new failed");
+    if (0 != zmq_poller_add(poller, requester, NULL, ZMQ_POLLIN))
+        throw std::runtime_error("zmq_poller_add failed");
+    zmq_poller_destroy(&poller);
 #endif
     zmq_close(requester);
     zmq_ctx_destroy (context);
@@ -0,0 +1,48 @@
+#include <benchmark/benchmark.h>
+#include <zlib.h>
+#include "cci_perf.h"
+
+#include <cstdint>
+#include <string>
+#include <vector>
+
+static const std::string corpus = cci_perf::make_corpus(1 << 20);
+
+static void BM_compress(benchmark::State& state) {
+    const int level = static_cast<int>(state.range(0));
+    std::vector<Bytef> output(compressBound(static_cast<uLong>(corpus.size())));
+    for (auto _ : state) {
+        uLongf size = static_cast<uLongf>(output.size());
+        const int result = compress2(output.data(), &size, reinterpret_cast<const Bytef*>(corpus.data()),
+                                     static_cast<uLong>(corpus.size()), level);
+        benchmark::DoNotOptimize(result);
+    }
+    state.SetBytesProcessed(static_cast<int64_t>(state.iterations()) * corpus.size());
+}
+BENCHMARK(BM_compress)->Arg(1)->Arg(6)->Arg(9);
+
+static void BM_decompress(benchmark::State& state) {
+    std::vector<Bytef> compressed(compressBound(static_cast<uLong>(corpus.size())));
+    uLongf compressed_size = static_cast<uLongf>(compressed.size());
+    compress2(compressed.data(), &compressed_size, reinterpret_cast<const Bytef*>(corpus.data()),
+              static_cast<uLong>(corpus.size()), Z_DEFAULT_COMPRESSION);
+    std::vector<Bytef> output(corpus.size());
+    for (auto _ : state) {
+        uLongf size = static_cast<uLongf>(output.size());
+        const int result = uncompress(output.data(), &size, compressed.data(), compressed_size);
+        benchmark::DoNotOptimize(result);
+    }
+    state.SetBytesProcessed(static_cast<int64_t>(state.iterations()) * corpus.size());
+}
+BENCHMARK(BM_decompress);
+
+static void BM_crc32(benchmark::State& state) {
+    for (auto _ : state) {
+        const uLong crc = crc32(0L, reinterpret_cast<const Bytef*>(corpus.data()), static_cast<uInt>(corpus.size()));
+        benchmark::DoNotOptimize(crc);
+    }
+    state.SetBytesProcessed(static_cast<int64_t>(state.iterations()) * corpus.size());
+}
+BENCHMARK(BM_crc32);
+
+BENCHMARK_MAIN();
@@ -0,0 +1,47 @@
+#include <benchmark/benchmark.h>
+#include <zstd.h>
+#include "cci_perf.h"
+
+#include <cstdint>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+static const std::string corpus = cci_perf::make_corpus(1 << 20);
+
+static std::vector<char> compress(const std::string& input, int level) {
+    std::vector<char> output(ZSTD_compressBound(input.size()));
+    const size_t size = ZSTD_compress(output.data(), output.size(), input.data(), input.size(), level);
+    if (ZSTD_isError(size))
+        throw std::runtime_error(ZSTD_getErrorName(size));
+    output.resize(size);
+    return output;
+}
+
+static void BM_compress(benchmark::State& state) {
+    const int level = static_cast<int>(state.range(0));
+    ZSTD_CCtx* cctx = ZSTD_createCCtx();
+    std::vector<char> output(ZSTD_compressBound(corpus.size()));
+    for (auto _ : state) {
+        const size_t size = ZSTD_compressCCtx(cctx, output.data(), output.size(), corpus.data(), corpus.size(), level);
+        benchmark::DoNotOptimize(size);
+    }
+    ZSTD_freeCCtx(cctx);
+    state.SetBytesProcessed(static_cast<int64_t>(state.iterations()) * corpus.size());
+}
+BENCHMARK(BM_compress)->Arg(1)->Arg(3)->Arg(9);
+
+static void BM_decompress(benchmark::State& state) {
+    const std::vector<char> compressed = compress(corpus, static_cast<int>(state.range(0)));
+    ZSTD_DCtx* dctx = ZSTD_createDCtx();
+    std::string output(corpus.size(), '\0');
+    for (auto _ : state) {
+        const size_t size = ZSTD_decompressDCtx(dctx, &output[0], output.size(), compressed.data(), compressed.size());
+        benchmark::DoNotOptimize(size);
+    }
+    ZSTD_freeDCtx(dctx);
+    state.SetBytesProcessed(static_cast<int64_t>(state.iterations()) * corpus.size());
+}
+BENCHMARK(BM_decompress)->Arg(1)->Arg(9);
+
+BENCHMARK_MAIN();